@@ -0,0 +1,43 @@
+from typing import Any, Dict, List
+import asyncio
+
+
+class ControlChannel:
+    """
+    Server-push channel for lobby, status and match notifications.
+    Each subscriber gets its own bounded queue; publishing is synchronous
+    and never blocks, so it can be called from plain (non-async) code such
+    as LobbyManager or a VersionTracker listener. A slow client only loses
+    its own oldest messages.
+    """
+    QUEUE_SIZE = 32
+
+    def __init__(self):
+        self.subscribers: List[asyncio.Queue] = []
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self.subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        if queue in self.subscribers:
+            self.subscribers.remove(queue)
+
+    def has_subscribers(self) -> bool:
+        return bool(self.subscribers)
+
+    def publish(self, message_type: str, data: Dict[str, Any] = None, **extra):
+        """Queue a message for every subscriber: {"type", "data", ...extra}."""
+        if not self.subscribers:
+            return
+        message = {"type": message_type, "data": data or {}}
+        message.update(extra)
+        for queue in list(self.subscribers):
+            if queue.full():
+                # Drop the oldest message; snapshots supersede each other anyway
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+            queue.put_nowait(message)
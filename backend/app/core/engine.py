@@ -31,6 +31,33 @@ SKILL_MOVES = {
     ]
 }
 
+# Skill procs: each compiled entry gets one PROC_CHANCE roll per push
+PROC_CHANCE = 0.15
+PROC_CRIT = "crit"      # Strength skills: force multiplier, best roll wins
+PROC_DRAIN = "drain"    # Technique skills: stamina damage, stacks
+PROC_DOUBLE = "double"  # Speed skills: force multiplier, best roll wins
+
+
+def compile_procs(unlocked_skills: List[Any]) -> List[tuple]:
+    """
+    Resolve a wrestler's unlocked skills to (kind, value) proc entries once,
+    so pushes don't re-parse skill IDs. Tier 2 skills ("2" in the ID) hit harder.
+    """
+    procs = []
+    for skill_entry in unlocked_skills or []:
+        # Handle both list of strings and list of dicts
+        skill_id = skill_entry.get('skill_id') if isinstance(skill_entry, dict) else skill_entry
+        if not skill_id:
+            continue
+        tier_2 = "2" in skill_id
+        if "str" in skill_id:
+            procs.append((PROC_CRIT, 2.0 if tier_2 else 1.5))
+        elif "tech" in skill_id:
+            procs.append((PROC_DRAIN, 20.0 if tier_2 else 10.0))
+        elif "spd" in skill_id:
+            procs.append((PROC_DOUBLE, 1.8 if tier_2 else 1.4))
+    return procs
+
 # Game states
 STATE_WAITING = "WAITING"      # Both wrestlers ready, waiting for tachiai
 STATE_P1_READY = "P1_READY"    # P1 pressed, waiting for P2
@@ -241,12 +268,14 @@ class SumoEngine:
         self.p1['speed'] = float(p1_data.get('speed', 1.0))
         self.p1['mass'] = float(p1_data.get('weight', 150)) / 150.0
         self.p1['unlocked_skills'] = p1_data.get('unlocked_skills', [])
+        self.p1['procs'] = compile_procs(self.p1['unlocked_skills'])
         
         self.p2['strength'] = float(p2_data.get('strength', 1.0))
         self.p2['technique'] = float(p2_data.get('technique', 1.0))
         self.p2['speed'] = float(p2_data.get('speed', 1.0))
         self.p2['mass'] = float(p2_data.get('weight', 150)) / 150.0
         self.p2['unlocked_skills'] = p2_data.get('unlocked_skills', [])
+        self.p2['procs'] = compile_procs(self.p2['unlocked_skills'])
 
     def _log_event(self, event_type: str, data: Dict[str, Any] = None):
         """Log a match event for replay/debugging"""
@@ -501,39 +530,24 @@ class SumoEngine:
         proc_stamina_damage = 0.0
         proc_event = None
         
-        # Check for skills
-        unlocked = pushing_wrestler.get('unlocked_skills', [])
-        # Iterate and roll for procs
-        # Logic: 15% base chance per relevant skill
-        for skill_entry in unlocked:
-            # Handle both list of strings and list of dicts
-            skill_id = skill_entry.get('skill_id') if isinstance(skill_entry, dict) else skill_entry
-            
-            # Simple RNG for proc
-            if random.random() < 0.15: 
-                if "str" in skill_id:
+        # Roll each precompiled proc (see compile_procs)
+        for kind, value in pushing_wrestler.get('procs', ()):
+            if random.random() < PROC_CHANCE:
+                if kind == PROC_CRIT:
                     # STRENGTH SKILL: CRIT PUSH
-                    # Tier 1: 1.5x, Tier 2: 2.0x
-                    multiplier = 2.0 if "2" in skill_id else 1.5
-                    if multiplier > proc_bonus_force: # Keep best
-                        proc_bonus_force = multiplier
+                    if value > proc_bonus_force: # Keep best
+                        proc_bonus_force = value
                         proc_event = {"name": "POWER PUSH", "type": "crit"}
-                        
-                elif "tech" in skill_id:
+                elif kind == PROC_DRAIN:
                     # TECHNIQUE SKILL: STAMINA DRAIN
-                    # Tier 1: 10 dmg, Tier 2: 20 dmg
-                    dmg = 20.0 if "2" in skill_id else 10.0
-                    proc_stamina_damage += dmg
-                    if not proc_event: 
+                    proc_stamina_damage += value
+                    if not proc_event:
                         proc_event = {"name": "DRAIN", "type": "debuff"}
-                        
-                elif "spd" in skill_id:
-                     # SPEED SKILL: DOUBLE HIT (Force multiplier)
-                     # Conceptually a double hit, effectively just more force but labeled differently
-                     multiplier = 1.8 if "2" in skill_id else 1.4
-                     if multiplier > proc_bonus_force:
-                         proc_bonus_force = multiplier
-                         proc_event = {"name": "DOUBLE STRIKE", "type": "speed"}
+                elif kind == PROC_DOUBLE:
+                    # SPEED SKILL: DOUBLE HIT (conceptually a double hit, effectively more force)
+                    if value > proc_bonus_force:
+                        proc_bonus_force = value
+                        proc_event = {"name": "DOUBLE STRIKE", "type": "speed"}
 
         # Emit Proc Event if happened
         if proc_event:
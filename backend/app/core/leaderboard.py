@@ -0,0 +1,213 @@
+import random
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+MAX_LEVEL = 24  # Enough for ~16M entries at p=1/2
+
+
+class _Node:
+    __slots__ = ("key", "next", "width")
+
+    def __init__(self, key, level: int):
+        self.key = key
+        self.next: List[Optional["_Node"]] = [None] * level
+        # width[i] = positions skipped by following next[i]
+        self.width: List[int] = [1] * level
+
+
+class IndexableSkiplist:
+    """
+    Sorted collection of unique, comparable keys with O(log n) insert, remove,
+    rank-of and select-by-index. Each forward link stores how many positions it
+    spans, so positional lookups walk the express lanes like key lookups do.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self._head = _Node(None, MAX_LEVEL)
+        self._size = 0
+        self._rng = random.Random(seed)  # Own RNG: never perturbs the game's random stream
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < MAX_LEVEL and self._rng.random() < 0.5:
+            level += 1
+        return level
+
+    def insert(self, key):
+        chain: List[_Node] = [self._head] * MAX_LEVEL
+        steps_at_level = [0] * MAX_LEVEL
+        node = self._head
+        for level in reversed(range(MAX_LEVEL)):
+            while node.next[level] is not None and node.next[level].key < key:
+                steps_at_level[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+
+        height = self._random_level()
+        new_node = _Node(key, height)
+        steps = 0
+        for level in range(height):
+            prev = chain[level]
+            new_node.next[level] = prev.next[level]
+            prev.next[level] = new_node
+            new_node.width[level] = prev.width[level] - steps
+            prev.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(height, MAX_LEVEL):
+            chain[level].width[level] += 1
+        self._size += 1
+
+    def remove(self, key):
+        """Remove key. Raises KeyError if absent."""
+        chain: List[_Node] = [self._head] * MAX_LEVEL
+        node = self._head
+        for level in reversed(range(MAX_LEVEL)):
+            while node.next[level] is not None and node.next[level].key < key:
+                node = node.next[level]
+            chain[level] = node
+
+        target = chain[0].next[0]
+        if target is None or target.key != key:
+            raise KeyError(key)
+        for level in range(len(target.next)):
+            prev = chain[level]
+            prev.width[level] += target.width[level] - 1
+            prev.next[level] = target.next[level]
+        for level in range(len(target.next), MAX_LEVEL):
+            chain[level].width[level] -= 1
+        self._size -= 1
+
+    def index(self, key) -> int:
+        """0-based position of key. Raises KeyError if absent."""
+        node = self._head
+        position = 0
+        for level in reversed(range(MAX_LEVEL)):
+            while node.next[level] is not None and node.next[level].key < key:
+                position += node.width[level]
+                node = node.next[level]
+        target = node.next[0]
+        if target is None or target.key != key:
+            raise KeyError(key)
+        return position
+
+    def _node_at(self, index: int) -> _Node:
+        node = self._head
+        target = index + 1  # head sits at position 0
+        position = 0
+        for level in reversed(range(MAX_LEVEL)):
+            while node.next[level] is not None and position + node.width[level] <= target:
+                position += node.width[level]
+                node = node.next[level]
+        return node
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("skiplist index out of range")
+        return self._node_at(index).key
+
+    def iter_from(self, index: int) -> Iterator:
+        """Iterate keys in order starting at position `index`."""
+        if index >= self._size:
+            return
+        node = self._node_at(max(0, index))
+        while node is not None:
+            yield node.key
+            node = node.next[0]
+
+
+class Leaderboard:
+    """
+    Wrestlers ordered by (xp, wins) descending, ties broken by ID.
+    Ranks are 1-based positions. Until `load()` has run, updates are ignored:
+    the first load reads the current state anyway.
+    """
+
+    def __init__(self):
+        self._index = IndexableSkiplist()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @staticmethod
+    def _key(w_id: str, entry: Dict[str, Any]) -> Tuple[int, int, str]:
+        return (-entry["xp"], -entry["wins"], w_id)
+
+    @staticmethod
+    def entry_from(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Pick the fields the leaderboard keeps from a wrestler doc."""
+        return {
+            "name": data.get("custom_name") or data.get("name"),
+            "color": data.get("color"),
+            "rank_name": data.get("rank_name"),
+            "xp": int(data.get("xp") or 0),
+            "wins": int(data.get("wins") or 0),
+            "losses": int(data.get("losses") or 0),
+        }
+
+    def load(self, wrestlers: Iterable[Tuple[str, Dict[str, Any]]]):
+        """Replace the contents with (id, wrestler doc) pairs."""
+        self._index = IndexableSkiplist()
+        self._entries = {}
+        self.loaded = True
+        for w_id, data in wrestlers:
+            self.upsert(w_id, data)
+
+    def invalidate(self):
+        """Forget everything (e.g. after an outside write); the next load() rebuilds it."""
+        self._index = IndexableSkiplist()
+        self._entries = {}
+        self.loaded = False
+
+    def upsert(self, w_id: str, data: Dict[str, Any]):
+        if not self.loaded:
+            return
+        w_id = str(w_id)
+        entry = self.entry_from(data)
+        old = self._entries.get(w_id)
+        if old is not None:
+            if (old["xp"], old["wins"]) == (entry["xp"], entry["wins"]):
+                self._entries[w_id] = entry  # Display fields only; position unchanged
+                return
+            self._index.remove(self._key(w_id, old))
+        self._entries[w_id] = entry
+        self._index.insert(self._key(w_id, entry))
+
+    def remove(self, w_id: str):
+        w_id = str(w_id)
+        old = self._entries.pop(w_id, None)
+        if old is not None:
+            self._index.remove(self._key(w_id, old))
+
+    def rank_of(self, w_id: str) -> Optional[int]:
+        w_id = str(w_id)
+        entry = self._entries.get(w_id)
+        if entry is None:
+            return None
+        return self._index.index(self._key(w_id, entry)) + 1
+
+    def _row(self, key, rank: int) -> Dict[str, Any]:
+        w_id = key[2]
+        return {"id": w_id, "rank": rank, **self._entries[w_id]}
+
+    def page(self, offset: int = 0, limit: int = 50) -> List[Dict[str, Any]]:
+        """Rows for ranks offset+1 .. offset+limit."""
+        rows = []
+        for i, key in enumerate(self._index.iter_from(offset)):
+            if i >= limit:
+                break
+            rows.append(self._row(key, offset + i + 1))
+        return rows
+
+    def around(self, w_id: str, radius: int = 5) -> List[Dict[str, Any]]:
+        """Up to `radius` rows either side of a wrestler, including them."""
+        rank = self.rank_of(w_id)
+        if rank is None:
+            return []
+        start = max(0, rank - 1 - radius)
+        return self.page(start, rank - start + radius)
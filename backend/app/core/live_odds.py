@@ -0,0 +1,125 @@
+from typing import Any, Dict, Optional, Tuple
+import contextlib
+import io
+import math
+import os
+import random
+
+try:
+    import numpy as np
+except ImportError:  # Without numpy there is no table; snapshots just omit the field
+    np = None
+
+from app.core.engine import SumoEngine, STATE_FIGHTING
+from app.core.odds import PERSONAS, simulate_bout
+
+# Discretized in-bout state: (p1 edge, p2 edge, push velocity, stamina gap,
+# strength log-ratio). Every axis is symmetric around zero with an odd bin
+# count (edges excepted), so swapping the wrestlers mirrors the index.
+EDGE_BINS = 10        # Distance from centre / ring radius, 0..1
+VEL_BINS = 9          # Mean velocity along the p1 -> p2 axis (+ = p1 driving)
+VEL_RANGE = 1.5       # Engine velocity cap
+STAMINA_BINS = 5      # (p1 - p2) / STAMINA_MAX
+RATIO_BINS = 5        # log(p1 strength / p2 strength)
+RATIO_RANGE = 1.0
+SHAPE = (EDGE_BINS, EDGE_BINS, VEL_BINS, STAMINA_BINS, RATIO_BINS)
+PRIOR_WEIGHT = 20.0   # Samples at which a cell outweighs its edge-only estimate
+DEFAULT_TABLE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                                  "data", "live_odds.npy")
+
+
+def _bin(value: float, lo: float, hi: float, bins: int) -> int:
+    return min(bins - 1, max(0, int((value - lo) / (hi - lo) * bins)))
+
+
+def state_index(p1: Dict[str, Any], p2: Dict[str, Any], p1_edge: float, p2_edge: float) -> Tuple[int, ...]:
+    """Table cell for two engine wrestler dicts and their edge distances (0-1)."""
+    dx = p2["x"] - p1["x"]
+    dy = p2["y"] - p1["y"]
+    dist = math.sqrt(dx * dx + dy * dy) or 1.0
+    push_vel = ((p1["vx"] + p2["vx"]) * dx + (p1["vy"] + p2["vy"]) * dy) / (2.0 * dist)
+    stamina_gap = (p1.get("stamina", SumoEngine.STAMINA_MAX) - p2.get("stamina", SumoEngine.STAMINA_MAX)) / SumoEngine.STAMINA_MAX
+    ratio = math.log(max(p1.get("strength", 1.0), 1e-6) / max(p2.get("strength", 1.0), 1e-6))
+    return (_bin(p1_edge, 0.0, 1.0, EDGE_BINS),
+            _bin(p2_edge, 0.0, 1.0, EDGE_BINS),
+            _bin(push_vel, -VEL_RANGE, VEL_RANGE, VEL_BINS),
+            _bin(stamina_gap, -1.0, 1.0, STAMINA_BINS),
+            _bin(ratio, -RATIO_RANGE, RATIO_RANGE, RATIO_BINS))
+
+
+def mirror_index(index: Tuple[int, ...]) -> Tuple[int, ...]:
+    """The same cell seen from p2's side."""
+    e1, e2, v, s, r = index
+    return (e2, e1, VEL_BINS - 1 - v, STAMINA_BINS - 1 - s, RATIO_BINS - 1 - r)
+
+
+def _edge(engine: SumoEngine, wrestler: Dict[str, Any]) -> float:
+    return math.sqrt((wrestler["x"] - engine.CENTER_X) ** 2 + (wrestler["y"] - engine.CENTER_Y) ** 2) / engine.RING_RADIUS
+
+
+def sample_bouts(bouts: int, seed: int):
+    """
+    Play `bouts` bouts with random stats and personas, recording every
+    fighting tick's cell. Returns (wins, counts) arrays of SHAPE, both
+    sides counted (each tick is also added mirrored with the result flipped).
+    """
+    rng = random.Random(seed)
+    random.seed(seed)
+    wins = np.zeros(SHAPE, dtype=np.float64)
+    counts = np.zeros(SHAPE, dtype=np.int64)
+    ticks = []
+
+    def record(engine: SumoEngine):
+        if engine.state == STATE_FIGHTING:
+            ticks.append(state_index(engine.p1, engine.p2, _edge(engine, engine.p1), _edge(engine, engine.p2)))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(bouts):
+            p1 = {"strength": math.exp(rng.uniform(-0.6, 0.6)), "technique": math.exp(rng.uniform(-0.6, 0.6))}
+            p2 = {"strength": math.exp(rng.uniform(-0.6, 0.6)), "technique": math.exp(rng.uniform(-0.6, 0.6))}
+            ticks.clear()
+            score = simulate_bout(p1, p2, rng.choice(PERSONAS), rng.choice(PERSONAS), rng, on_tick=record)
+            for index in ticks:
+                wins[index] += score
+                counts[index] += 1
+                mirrored = mirror_index(index)
+                wins[mirrored] += 1.0 - score
+                counts[mirrored] += 1
+    return wins, counts
+
+
+def build_table(wins, counts):
+    """
+    Per-cell win rate, shrunk toward the win rate for the same pair of edge
+    bins (itself shrunk toward 0.5) so sparse or unvisited cells stay sane.
+    """
+    edge_wins = wins.sum(axis=(2, 3, 4))
+    edge_counts = counts.sum(axis=(2, 3, 4))
+    edge_rate = (edge_wins + 0.5 * PRIOR_WEIGHT) / (edge_counts + PRIOR_WEIGHT)
+    prior = edge_rate[:, :, None, None, None]
+    return ((wins + prior * PRIOR_WEIGHT) / (counts + PRIOR_WEIGHT)).astype(np.float32)
+
+
+class LiveOddsTable:
+    """The state table, memory-mapped; one lookup per broadcast snapshot."""
+
+    def __init__(self, table):
+        self.table = table
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_TABLE_PATH) -> Optional["LiveOddsTable"]:
+        """The table built by scripts/build_live_odds.py, or None if absent."""
+        if np is None or not os.path.exists(path):
+            return None
+        table = np.load(path, mmap_mode="r")
+        if table.shape != SHAPE:
+            print(f"[LiveOdds] Ignoring {path}: shape {table.shape}, expected {SHAPE}")
+            return None
+        return cls(table)
+
+    def p1_win(self, state: Dict[str, Any]) -> Optional[float]:
+        """p1's win probability for a get_state() snapshot, or None outside the fight."""
+        if state.get("state") != STATE_FIGHTING:
+            return None
+        index = state_index(state["p1"], state["p2"], state.get("p1_edge_danger", 0.0), state.get("p2_edge_danger", 0.0))
+        return round(float(self.table[index]), 3)
@@ -0,0 +1,212 @@
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+import bisect
+import itertools
+import time
+
+from app.core.rating import DEFAULT_RATING
+
+BUCKET_WIDTH = 50.0        # Rating points per bucket
+BASE_WINDOW = 100.0        # Rating gap accepted immediately
+WIDEN_PER_SECOND = 25.0    # Window growth while waiting
+MAX_WINDOW = 600.0
+BASE_RANK_GAP = 1          # Rank tiers apart accepted immediately
+RANK_GAP_WIDEN_SECONDS = 15.0  # One more tier allowed per this many seconds waited
+WAIT_SAMPLES = 500         # Recent waits kept for percentile metrics
+
+
+class Ticket:
+    __slots__ = ("ticket_id", "wrestler_id", "name", "rating", "rank_index", "enqueued_at", "bucket")
+
+    def __init__(self, ticket_id: str, wrestler_id: str, name: str, rating: float,
+                 rank_index: int, enqueued_at: float):
+        self.ticket_id = ticket_id
+        self.wrestler_id = wrestler_id
+        self.name = name
+        self.rating = rating
+        self.rank_index = rank_index
+        self.enqueued_at = enqueued_at
+        self.bucket = int(rating // BUCKET_WIDTH)
+
+    def window(self, now: float) -> Tuple[float, int]:
+        """(rating gap, rank gap) this ticket accepts after waiting until `now`."""
+        waited = max(0.0, now - self.enqueued_at)
+        rating_gap = min(MAX_WINDOW, BASE_WINDOW + WIDEN_PER_SECOND * waited)
+        rank_gap = BASE_RANK_GAP + int(waited // RANK_GAP_WIDEN_SECONDS)
+        return rating_gap, rank_gap
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"ticket_id": self.ticket_id, "wrestler_id": self.wrestler_id, "name": self.name,
+                "rating": self.rating, "rank_index": self.rank_index}
+
+
+class MatchmakingQueue:
+    """
+    Waiting tickets grouped into cells by (rating bucket, rank tier), FIFO
+    inside each, with the occupied cell keys kept sorted. A search visits
+    only the cells inside the ticket's rating window, nearest first, and
+    skips a whole cell in O(1) when its oldest ticket (the widest window in
+    it) can't accept the rank or rating gap. Pairing needs both players'
+    windows to accept the gap.
+
+    Cost of one search: O(C + k), where C is the number of occupied cells in
+    the window (at most buckets-in-window x rank tiers, both small
+    constants) and k the tickets passed over inside a reachable cell because
+    their own, narrower window doesn't yet cover the gap. Cells within one
+    bucket of the ticket never skip anyone (the gap is under BASE_WINDOW),
+    so k only grows with players waiting 2+ buckets away; a full match_pass
+    is still O(n * (C + k)) in the worst case.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[Tuple[int, int], "OrderedDict[str, Ticket]"] = {}
+        self._bucket_keys: List[Tuple[int, int]] = []  # Sorted (bucket, rank), non-empty cells only
+        self._tickets: "OrderedDict[str, Ticket]" = OrderedDict()  # Oldest first
+        self._by_wrestler: Dict[str, str] = {}
+        self._ids = itertools.count(1)
+        self._waits: Deque[float] = deque(maxlen=WAIT_SAMPLES)
+        self.matched_pairs = 0
+        self.cancelled = 0
+
+    def __len__(self) -> int:
+        return len(self._tickets)
+
+    def __contains__(self, ticket_id: str) -> bool:
+        return ticket_id in self._tickets
+
+    # --- Bucket bookkeeping ---
+
+    def _add(self, ticket: Ticket):
+        key = (ticket.bucket, ticket.rank_index)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = OrderedDict()
+            bisect.insort(self._bucket_keys, key)
+        bucket[ticket.ticket_id] = ticket
+        self._tickets[ticket.ticket_id] = ticket
+        self._by_wrestler[ticket.wrestler_id] = ticket.ticket_id
+
+    def _remove(self, ticket: Ticket):
+        key = (ticket.bucket, ticket.rank_index)
+        bucket = self._buckets[key]
+        del bucket[ticket.ticket_id]
+        if not bucket:
+            del self._buckets[key]
+            del self._bucket_keys[bisect.bisect_left(self._bucket_keys, key)]
+        del self._tickets[ticket.ticket_id]
+        del self._by_wrestler[ticket.wrestler_id]
+
+    # --- Public API ---
+
+    def enqueue(self, wrestler_id: str, name: str = "", rating: Optional[float] = None,
+                rank_index: int = 0, now: Optional[float] = None) -> Ticket:
+        """Add a wrestler to the queue. Raises ValueError if already waiting."""
+        now = time.time() if now is None else now
+        wrestler_id = str(wrestler_id)
+        if wrestler_id in self._by_wrestler:
+            raise ValueError("Wrestler is already queued")
+        rating = DEFAULT_RATING if rating is None else float(rating)
+        ticket = Ticket(f"t{next(self._ids)}", wrestler_id, name, rating, int(rank_index or 0), now)
+        self._add(ticket)
+        return ticket
+
+    def cancel(self, ticket_id: str) -> bool:
+        ticket = self._tickets.get(ticket_id)
+        if ticket is None:
+            return False
+        self._remove(ticket)
+        self.cancelled += 1
+        return True
+
+    def _find_opponent(self, ticket: Ticket, now: float) -> Optional[Ticket]:
+        rating_gap, rank_gap = ticket.window(now)
+        lo = bisect.bisect_left(self._bucket_keys, (int((ticket.rating - rating_gap) // BUCKET_WIDTH), -1))
+        hi = bisect.bisect_left(self._bucket_keys, (int((ticket.rating + rating_gap) // BUCKET_WIDTH) + 1, -1))
+        # Nearest buckets first, alternating below/above the ticket's own bucket
+        candidates = sorted(
+            (key for key in self._bucket_keys[lo:hi] if abs(key[1] - ticket.rank_index) <= rank_gap),
+            key=lambda key: abs(key[0] - ticket.bucket),
+        )
+
+        best = None
+        best_gap = None
+        for key in candidates:
+            bucket_key, rank_index = key
+            if best_gap is not None and (abs(bucket_key - ticket.bucket) - 1) * BUCKET_WIDTH > best_gap:
+                break  # Nothing further out can beat the best found
+            cell = self._buckets[key]
+            rank_diff = abs(rank_index - ticket.rank_index)
+            # The oldest ticket in a cell has its widest window: if it can't reach, none can
+            oldest_rating_gap, oldest_rank_gap = next(iter(cell.values())).window(now)
+            cell_lo = bucket_key * BUCKET_WIDTH
+            nearest_gap = max(0.0, cell_lo - ticket.rating, ticket.rating - (cell_lo + BUCKET_WIDTH))
+            if rank_diff > oldest_rank_gap or nearest_gap > oldest_rating_gap:
+                continue
+            for other in cell.values():
+                if other is ticket:
+                    continue
+                gap = abs(other.rating - ticket.rating)
+                other_rating_gap, other_rank_gap = other.window(now)
+                if gap > rating_gap or gap > other_rating_gap or rank_diff > other_rank_gap:
+                    continue
+                if best_gap is None or gap < best_gap:
+                    best, best_gap = other, gap
+                break  # FIFO: the oldest acceptable ticket represents this cell
+        return best
+
+    def pair(self, ticket_id: str, now: Optional[float] = None) -> Optional[Tuple[Ticket, Ticket]]:
+        """Try to pair one waiting ticket. On success both leave the queue."""
+        now = time.time() if now is None else now
+        ticket = self._tickets.get(ticket_id)
+        if ticket is None:
+            return None
+        opponent = self._find_opponent(ticket, now)
+        if opponent is None:
+            return None
+        # Longer-waiting player takes the p1 slot
+        first, second = sorted((ticket, opponent), key=lambda t: t.enqueued_at)
+        self._remove(first)
+        self._remove(second)
+        self._waits.append(now - first.enqueued_at)
+        self._waits.append(now - second.enqueued_at)
+        self.matched_pairs += 1
+        return first, second
+
+    def match_pass(self, now: Optional[float] = None) -> List[Tuple[Ticket, Ticket]]:
+        """Pair everything currently pairable, oldest tickets first (their windows are widest)."""
+        now = time.time() if now is None else now
+        pairs = []
+        for ticket_id in list(self._tickets.keys()):
+            if ticket_id in self._tickets:
+                result = self.pair(ticket_id, now)
+                if result:
+                    pairs.append(result)
+        return pairs
+
+    def _bucket_depths(self) -> Dict[int, int]:
+        """Waiting tickets per rating bucket (all rank tiers together)."""
+        depths: Dict[int, int] = {}
+        for bucket_key, rank_index in self._bucket_keys:
+            rating = int(bucket_key * BUCKET_WIDTH)
+            depths[rating] = depths.get(rating, 0) + len(self._buckets[(bucket_key, rank_index)])
+        return depths
+
+    def metrics(self, now: Optional[float] = None) -> Dict[str, Any]:
+        now = time.time() if now is None else now
+        waits = sorted(self._waits)
+
+        def percentile(p: float) -> Optional[float]:
+            if not waits:
+                return None
+            return round(waits[min(len(waits) - 1, int(p * len(waits)))], 2)
+
+        oldest = next(iter(self._tickets.values()), None)
+        return {
+            "depth": len(self._tickets),
+            "buckets": self._bucket_depths(),
+            "oldest_wait_seconds": round(now - oldest.enqueued_at, 2) if oldest else 0.0,
+            "matched_pairs": self.matched_pairs,
+            "cancelled": self.cancelled,
+            "wait_p50_seconds": percentile(0.5),
+            "wait_p90_seconds": percentile(0.9),
+        }
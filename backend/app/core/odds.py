@@ -0,0 +1,145 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import contextlib
+import io
+import math
+import os
+import random
+
+try:
+    import numpy as np
+except ImportError:  # Lookups still work from the stored lists, just without vectorization
+    np = None
+
+from app.core.engine import SumoEngine
+
+# Player personas for offline bouts: taps per second, and the stamina level
+# below which the player stops pushing to recover
+PERSONAS = (
+    {"name": "masher", "taps_per_sec": 12.0, "rest_below": 0.0},
+    {"name": "steady", "taps_per_sec": 7.0, "rest_below": 15.0},
+    {"name": "patient", "taps_per_sec": 5.0, "rest_below": 40.0},
+)
+
+# Only strength (push force) and technique (counter bonus) feed the physics,
+# and both act as multipliers, so the table is indexed by log(p1 / p2).
+GRID_MIN = -1.0
+GRID_MAX = 1.0
+GRID_STEPS = 17
+SIM_FPS = 60
+BOUT_TIMEOUT = 60.0  # Sim seconds; unresolved bouts count as half a win each
+DEFAULT_TABLE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                                  "data", "odds_table.npz")
+
+
+def grid_axis(steps: int = GRID_STEPS) -> List[float]:
+    return [GRID_MIN + (GRID_MAX - GRID_MIN) * i / (steps - 1) for i in range(steps)]
+
+
+def simulate_bout(p1: Dict[str, float], p2: Dict[str, float], p1_persona: Dict[str, float],
+                  p2_persona: Dict[str, float], rng: random.Random,
+                  on_tick: Optional[Callable[[SumoEngine], None]] = None) -> float:
+    """
+    One headless bout between two stat blocks driven by persona inputs.
+    Returns p1's score: 1 win, 0 loss, 0.5 timeout. The engine draws from
+    the module-level `random`, so seed that too for reproducible batches.
+    `on_tick(engine)` is called after every tick (for state sampling).
+    """
+    engine = SumoEngine()
+    engine.set_wrestlers({"id": "p1", **p1}, {"id": "p2", **p2})
+    engine.force_start(skip_countdown=True)
+    dt = 1.0 / SIM_FPS
+    sides = ((engine.p1, "p1", p1_persona), (engine.p2, "p2", p2_persona))
+    # Stagger the first taps so neither side always acts first
+    next_tap = [rng.uniform(0, 1.0 / p1_persona["taps_per_sec"]),
+                rng.uniform(0, 1.0 / p2_persona["taps_per_sec"])]
+
+    while not engine.game_over and engine.timestamp < BOUT_TIMEOUT:
+        engine.tick(dt)
+        if on_tick is not None:
+            on_tick(engine)
+        for i, (wrestler, player_id, persona) in enumerate(sides):
+            if engine.timestamp < next_tap[i]:
+                continue
+            if wrestler["stamina"] > persona["rest_below"]:
+                engine.handle_input(player_id, rng.choice(("PUSH_LEFT", "PUSH_RIGHT")))
+            # Human-ish rhythm: +/-30% jitter around the persona's tap rate
+            next_tap[i] = engine.timestamp + rng.uniform(0.7, 1.3) / persona["taps_per_sec"]
+
+    if not engine.game_over:
+        return 0.5
+    return 1.0 if engine.winner_id == "p1" else 0.0
+
+
+def run_batch(p1: Dict[str, float], p2: Dict[str, float], bouts: int, seed: int,
+              personas: Sequence[Dict[str, float]] = PERSONAS) -> Dict[str, Any]:
+    """
+    `bouts` bouts per persona pairing, with sides swapped on alternate bouts
+    to cancel the engine's p1-first input ordering. Safe to run in a worker
+    process; engine logging is discarded.
+    """
+    rng = random.Random(seed)
+    random.seed(seed)
+    score = 0.0
+    timeouts = 0
+    total = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        for a in personas:
+            for b in personas:
+                for n in range(bouts):
+                    if n % 2 == 0:
+                        result = simulate_bout(p1, p2, a, b, rng)
+                    else:
+                        result = 1.0 - simulate_bout(p2, p1, b, a, rng)
+                    score += result
+                    timeouts += result == 0.5
+                    total += 1
+    return {"bouts": total, "p1_score": score, "timeouts": timeouts}
+
+
+def log_ratio(a: float, b: float) -> float:
+    return math.log(max(a, 1e-6) / max(b, 1e-6))
+
+
+def _locate(axis: Sequence[float], value: float) -> Tuple[int, float]:
+    """Lower grid index and interpolation weight, clamped to the table edges."""
+    value = min(max(value, axis[0]), axis[-1])
+    step = (axis[-1] - axis[0]) / (len(axis) - 1)
+    i = min(int((value - axis[0]) / step), len(axis) - 2)
+    return i, (value - axis[i]) / step
+
+
+class OddsTable:
+    """
+    p1 win probability on a regular grid of (strength, technique) log-ratios,
+    averaged over all persona pairings. Lookups are bilinear interpolation
+    on plain Python lists: four reads and a few multiplies.
+    """
+
+    def __init__(self, axis: Sequence[float], win: Sequence[Sequence[float]], bouts_per_cell: int = 0):
+        self.axis = [float(v) for v in axis]
+        self.win = [[float(v) for v in row] for row in win]
+        self.bouts_per_cell = int(bouts_per_cell)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_TABLE_PATH) -> Optional["OddsTable"]:
+        """The table built by scripts/build_odds_table.py, or None if absent."""
+        if np is None or not os.path.exists(path):
+            return None
+        with np.load(path) as data:
+            return cls(data["axis"].tolist(), data["win"].tolist(), int(data["bouts_per_cell"]))
+
+    def save(self, path: str = DEFAULT_TABLE_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.savez_compressed(path, axis=np.asarray(self.axis, dtype=np.float32),
+                            win=np.asarray(self.win, dtype=np.float32),
+                            bouts_per_cell=np.int64(self.bouts_per_cell))
+
+    def p1_win(self, p1: Dict[str, Any], p2: Dict[str, Any]) -> float:
+        """Interpolated probability that p1 beats p2 (stats default to 1.0)."""
+        s, fs = _locate(self.axis, log_ratio(float(p1.get("strength", 1.0)), float(p2.get("strength", 1.0))))
+        t, ft = _locate(self.axis, log_ratio(float(p1.get("technique", 1.0)), float(p2.get("technique", 1.0))))
+        row0 = self.win[s]
+        row1 = self.win[s + 1]
+        low = row0[t] + (row0[t + 1] - row0[t]) * ft
+        high = row1[t] + (row1[t + 1] - row1[t]) * ft
+        return low + (high - low) * fs
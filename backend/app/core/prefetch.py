@@ -0,0 +1,84 @@
+from typing import Any, Callable, Dict, Optional, Tuple
+import asyncio
+import time
+
+DEFAULT_TTL = 120.0  # Seconds a prefetched wrestler stays usable
+
+
+class WrestlerPrefetchCache:
+    """
+    Short-lived cache of match-ready wrestler data.
+    Lobby joins call prefetch() so the storage read happens in the background;
+    match creation then get()s from memory, awaiting an in-flight fetch rather
+    than issuing a second one. Entries are stamped with the wrestler's version
+    and dropped as soon as that wrestler changes.
+    """
+
+    def __init__(self, load: Callable[[str], Optional[Dict[str, Any]]],
+                 version_of: Callable[[str], int], ttl: float = DEFAULT_TTL):
+        self._load = load              # Blocking loader, run in a worker thread
+        self._version_of = version_of
+        self.ttl = ttl
+        # Maps wrestler id -> (expires_at, version, data)
+        self._entries: Dict[str, Tuple[float, int, Optional[Dict[str, Any]]]] = {}
+        # Maps wrestler id -> (version, in-flight fetch)
+        self._pending: Dict[str, Tuple[int, asyncio.Task]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _fresh(self, wrestler_id: str):
+        entry = self._entries.get(wrestler_id)
+        if entry is None:
+            return None
+        expires_at, version, _ = entry
+        if time.monotonic() > expires_at or version != self._version_of(wrestler_id):
+            del self._entries[wrestler_id]
+            return None
+        return entry
+
+    def _in_flight(self, wrestler_id: str) -> Optional[asyncio.Task]:
+        pending = self._pending.get(wrestler_id)
+        if pending and pending[0] == self._version_of(wrestler_id):
+            return pending[1]
+        return None
+
+    async def _fetch(self, wrestler_id: str, version: int) -> Optional[Dict[str, Any]]:
+        try:
+            data = await asyncio.to_thread(self._load, wrestler_id)
+        finally:
+            if self._pending.get(wrestler_id, (None,))[0] == version:
+                del self._pending[wrestler_id]
+        if self._version_of(wrestler_id) == version:
+            self._entries[wrestler_id] = (time.monotonic() + self.ttl, version, data)
+        return data
+
+    def prefetch(self, wrestler_id: str):
+        """Start a background fetch unless one is cached or already running."""
+        wrestler_id = str(wrestler_id)
+        if self._fresh(wrestler_id) or self._in_flight(wrestler_id):
+            return
+        version = self._version_of(wrestler_id)
+        task = asyncio.create_task(self._fetch(wrestler_id, version))
+        # Failures surface on the next get(); don't warn about unread exceptions
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._pending[wrestler_id] = (version, task)
+
+    async def get(self, wrestler_id: str) -> Optional[Dict[str, Any]]:
+        """Match data for a wrestler (None if not found), from memory when possible."""
+        wrestler_id = str(wrestler_id)
+        entry = self._fresh(wrestler_id)
+        if entry is not None:
+            self.hits += 1
+            data = entry[2]
+        else:
+            task = self._in_flight(wrestler_id)
+            if task is not None:
+                self.hits += 1
+                data = await asyncio.shield(task)
+            else:
+                self.misses += 1
+                data = await self._fetch(wrestler_id, self._version_of(wrestler_id))
+        return dict(data) if data is not None else None
+
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,98 @@
+from typing import Dict, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Batch recompute falls back to a plain loop
+    np = None
+
+# Elo with a larger K while a wrestler is provisional (few rated bouts)
+DEFAULT_RATING = 1500.0
+K_FACTOR = 24.0
+K_PROVISIONAL = 48.0
+PROVISIONAL_MATCHES = 10
+SCALE = 400.0
+
+
+def expected_score(rating: float, opponent: float) -> float:
+    """Probability `rating` beats `opponent` under Elo."""
+    return 1.0 / (1.0 + 10.0 ** ((opponent - rating) / SCALE))
+
+
+def k_factor(rated_matches: int) -> float:
+    return K_PROVISIONAL if rated_matches < PROVISIONAL_MATCHES else K_FACTOR
+
+
+def elo_update(winner_rating: float, loser_rating: float,
+               winner_matches: int = PROVISIONAL_MATCHES,
+               loser_matches: int = PROVISIONAL_MATCHES) -> Tuple[float, float]:
+    """New (winner, loser) ratings after one bout. *_matches = rated bouts before this one."""
+    surprise = 1.0 - expected_score(winner_rating, loser_rating)
+    return (winner_rating + k_factor(winner_matches) * surprise,
+            loser_rating - k_factor(loser_matches) * surprise)
+
+
+def _waves(winners: Sequence[int], losers: Sequence[int], n_players: int):
+    """
+    Assign each match (in chronological order) to the earliest "wave" after
+    both players' previous matches, so no player appears twice in a wave and
+    a wave can be updated in one vectorized step with identical results to
+    the sequential loop. Also returns each player's prior rated-bout count.
+    """
+    last_wave = [-1] * n_players
+    played = [0] * n_players
+    waves = [0] * len(winners)
+    winner_prior = [0] * len(winners)
+    loser_prior = [0] * len(winners)
+    for i, (w, l) in enumerate(zip(winners, losers)):
+        wave = max(last_wave[w], last_wave[l]) + 1
+        waves[i] = wave
+        last_wave[w] = last_wave[l] = wave
+        winner_prior[i] = played[w]
+        loser_prior[i] = played[l]
+        played[w] += 1
+        played[l] += 1
+    return waves, winner_prior, loser_prior, played
+
+
+def recompute_ratings(winners: Sequence[int], losers: Sequence[int],
+                      n_players: int) -> Tuple[List[float], List[int]]:
+    """
+    Replay a full, chronologically ordered history from scratch.
+    winners/losers are player indexes (0..n_players-1) per match.
+    Returns (ratings, rated_match_counts) indexed by player.
+    """
+    waves, winner_prior, loser_prior, played = _waves(winners, losers, n_players)
+    if np is None:
+        ratings = [DEFAULT_RATING] * n_players
+        for w, l, wp, lp in zip(winners, losers, winner_prior, loser_prior):
+            ratings[w], ratings[l] = elo_update(ratings[w], ratings[l], wp, lp)
+        return ratings, played
+
+    winners_arr = np.asarray(winners, dtype=np.int64)
+    losers_arr = np.asarray(losers, dtype=np.int64)
+    k_w = np.where(np.asarray(winner_prior) < PROVISIONAL_MATCHES, K_PROVISIONAL, K_FACTOR)
+    k_l = np.where(np.asarray(loser_prior) < PROVISIONAL_MATCHES, K_PROVISIONAL, K_FACTOR)
+
+    # Group matches by wave (stable, so chronology is kept inside the grouping)
+    waves_arr = np.asarray(waves, dtype=np.int64)
+    order = np.argsort(waves_arr, kind="stable")
+    bounds = np.flatnonzero(np.diff(waves_arr[order])) + 1
+    ratings = np.full(n_players, DEFAULT_RATING, dtype=np.float64)
+
+    for batch in np.split(order, bounds):
+        w = winners_arr[batch]
+        l = losers_arr[batch]
+        surprise = 1.0 - 1.0 / (1.0 + 10.0 ** ((ratings[l] - ratings[w]) / SCALE))
+        ratings[w] += k_w[batch] * surprise
+        ratings[l] -= k_l[batch] * surprise
+    return ratings.tolist(), played
+
+
+def index_players(pairs: Sequence[Tuple[str, str]]) -> Tuple[List[int], List[int], Dict[str, int]]:
+    """Map (winner_id, loser_id) rows to dense indexes for recompute_ratings."""
+    index: Dict[str, int] = {}
+    winners, losers = [], []
+    for winner_id, loser_id in pairs:
+        winners.append(index.setdefault(str(winner_id), len(index)))
+        losers.append(index.setdefault(str(loser_id), len(index)))
+    return winners, losers, index
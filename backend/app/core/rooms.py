@@ -0,0 +1,159 @@
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import heapq
+import random
+import time
+
+# Unambiguous on a phone screen or read aloud: no 0/O, 1/I/L
+CODE_ALPHABET = "ABCDEFGHJKMNPQRSTUVWXYZ23456789"
+CODE_LENGTH = 4
+ROOM_TTL_SECONDS = 15 * 60  # Idle rooms are dropped after this long
+MAX_ROOMS = 50_000
+
+
+class Room:
+    """One lobby: two player slots, a lock once started, and the match it started."""
+    __slots__ = ("code", "p1", "p2", "locked", "match_id", "expires_at", "version", "created_ns")
+
+    def __init__(self, code: str, expires_at: float):
+        self.code = code
+        self.p1: Optional[Dict[str, str]] = None  # {id, name}
+        self.p2: Optional[Dict[str, str]] = None
+        self.locked = False
+        self.match_id: Optional[str] = None
+        self.expires_at = expires_at
+        self.version = 0  # Bumped on every change, for ETags
+        # Codes are reused after expiry and version restarts at 0, so ETags also carry this
+        self.created_ns = time.time_ns()
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "code": self.code,
+            "p1": self.p1,
+            "p2": self.p2,
+            "ready_to_start": (self.p1 is not None and self.p2 is not None),
+            "locked": self.locked,
+            "match_id": self.match_id,
+        }
+
+
+class RoomRegistry:
+    """
+    Rooms by short code. Expiry uses one min-heap of (deadline, code) and one
+    timer task that sleeps until the earliest deadline, so no request ever
+    scans the room table. Touching a room only moves its deadline; the stale
+    heap entry is re-queued when it surfaces.
+    """
+
+    def __init__(self, ttl: float = ROOM_TTL_SECONDS, max_rooms: int = MAX_ROOMS, seed: Optional[int] = None):
+        self.ttl = ttl
+        self.max_rooms = max_rooms
+        self.rooms: Dict[str, Room] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self._rng = random.Random(seed)
+        self._timer: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self.expired_count = 0
+
+    def __len__(self) -> int:
+        return len(self.rooms)
+
+    def _new_code(self) -> str:
+        while True:
+            code = "".join(self._rng.choice(CODE_ALPHABET) for _ in range(CODE_LENGTH))
+            if code not in self.rooms:
+                return code
+
+    def create(self, now: Optional[float] = None) -> Room:
+        """Open a new room. Raises RuntimeError when at capacity."""
+        now = time.monotonic() if now is None else now
+        if len(self.rooms) >= self.max_rooms:
+            self.expire(now)
+            if len(self.rooms) >= self.max_rooms:
+                raise RuntimeError("Too many open rooms")
+        room = Room(self._new_code(), now + self.ttl)
+        self.rooms[room.code] = room
+        heapq.heappush(self._heap, (room.expires_at, room.code))
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return room
+
+    def get(self, code: str) -> Optional[Room]:
+        return self.rooms.get(code.strip().upper())
+
+    def touch(self, room: Room, now: Optional[float] = None):
+        """Record activity: bump the version and push the deadline out."""
+        now = time.monotonic() if now is None else now
+        room.version += 1
+        room.expires_at = now + self.ttl
+
+    def remove(self, code: str):
+        self.rooms.pop(code, None)  # Its heap entry is skipped when popped
+
+    def join(self, room: Room, side: str, wrestler_id: str, wrestler_name: str) -> bool:
+        if room.locked:
+            return False
+        data = {"id": wrestler_id, "name": wrestler_name}
+        if side == "p1":
+            room.p1 = data
+        elif side == "p2":
+            room.p2 = data
+        self.touch(room)
+        return True
+
+    def reset(self, room: Room):
+        room.p1 = None
+        room.p2 = None
+        room.locked = False
+        room.match_id = None
+        self.touch(room)
+
+    def bind_match(self, room: Room, match_id: str):
+        room.locked = True
+        room.match_id = match_id
+        self.touch(room)
+
+    def unbind_match(self, room: Room):
+        """Undo bind_match (e.g. the match failed to start); players stay seated."""
+        room.locked = False
+        room.match_id = None
+        self.touch(room)
+
+    def next_deadline(self) -> Optional[float]:
+        return self._heap[0][0] if self._heap else None
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """Drop rooms whose deadline has passed. Returns how many were removed."""
+        now = time.monotonic() if now is None else now
+        removed = 0
+        while self._heap and self._heap[0][0] <= now:
+            _, code = heapq.heappop(self._heap)
+            room = self.rooms.get(code)
+            if room is None:
+                continue
+            if room.expires_at > now:
+                heapq.heappush(self._heap, (room.expires_at, code))  # Touched since queued
+                continue
+            del self.rooms[code]
+            removed += 1
+        self.expired_count += removed
+        return removed
+
+    def ensure_timer(self):
+        """Start the expiry task (needs a running event loop)."""
+        if self._timer is None or self._timer.done():
+            self._wakeup = asyncio.Event()
+            self._timer = asyncio.create_task(self._run_timer())
+
+    async def _run_timer(self):
+        while True:
+            deadline = self.next_deadline()
+            self._wakeup.clear()
+            if deadline is None:
+                await self._wakeup.wait()  # Nothing queued until the next create()
+                continue
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                # Deadlines only move later, so the current head is the earliest wake-up
+                await asyncio.sleep(delay)
+            self.expire()
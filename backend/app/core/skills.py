@@ -0,0 +1,130 @@
+from typing import Any, Dict, Iterable, List
+import hashlib
+import json
+
+# The skill tree served to the web app. Engine procs key off these IDs
+# ("str"/"tech"/"spd" prefix, "2" for tier 2), so keep them stable.
+SKILL_TREE: Dict[str, Dict[str, Any]] = {
+    "strength": {
+        "name": "Strength", "jp": "力", "description": "Raw pushing power", "color": "220,50,50",
+        "skills": [
+            {"id": "str_1", "name": "Iron Grip", "jp": "鉄握", "desc": "+10% push force", "tier": 1, "cost": 1, "effect": {"strength": 0.1}},
+            {"id": "str_2", "name": "Mountain Push", "jp": "山押し", "desc": "+15% push force", "tier": 2, "cost": 2, "effect": {"strength": 0.15}},
+            {"id": "str_3", "name": "Yokozuna Force", "jp": "横綱力", "desc": "+20% push force", "tier": 3, "cost": 3, "effect": {"strength": 0.2}}
+        ]
+    },
+    "technique": {
+        "name": "Technique", "jp": "技", "description": "Grappling skill", "color": "50,150,220",
+        "skills": [
+            {"id": "tech_1", "name": "Quick Hands", "jp": "速手", "desc": "+10% grab speed", "tier": 1, "cost": 1, "effect": {"technique": 0.1}},
+            {"id": "tech_2", "name": "Belt Master", "jp": "帯師", "desc": "+15% grab success", "tier": 2, "cost": 2, "effect": {"technique": 0.15}},
+            {"id": "tech_3", "name": "Kimarite Master", "jp": "決まり手", "desc": "+20% success", "tier": 3, "cost": 3, "effect": {"technique": 0.2}}
+        ]
+    },
+    "speed": {
+        "name": "Speed", "jp": "速", "description": "Movement and reaction", "color": "50,220,100",
+        "skills": [
+            {"id": "spd_1", "name": "Quick Step", "jp": "速歩", "desc": "+10% movement", "tier": 1, "cost": 1, "effect": {"speed": 0.1}},
+            {"id": "spd_2", "name": "Lightning Dash", "jp": "雷走", "desc": "+15% movement", "tier": 2, "cost": 2, "effect": {"speed": 0.15}},
+            {"id": "spd_3", "name": "God Speed", "jp": "神速", "desc": "+20% movement", "tier": 3, "cost": 3, "effect": {"speed": 0.2}}
+        ]
+    }
+}
+
+# Fighting style bonuses, matching the LED app's FIGHTING_STYLES table
+STYLE_BONUSES: Dict[str, Dict[str, float]] = {
+    "oshi_specialist": {"strength": 0.05},
+    "yori_specialist": {"technique": 0.05},
+    "nage_specialist": {"technique": 0.05},
+    "speed_demon": {"speed": 0.05},
+    "grand_champion": {"strength": 0.05, "technique": 0.05, "speed": 0.05},
+}
+
+STAT_KEYS = ("strength", "technique", "speed")
+
+
+def unlocked_skill_ids(unlocked: Iterable[Any]) -> List[str]:
+    """IDs from a wrestler's unlocked_skills ({"skill_id": ...} dicts or bare IDs)."""
+    ids = []
+    for s in unlocked or []:
+        skill_id = (s.get("skill_id") or s.get("id")) if isinstance(s, dict) else s
+        if skill_id:
+            ids.append(skill_id)
+    return ids
+
+
+class SkillCatalog:
+    """
+    A skill tree compiled once: ID index, prerequisite (tier) checks, and the
+    /api/skills response pre-encoded with its ETag.
+    """
+
+    def __init__(self, tree: Dict[str, Dict[str, Any]]):
+        self.tree = tree
+        self.skills: Dict[str, Dict[str, Any]] = {}
+        self._by_tier: Dict[tuple, str] = {}
+
+        for branch_key, branch in tree.items():
+            tiers = sorted(skill["tier"] for skill in branch["skills"])
+            if tiers != list(range(1, len(tiers) + 1)):
+                raise ValueError(f"Branch '{branch_key}' tiers must run 1..n, got {tiers}")
+            for skill in branch["skills"]:
+                if skill["id"] in self.skills:
+                    raise ValueError(f"Duplicate skill id '{skill['id']}'")
+                self.skills[skill["id"]] = {**skill, "branch": branch_key}
+                self._by_tier[(branch_key, skill["tier"])] = skill["id"]
+
+        self.encoded = json.dumps(tree, ensure_ascii=False, separators=(",", ":")).encode()
+        self.etag = '"skills-' + hashlib.sha1(self.encoded).hexdigest()[:16] + '"'
+
+    def get(self, skill_id: str) -> Dict[str, Any]:
+        """Raises KeyError for unknown skills."""
+        return self.skills[skill_id]
+
+    def prerequisite(self, skill_id: str):
+        """ID of the skill that must be unlocked first, or None for tier 1."""
+        skill = self.skills[skill_id]
+        if skill["tier"] == 1:
+            return None
+        return self._by_tier[(skill["branch"], skill["tier"] - 1)]
+
+    def check_unlock(self, skill_id: str, unlocked_ids: Iterable[str]):
+        """Raises KeyError if unknown, ValueError if owned or the prerequisite is missing."""
+        skill = self.get(skill_id)
+        owned = set(unlocked_ids)
+        if skill_id in owned:
+            raise ValueError("Skill already unlocked")
+        required = self.prerequisite(skill_id)
+        if required and required not in owned:
+            raise ValueError(f"Must unlock {self.skills[required]['name']} (tier {skill['tier'] - 1}) first")
+
+    def total_bonuses(self, unlocked_ids: Iterable[str]) -> Dict[str, float]:
+        """Summed stat effects of the given skills (unknown IDs are ignored)."""
+        totals: Dict[str, float] = {}
+        for skill_id in unlocked_ids:
+            skill = self.skills.get(skill_id)
+            if skill is None:
+                continue
+            for stat, value in skill["effect"].items():
+                totals[stat] = totals.get(stat, 0.0) + value
+        return {stat: round(value, 4) for stat, value in totals.items()}
+
+
+CATALOG = SkillCatalog(SKILL_TREE)
+
+
+def effective_stats(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy of a wrestler doc with strength/technique/speed replaced by
+    base * (1 + skill bonuses + fighting style bonus). The originals are kept
+    under "base_stats".
+    """
+    bonuses = dict(data.get("total_bonuses") or CATALOG.total_bonuses(unlocked_skill_ids(data.get("unlocked_skills"))))
+    for stat, value in STYLE_BONUSES.get(data.get("fighting_style") or "", {}).items():
+        bonuses[stat] = bonuses.get(stat, 0.0) + value
+
+    result = dict(data)
+    result["base_stats"] = {stat: float(data.get(stat, 1.0)) for stat in STAT_KEYS}
+    for stat in STAT_KEYS:
+        result[stat] = round(result["base_stats"][stat] * (1.0 + bonuses.get(stat, 0.0)), 4)
+    return result
@@ -0,0 +1,125 @@
+from typing import Callable, Dict, List, Optional, Tuple
+import time
+
+
+class VersionTracker:
+    """
+    Monotonic version stamps for resources that clients poll.
+    Every mutation bumps a single global counter, so a version is also a
+    point in time: "give me everything that changed after version N".
+    The counter is seeded from the wall clock at boot so versions handed
+    out before a restart are always older than anything after it.
+
+    Versions live in this process, so the API must run as a single
+    instance: a second one would serve its own, stale versions. Writers
+    outside the API (scripts) bump the stored counters in
+    app.services.version_sync, and sync_stored() turns those into bumps here.
+    """
+
+    def __init__(self):
+        self.boot_version = int(time.time() * 1000)
+        self._counter = self.boot_version
+        # Maps resource name -> version of its last change
+        self._resources: Dict[str, int] = {}
+        # Maps wrestler id -> version of its last change / deletion
+        self._wrestler_changes: Dict[str, int] = {}
+        self._wrestler_deletions: Dict[str, int] = {}
+        # Called as listener(resource, version) after every bump
+        self._listeners: List[Callable[[str, int], None]] = []
+        # Last seen stored counters (see sync_stored)
+        self._stored: Dict[str, int] = {}
+        # ?since= older than this needs a full resync, and every wrestler counts as
+        # changed at it (outside changes we have no per-id log for)
+        self._resync_before = self.boot_version
+
+    def add_listener(self, listener: Callable[[str, int], None]):
+        """Register a callback fired after each change (e.g. to push notifications)."""
+        self._listeners.append(listener)
+
+    def _next(self) -> int:
+        self._counter += 1
+        return self._counter
+
+    def bump(self, resource: str) -> int:
+        """Mark a resource as changed and return its new version."""
+        version = self._next()
+        self._resources[resource] = version
+        for listener in self._listeners:
+            listener(resource, version)
+        return version
+
+    def sync_stored(self, counters: Dict[str, int]) -> List[str]:
+        """
+        Bump every resource whose stored counter differs from the last one
+        seen. A counter seen for the first time counts as changed too, since
+        a script may have written after this process booted and before the
+        first check. Returns the bumped resources.
+        """
+        changed = [resource for resource, counter in counters.items() if self._stored.get(resource) != counter]
+        self._stored.update(counters)
+        for resource in changed:
+            version = self.bump(resource)
+            if resource == "wrestlers":
+                # Which wrestlers changed is unknown: treat every one as changed now
+                self._resync_before = version
+        return changed
+
+    def version(self, resource: str) -> int:
+        """Version of the last change to a resource (boot version if untouched)."""
+        return self._resources.get(resource, self.boot_version)
+
+    def etag(self, resource: str, variant: str = "") -> str:
+        """Strong ETag for a resource, optionally scoped to a query variant."""
+        suffix = f"-{variant}" if variant else ""
+        return f'"{resource}-{self.version(resource)}{suffix}"'
+
+    # --- Wrestler change log (for ?since= deltas) ---
+
+    def touch_wrestler(self, wrestler_id: str) -> int:
+        """Record that a wrestler document was created or updated."""
+        version = self.bump("wrestlers")
+        wrestler_id = str(wrestler_id)
+        self._wrestler_changes[wrestler_id] = version
+        self._wrestler_deletions.pop(wrestler_id, None)
+        return version
+
+    def delete_wrestler(self, wrestler_id: str) -> int:
+        """Record that a wrestler document was deleted."""
+        version = self.bump("wrestlers")
+        wrestler_id = str(wrestler_id)
+        self._wrestler_deletions[wrestler_id] = version
+        self._wrestler_changes.pop(wrestler_id, None)
+        return version
+
+    def wrestler_version(self, wrestler_id: str) -> int:
+        """
+        Version of a wrestler's last change or deletion, or of the last
+        outside roster change (boot version if untouched).
+        """
+        wrestler_id = str(wrestler_id)
+        return max(self._wrestler_changes.get(wrestler_id, self._resync_before),
+                   self._wrestler_deletions.get(wrestler_id, self._resync_before),
+                   self._resync_before)
+
+    def wrestler_changes_since(self, since: int) -> Optional[Tuple[List[str], List[str]]]:
+        """
+        Returns (changed_ids, deleted_ids) after `since`, or None when the
+        version predates this process (or an outside change) and the client
+        needs a full resync.
+        """
+        if since < self._resync_before:
+            return None
+        changed = [w_id for w_id, v in self._wrestler_changes.items() if v > since]
+        deleted = [w_id for w_id, v in self._wrestler_deletions.items() if v > since]
+        return changed, deleted
+
+
+def if_none_match(header: Optional[str], etag: str) -> bool:
+    """True if an If-None-Match header value matches the given ETag."""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in header.split(",")]
+    # Weak comparison: W/"x" matches "x" for GET revalidation
+    return any(tag == etag or tag == f"W/{etag}" for tag in candidates)
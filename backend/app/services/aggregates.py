@@ -0,0 +1,121 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from google.cloud import firestore as firestore_module
+
+# Incrementally maintained aggregates, updated once per ranked match:
+#   wrestler_stats/{wrestler_id}   career totals
+#   head_to_head/{low_id}__{high_id}  pair record (ids sorted so A-B == B-A)
+WRESTLER_STATS = "wrestler_stats"
+HEAD_TO_HEAD = "head_to_head"
+
+
+def pair_key(a_id: str, b_id: str) -> Tuple[str, str, str]:
+    """Returns (doc_id, low_id, high_id) for an unordered wrestler pair."""
+    low, high = sorted((str(a_id), str(b_id)))
+    return f"{low}__{high}", low, high
+
+
+def match_contributions(summary: Dict[str, Any], events: List[Dict[str, Any]],
+                        p1_id: str, p2_id: str, winner_id: str) -> Tuple[Dict[str, Dict[str, float]], Dict[str, float]]:
+    """
+    Counter increments contributed by one finished match.
+    Returns ({wrestler_id: {field: delta}}, {pair_field: delta}).
+    """
+    p1_id, p2_id, winner_id = str(p1_id), str(p2_id), str(winner_id)
+    duration = float(summary.get("duration_seconds") or 0.0)
+    side_ids = {"p1": p1_id, "p2": p2_id}
+
+    per_wrestler: Dict[str, Dict[str, float]] = {}
+    for side, w_id in side_ids.items():
+        per_wrestler[w_id] = {
+            "bouts": 1,
+            "wins": 1 if w_id == winner_id else 0,
+            "losses": 0 if w_id == winner_id else 1,
+            "total_duration": duration,
+            "pushes": summary.get(f"{side}_push_count", 0),
+            "counters": 0,
+            "clashes": 0,
+        }
+    for event in events:
+        w_id = side_ids.get(event.get("player"))
+        if w_id is None:
+            continue
+        if event.get("type") == "counter":
+            per_wrestler[w_id]["counters"] += 1
+        elif event.get("type") == "clash":
+            per_wrestler[w_id]["clashes"] += 1
+
+    _, low, high = pair_key(p1_id, p2_id)
+    pair = {
+        "bouts": 1,
+        f"wins.{low}": 1 if winner_id == low else 0,
+        f"wins.{high}": 1 if winner_id == high else 0,
+        "total_duration": duration,
+    }
+    return per_wrestler, pair
+
+
+def record_match_aggregates(db, match_id: str, summary: Dict[str, Any], events: List[Dict[str, Any]],
+                            p1_id: str, p2_id: str, winner_id: str):
+    """Apply one match's contributions with server-side increments (no reads)."""
+    per_wrestler, pair = match_contributions(summary, events, p1_id, p2_id, winner_id)
+    batch = db.batch()
+
+    for w_id, deltas in per_wrestler.items():
+        ref = db.collection(WRESTLER_STATS).document(w_id)
+        fields = {k: firestore_module.Increment(v) for k, v in deltas.items() if v}
+        fields["last_match_id"] = match_id
+        batch.set(ref, fields, merge=True)
+
+    doc_id, low, high = pair_key(p1_id, p2_id)
+    pair_fields: Dict[str, Any] = {"a_id": low, "b_id": high, "last_match_id": match_id,
+                                   "last_winner_id": str(winner_id)}
+    wins: Dict[str, Any] = {}
+    for key, value in pair.items():
+        if key.startswith("wins."):
+            if value:
+                wins[key[len("wins."):]] = firestore_module.Increment(value)
+        else:
+            pair_fields[key] = firestore_module.Increment(value)
+    if wins:
+        pair_fields["wins"] = wins
+    batch.set(db.collection(HEAD_TO_HEAD).document(doc_id), pair_fields, merge=True)
+
+    batch.commit()
+
+
+def career_stats(data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Totals plus derived rates for a wrestler_stats doc (zeros if missing)."""
+    data = data or {}
+    bouts = data.get("bouts", 0)
+    pushes = data.get("pushes", 0)
+    return {
+        "bouts": bouts,
+        "wins": data.get("wins", 0),
+        "losses": data.get("losses", 0),
+        "pushes": pushes,
+        "counters": data.get("counters", 0),
+        "clashes": data.get("clashes", 0),
+        "win_rate": round(data.get("wins", 0) / bouts, 3) if bouts else 0.0,
+        "avg_duration": round(data.get("total_duration", 0.0) / bouts, 2) if bouts else 0.0,
+        "avg_pushes": round(pushes / bouts, 1) if bouts else 0.0,
+        "counter_rate": round(data.get("counters", 0) / pushes, 3) if pushes else 0.0,
+        "last_match_id": data.get("last_match_id"),
+    }
+
+
+def head_to_head(data: Optional[Dict[str, Any]], a_id: str, b_id: str) -> Dict[str, Any]:
+    """A pair doc oriented from a_id's point of view."""
+    data = data or {}
+    wins = data.get("wins", {})
+    bouts = data.get("bouts", 0)
+    return {
+        "a_id": str(a_id),
+        "b_id": str(b_id),
+        "bouts": bouts,
+        "a_wins": wins.get(str(a_id), 0),
+        "b_wins": wins.get(str(b_id), 0),
+        "avg_duration": round(data.get("total_duration", 0.0) / bouts, 2) if bouts else 0.0,
+        "last_match_id": data.get("last_match_id"),
+        "last_winner_id": data.get("last_winner_id"),
+    }
@@ -0,0 +1,87 @@
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime
+import base64
+import json
+
+from google.cloud import firestore as firestore_module
+
+# Match kinds, derived from the match ID prefix at save time
+KIND_RANKED = "ranked"   # m-*   (real lobby / controller matches)
+KIND_SIM = "sim"         # sim-* (automated physics tests)
+KIND_DEMO = "demo"       # demo-* (watch page background demo)
+
+MAX_HISTORY_LIMIT = 100
+
+
+def match_kind(match_id: str) -> str:
+    """Classify a match by its ID prefix."""
+    if match_id.startswith("sim-"):
+        return KIND_SIM
+    if match_id.startswith("demo-"):
+        return KIND_DEMO
+    return KIND_RANKED
+
+
+def index_fields(match_id: str, p1_id: str, p2_id: str) -> Dict[str, Any]:
+    """Fields that make a match doc queryable by participant and kind."""
+    return {
+        "participants": [str(p1_id), str(p2_id)],
+        "kind": match_kind(match_id),
+    }
+
+
+def encode_cursor(timestamp: datetime, doc_id: str) -> str:
+    """Opaque cursor for the position after (timestamp, doc_id)."""
+    raw = json.dumps({"t": timestamp.isoformat(), "id": doc_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Inverse of encode_cursor. Raises ValueError on malformed input."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(data["t"]), str(data["id"])
+    except (KeyError, TypeError, json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+
+
+def query_history(
+    db,
+    wrestler_id: Optional[str] = None,
+    kind: str = KIND_RANKED,
+    limit: int = 10,
+    after: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Newest-first match history, filtered by kind and (optionally) participant.
+    Every filter runs in Firestore against a composite index, so a page costs
+    exactly `limit` reads. Returns (matches, next_cursor); next_cursor is None
+    on the last page.
+    """
+    limit = max(1, min(limit, MAX_HISTORY_LIMIT))
+    matches_ref = db.collection('matches')
+
+    query = matches_ref.where(filter=firestore_module.FieldFilter('kind', '==', kind))
+    if wrestler_id:
+        query = query.where(filter=firestore_module.FieldFilter('participants', 'array_contains', str(wrestler_id)))
+    query = (
+        query.order_by('timestamp', direction=firestore_module.Query.DESCENDING)
+        .order_by('__name__', direction=firestore_module.Query.DESCENDING)
+    )
+    if after:
+        after_ts, after_id = decode_cursor(after)
+        query = query.start_after([after_ts, matches_ref.document(after_id)])
+
+    matches = []
+    last_doc = None
+    for doc in query.limit(limit).stream():
+        data = doc.to_dict()
+        data['id'] = doc.id
+        matches.append(data)
+        last_doc = data
+
+    next_cursor = None
+    if len(matches) == limit and last_doc and last_doc.get('timestamp'):
+        next_cursor = encode_cursor(last_doc['timestamp'], last_doc['id'])
+    return matches, next_cursor
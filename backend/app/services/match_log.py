@@ -0,0 +1,65 @@
+from typing import Any, Dict, Iterator, List
+import json
+import zlib
+
+# Event logs live outside the summary doc, in matches/{id}/log/{chunk}.
+# Each chunk holds a slice of one zlib stream over newline-delimited JSON,
+# kept well under Firestore's 1 MiB document limit.
+LOG_SUBCOLLECTION = "log"
+LOG_ENCODING = "zlib+ndjson"
+CHUNK_BYTES = 900 * 1024
+
+
+def compress_events(events: List[Dict[str, Any]]) -> List[bytes]:
+    """Compress an event list into one or more chunk payloads."""
+    ndjson = "".join(json.dumps(event, separators=(",", ":")) + "\n" for event in events)
+    blob = zlib.compress(ndjson.encode(), 6)
+    return [blob[i:i + CHUNK_BYTES] for i in range(0, len(blob), CHUNK_BYTES)] or [b""]
+
+
+def iter_events(chunks: Iterator[bytes]) -> Iterator[Dict[str, Any]]:
+    """Decompress chunk payloads incrementally, yielding one event at a time."""
+    decompressor = zlib.decompressobj()
+    pending = b""
+    for chunk in chunks:
+        pending += decompressor.decompress(chunk)
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            if line:
+                yield json.loads(line)
+    pending += decompressor.flush()
+    for line in pending.split(b"\n"):
+        if line:
+            yield json.loads(line)
+
+
+def save_match_log(db, match_id: str, events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Write a match's event log as compressed chunks.
+    Returns the fields to merge into the summary doc.
+    """
+    chunks = compress_events(events)
+    log_ref = db.collection('matches').document(match_id).collection(LOG_SUBCOLLECTION)
+    batch = db.batch()
+    for index, payload in enumerate(chunks):
+        batch.set(log_ref.document(f"{index:04d}"), {"index": index, "data": payload})
+    batch.commit()
+    return {
+        "event_count": len(events),
+        "log_chunks": len(chunks),
+        "log_encoding": LOG_ENCODING,
+    }
+
+
+def stream_match_log(db, match_id: str, summary: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Yield a match's events, reading log chunks from Firestore only as needed."""
+    if "events" in summary:
+        # Legacy doc with the log embedded in the summary
+        yield from summary["events"]
+        return
+    if not summary.get("log_chunks"):
+        return
+
+    log_ref = db.collection('matches').document(match_id).collection(LOG_SUBCOLLECTION)
+    chunk_docs = log_ref.order_by("index").stream()
+    yield from iter_events(doc.to_dict()["data"] for doc in chunk_docs)
@@ -0,0 +1,30 @@
+"""
+Cross-process invalidation for VersionTracker.
+
+The API's versions live in its own process (see app.core.versions). Writers
+outside it, such as the backfill and rebuild scripts, bump a per-resource
+counter on the meta/versions document instead. The API reads that document
+at most every POLL_SECONDS and turns a changed counter into a local bump,
+so clients stop getting 304s for data a script rewrote.
+"""
+from typing import Dict
+
+from google.cloud import firestore as firestore_module
+
+VERSIONS_COLLECTION = "meta"
+VERSIONS_DOC = "versions"
+POLL_SECONDS = 5.0
+
+
+def bump_stored_versions(db, *resources: str) -> None:
+    """Record that this process changed `resources` behind the API's back."""
+    db.collection(VERSIONS_COLLECTION).document(VERSIONS_DOC).set(
+        {resource: firestore_module.Increment(1) for resource in resources}, merge=True)
+
+
+def read_stored_versions(db) -> Dict[str, int]:
+    """Current counters, {} if nothing has been bumped yet."""
+    doc = db.collection(VERSIONS_COLLECTION).document(VERSIONS_DOC).get()
+    if not doc.exists:
+        return {}
+    return {key: value for key, value in (doc.to_dict() or {}).items() if isinstance(value, int)}
@@ -0,0 +1,144 @@
+from typing import Any, Dict, List, Optional, Tuple
+import base64
+import json
+
+from google.cloud import firestore as firestore_module
+
+# Named projections. "picker" is what the controller needs to render a roster.
+VIEWS: Dict[str, List[str]] = {
+    "picker": [
+        "name", "custom_name", "color", "avatar_seed", "stable", "rank_name", "rank_index",
+        "wins", "losses", "matches", "strength", "technique", "speed", "is_active", "rating",
+    ],
+}
+
+# Fields a caller may project explicitly with ?fields=
+ALLOWED_FIELDS = set(VIEWS["picker"]) | {
+    "height", "weight", "xp", "skill_points", "win_streak", "rank_jp", "bio",
+    "unlocked_skills", "total_bonuses", "fighting_style", "search_name", "rated_matches",
+}
+
+# sort name -> (field, direction). "id" (document order) works on every doc and any
+# mix of equality filters; the others have one composite index per filter in
+# web/firestore.indexes.json and skip docs that lack the field.
+SORTS: Dict[str, Tuple[str, str]] = {
+    "id": ("__name__", firestore_module.Query.ASCENDING),
+    "name": ("search_name", firestore_module.Query.ASCENDING),
+    "xp": ("xp", firestore_module.Query.DESCENDING),
+    "wins": ("wins", firestore_module.Query.DESCENDING),
+}
+
+MAX_PAGE_SIZE = 200
+
+
+def search_name(data: Dict[str, Any]) -> str:
+    """Lower-cased display name, the field name-prefix search runs on."""
+    return (data.get("custom_name") or data.get("name") or "").strip().lower()
+
+
+def resolve_fields(view: Optional[str], fields: Optional[str]) -> Optional[List[str]]:
+    """Projection for a request, or None for whole docs. Raises ValueError on unknown names."""
+    if fields:
+        requested = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = [f for f in requested if f not in ALLOWED_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        return requested
+    if view and view != "full":
+        if view not in VIEWS:
+            raise ValueError(f"Unknown view '{view}'")
+        return list(VIEWS[view])
+    return None
+
+
+def encode_cursor(value: Any, doc_id: str) -> str:
+    """Opaque cursor for the position after (sort value, doc_id)."""
+    raw = json.dumps({"v": value, "id": doc_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, str]:
+    """Inverse of encode_cursor. Raises ValueError on malformed input."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return data["v"], str(data["id"])
+    except (KeyError, TypeError, json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+
+
+def validate_query(
+    stable: Optional[str] = None,
+    rank: Optional[int] = None,
+    active: Optional[bool] = None,
+    prefix: Optional[str] = None,
+    sort: str = "name",
+) -> None:
+    """Reject filter/sort mixes Firestore has no index for. Raises ValueError."""
+    if sort not in SORTS:
+        raise ValueError(f"Unknown sort '{sort}' (use one of: {', '.join(SORTS)})")
+    if prefix and sort != "name":
+        raise ValueError("Name prefix search only supports sort=name")
+    filters = sum(f is not None for f in (stable, rank, active))
+    if filters > 1 and sort != "id":
+        raise ValueError("Combining stable/rank/active filters only supports sort=id")
+
+
+def query_wrestlers(
+    db,
+    fields: Optional[List[str]] = None,
+    stable: Optional[str] = None,
+    rank: Optional[int] = None,
+    active: Optional[bool] = None,
+    prefix: Optional[str] = None,
+    sort: str = "name",
+    limit: int = 50,
+    after: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    One page of wrestlers, filtered, sorted and projected in Firestore.
+    Returns (wrestlers, next_cursor); next_cursor is None on the last page.
+    """
+    validate_query(stable, rank, active, prefix, sort)
+    sort_field, direction = SORTS[sort]
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    wrestlers_ref = db.collection('wrestlers')
+    query = wrestlers_ref
+    if stable is not None:
+        query = query.where(filter=firestore_module.FieldFilter('stable', '==', stable))
+    if rank is not None:
+        query = query.where(filter=firestore_module.FieldFilter('rank_index', '==', rank))
+    if active is not None:
+        query = query.where(filter=firestore_module.FieldFilter('is_active', '==', active))
+    if prefix:
+        prefix = prefix.strip().lower()
+        query = query.where(filter=firestore_module.FieldFilter('search_name', '>=', prefix))
+        query = query.where(filter=firestore_module.FieldFilter('search_name', '<', prefix + "\uf8ff"))
+
+    by_id = sort_field == '__name__'
+    query = query.order_by(sort_field, direction=direction)
+    if not by_id:
+        query = query.order_by('__name__', direction=direction)
+    if fields is not None:
+        # The sort field is always read so the next cursor can be built
+        query = query.select(sorted(set(fields) | ({sort_field} - {'__name__'})))
+    if after:
+        after_value, after_id = decode_cursor(after)
+        after_ref = wrestlers_ref.document(after_id)
+        query = query.start_after([after_ref] if by_id else [after_value, after_ref])
+
+    wrestlers = []
+    last_value = None
+    for doc in query.limit(limit).stream():
+        data = doc.to_dict()
+        last_value = None if by_id else data.get(sort_field)
+        if fields is not None and sort_field not in fields:
+            data.pop(sort_field, None)
+        data['id'] = doc.id
+        wrestlers.append(data)
+
+    next_cursor = None
+    if len(wrestlers) == limit:
+        next_cursor = encode_cursor(last_value, wrestlers[-1]['id'])
+    return wrestlers, next_cursor
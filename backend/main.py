@@ -1,15 +1,37 @@
 import asyncio
+import hashlib
+import json
+import os
 import time
 import random
-from typing import Dict, List
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 from google.cloud import firestore as firestore_module
 
 # Import our new Engine and Services
+from app.core.control import ControlChannel
 from app.core.engine import SumoEngine
+from app.core.leaderboard import Leaderboard
+from app.core.live_odds import LiveOddsTable
+from app.core.matchmaking import MatchmakingQueue
+from app.core.odds import OddsTable, run_batch
+from app.core.prefetch import WrestlerPrefetchCache
+from app.core.rating import DEFAULT_RATING, elo_update
+from app.core.rooms import RoomRegistry
+from app.core.skills import CATALOG, effective_stats, unlocked_skill_ids
+from app.core.versions import VersionTracker, if_none_match
+from app.services.aggregates import HEAD_TO_HEAD, WRESTLER_STATS, career_stats, head_to_head, pair_key, record_match_aggregates
 from app.services.firebase import get_db
+from app.services.match_history import KIND_RANKED, index_fields, match_kind, query_history
+from app.services.match_log import save_match_log, stream_match_log
+from app.services.version_sync import POLL_SECONDS as STORED_VERSIONS_POLL_SECONDS, read_stored_versions
+from app.services.wrestler_query import decode_cursor as decode_wrestler_cursor, query_wrestlers, resolve_fields, search_name, validate_query
 
 app = FastAPI(title="Sumo Serverless API")
 
@@ -39,11 +61,50 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
 # --- Constants ---
 MATCH_STALE_TIMEOUT_SECONDS = 300  # 5 minutes - matches older than this without activity are dead
 
+# Version stamps for polled resources ("wrestlers", "lobby", "matches")
+versions = VersionTracker()
+leaderboard = Leaderboard()
+# Memory-mapped in-bout win probability (None until scripts/build_live_odds.py has been run)
+live_odds = LiveOddsTable.load()
+# Push channel mirroring those resources (/ws/control)
+control = ControlChannel()
+
+def conditional_json(request: Request, etag: str, build: Callable[[], object]) -> Response:
+    """Return 304 if the client already holds `etag`, else the JSON built by `build`."""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if if_none_match(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=build(), headers=headers)
+
+_stored_versions_read_at = float("-inf")
+
+def _sync_stored_versions():
+    """
+    Pick up bumps from writers outside the API (scripts), at most every
+    POLL_SECONDS. A roster change also drops the leaderboard; prefetched
+    match data goes stale through versions.wrestler_version().
+    """
+    global _stored_versions_read_at
+    now = time.monotonic()
+    if now - _stored_versions_read_at < STORED_VERSIONS_POLL_SECONDS:
+        return
+    _stored_versions_read_at = now
+    try:
+        changed = versions.sync_stored(read_stored_versions(get_db()))
+    except Exception as e:
+        print(f"[Versions] Stored version check failed: {e}")
+        return
+    if "wrestlers" in changed:
+        leaderboard.invalidate()
+    if changed:
+        print(f"[Versions] Changed outside the API: {', '.join(changed)}")
+
 # --- In-Memory State Manager ---
 class MatchManager:
     def __init__(self):
@@ -53,6 +114,9 @@ class MatchManager:
         self.connections: Dict[str, List[WebSocket]] = {}
         # Maps match_id -> last activity timestamp
         self.match_timestamps: Dict[str, float] = {}
+        # The one lobby / direct / simulation match (created exclusive=True). Room and
+        # matchmade matches run beside it and are never replaced by it.
+        self.legacy_match_id: Optional[str] = None
 
     def is_match_stale(self, match_id: str) -> bool:
         """Check if a match is stale (no activity for too long)"""
@@ -61,47 +125,63 @@ class MatchManager:
         age = time.time() - self.match_timestamps[match_id]
         return age > MATCH_STALE_TIMEOUT_SECONDS
 
+    def _remove_match(self, match_id: str) -> None:
+        """Forget a match; its game loop sees it is gone and stops without saving."""
+        if match_id in self.matches:
+            del self.matches[match_id]
+        if match_id in self.connections:
+            del self.connections[match_id]
+        if match_id in self.match_timestamps:
+            del self.match_timestamps[match_id]
+        if match_id == self.legacy_match_id:
+            self.legacy_match_id = None
+
+    def legacy_match(self) -> Optional[Tuple[str, SumoEngine]]:
+        """(match_id, engine) of the lobby/direct match, if one is in memory."""
+        if self.legacy_match_id in self.matches:
+            return self.legacy_match_id, self.matches[self.legacy_match_id]
+        return None
+
     def cleanup_stale_matches(self):
         """Remove any stale matches"""
         stale_ids = [mid for mid in self.matches if self.is_match_stale(mid)]
         for match_id in stale_ids:
             print(f"[MatchManager] Cleaning up stale match: {match_id}")
-            if match_id in self.matches:
-                del self.matches[match_id]
-            if match_id in self.connections:
-                del self.connections[match_id]
-            if match_id in self.match_timestamps:
-                del self.match_timestamps[match_id]
+            self._remove_match(match_id)
+        if stale_ids:
+            versions.bump("matches")
 
     def clear_all_matches(self):
-        """Clear all existing matches (MVP: only one match at a time)"""
+        """Clear all existing matches, rooms and matchmade ones included (admin reset)"""
         for match_id in list(self.matches.keys()):
-            if match_id in self.matches:
-                del self.matches[match_id]
-            if match_id in self.connections:
-                del self.connections[match_id]
-            if match_id in self.match_timestamps:
-                del self.match_timestamps[match_id]
+            self._remove_match(match_id)
+        versions.bump("matches")
         print(f"[MatchManager] Cleared all matches. Starting fresh.")
 
-    async def create_match(self, match_id: str, p1_id: str, p2_id: str, simulation_mode: bool = False):
-        # MVP: Clear any existing matches before starting new one
-        self.clear_all_matches()
+    def stop_legacy_match(self):
+        """Drop the current lobby/direct match, leaving room and matchmade matches running."""
+        if self.legacy_match_id is not None:
+            print(f"[MatchManager] Replacing lobby match {self.legacy_match_id}")
+            self._remove_match(self.legacy_match_id)
+            versions.bump("matches")
+
+    async def create_match(self, match_id: str, p1_id: str, p2_id: str, simulation_mode: bool = False,
+                           exclusive: bool = True):
+        # MVP: one lobby/direct match at a time, so a new one replaces the last.
+        # Room and matchmade matches (exclusive=False) run side by side and are left alone.
+        if exclusive:
+            self.stop_legacy_match()
+        _sync_stored_versions()  # Don't start a bout on data a script has since rewritten
         
         try:
-            # 1. Fetch REAL Data from Firestore
-            db = get_db()
-            p1_ref = db.collection('wrestlers').document(p1_id).get()
-            p2_ref = db.collection('wrestlers').document(p2_id).get()
+            # 1. REAL Data: usually already prefetched at lobby join, else both fetched concurrently
+            p1_data, p2_data = await asyncio.gather(match_data.get(p1_id), match_data.get(p2_id))
     
-            if not p1_ref.exists or not p2_ref.exists:
+            if p1_data is None or p2_data is None:
                 if simulation_mode:
                      raise Exception("Wrestlers not found, falling back to mock")
                 else:
                     raise HTTPException(status_code=404, detail="One or more wrestlers not found in DB")
-    
-            p1_data = p1_ref.to_dict()
-            p2_data = p2_ref.to_dict()
             
         except Exception as e:
             if simulation_mode:
@@ -127,6 +207,12 @@ class MatchManager:
         self.matches[match_id] = engine
         self.connections[match_id] = []
         self.match_timestamps[match_id] = time.time()  # Track creation time
+        if exclusive:
+            self.legacy_match_id = match_id
+        versions.bump("matches")
+        if exclusive:
+            # Only the lobby/direct match is the one the TV follows; room and queue bouts aren't
+            control.publish("match_started", {"match_id": match_id, "p1_id": p1_id, "p2_id": p2_id})
         
         print(f"[MatchManager] Match {match_id} CREATED. P1={p1_id}, P2={p2_id}, Sim={simulation_mode}")
         
@@ -167,11 +253,17 @@ class MatchManager:
         """Standard 60 FPS Loop"""
         engine = self.matches[match_id]
         while not engine.game_over:
+            if self.matches.get(match_id) is not engine:
+                # Replaced or cleared mid-bout: stop ticking, nothing to save
+                print(f"[MatchManager] Match {match_id} was removed, stopping its loop")
+                return
             start_time = asyncio.get_event_loop().time()
             
             try:
                 # Tick Physics
                 state = engine.tick(1/60.0)
+                if live_odds is not None:
+                    state["p1_win_prob"] = live_odds.p1_win(state)
                 
                 # Update activity timestamp
                 self.match_timestamps[match_id] = time.time()
@@ -190,9 +282,17 @@ class MatchManager:
             sleep_time = max(0, (1/60.0) - elapsed)
             await asyncio.sleep(sleep_time)
             
+        # Match is over: /api/status flips back to IDLE
+        versions.bump("matches")
+
         # Broadcast Final State
         final_state = engine.get_state()
         await self.broadcast(match_id, final_state)
+        control.publish("match_ended", {
+            "match_id": match_id,
+            "winner": final_state.get('winner'),
+            "winner_name": final_state.get('winner_name'),
+        })
         
         # Save Match Result to Firestore (wrapped in try/except for robustness)
         try:
@@ -205,16 +305,27 @@ class MatchManager:
             loser_id = p2_id if winner_id == p1_id else p1_id
             
             # Update wrestler stats (wins/losses/XP/SP)
-            await update_wrestler_stats(winner_id, loser_id)
+            await update_wrestler_stats(winner_id, loser_id, rated=match_kind(match_id) == KIND_RANKED)
             
+            # Event log goes to compressed chunks; the summary doc stays small for listing
+            summary = engine.get_match_summary()
+            events = summary.pop("events")
+            log_fields = save_match_log(db, match_id, events)
+
             db.collection('matches').document(match_id).set({
-                **engine.get_match_summary(),  # Full event log
+                **summary,
+                **log_fields,
                 "winner_id": winner_id,
                 "loser_id": loser_id,
                 "p1_id": p1_id,
                 "p2_id": p2_id,
+                **index_fields(match_id, p1_id, p2_id),  # participants + kind for indexed history
                 "timestamp": firestore_module.SERVER_TIMESTAMP,
             })
+
+            # Career + head-to-head aggregates (ranked only), so reads never scan history
+            if match_kind(match_id) == KIND_RANKED:
+                record_match_aggregates(db, match_id, summary, events, p1_id, p2_id, winner_id)
             print(f"[MatchManager] Match {match_id} saved with {len(engine.match_log)} events. Winner: {winner_id}")
         except Exception as e:
             # In simulation mode without creds, this is expected. Don't spam trace.
@@ -233,6 +344,7 @@ class MatchManager:
         if match_id in self.matches:
             print(f"[MatchManager] cleanup: Removing match {match_id} from memory")
             del self.matches[match_id]
+            versions.bump("matches")
         if match_id in self.match_timestamps:
             del self.match_timestamps[match_id]
         print(f"[MatchManager] Match {match_id} cleaned up successfully")
@@ -243,6 +355,15 @@ class MatchManager:
 
 manager = MatchManager()
 
+def _load_match_wrestler(w_id: str) -> Optional[dict]:
+    """Read a wrestler and fold skill + style bonuses into its stats (blocking)."""
+    doc = get_db().collection('wrestlers').document(w_id).get()
+    if not doc.exists:
+        return None
+    return effective_stats(doc.to_dict())
+
+match_data = WrestlerPrefetchCache(_load_match_wrestler, versions.wrestler_version)
+
 class LobbyManager:
     """Simple in-memory lobby for 2-player setup"""
     def __init__(self):
@@ -252,6 +373,11 @@ class LobbyManager:
         self.p1 = None  # {id, name, ready}
         self.p2 = None
         self.locked = False
+        versions.bump("lobby")
+
+    def lock(self):
+        self.locked = True
+        versions.bump("lobby")
         
     def get_status(self):
         return {
@@ -270,20 +396,37 @@ class LobbyManager:
             self.p1 = data
         elif side == "p2":
             self.p2 = data
+        versions.bump("lobby")
+        # Warm the match data now so /api/lobby/start doesn't wait on storage
+        match_data.prefetch(wrestler_id)
         return True
 
 lobby_manager = LobbyManager()
 
 
 # --- Wrestler Stats Update Function ---
-async def update_wrestler_stats(winner_id: str, loser_id: str):
-    """Update wrestler records after a match ends."""
+async def update_wrestler_stats(winner_id: str, loser_id: str, rated: bool = True):
+    """Update wrestler records after a match ends. Ratings only move for `rated` bouts."""
     try:
         db = get_db()
-        
-        # Update winner
         winner_ref = db.collection('wrestlers').document(winner_id)
+        loser_ref = db.collection('wrestlers').document(loser_id)
         winner_doc = winner_ref.get()
+        loser_doc = loser_ref.get()
+
+        # Elo needs both pre-match ratings, so both docs are read before either write
+        rating_fields = {winner_id: {}, loser_id: {}}
+        if rated and winner_doc.exists and loser_doc.exists:
+            w_prev = winner_doc.to_dict()
+            l_prev = loser_doc.to_dict()
+            w_rated = w_prev.get("rated_matches", 0)
+            l_rated = l_prev.get("rated_matches", 0)
+            new_w_rating, new_l_rating = elo_update(
+                w_prev.get("rating", DEFAULT_RATING), l_prev.get("rating", DEFAULT_RATING), w_rated, l_rated)
+            rating_fields[winner_id] = {"rating": round(new_w_rating, 1), "rated_matches": w_rated + 1}
+            rating_fields[loser_id] = {"rating": round(new_l_rating, 1), "rated_matches": l_rated + 1}
+
+        # Update winner
         if winner_doc.exists:
             w_data = winner_doc.to_dict()
             new_wins = w_data.get("wins", 0) + 1
@@ -306,13 +449,15 @@ async def update_wrestler_stats(winner_id: str, loser_id: str):
                 "win_streak": new_streak,
                 "rank_index": new_rank_index,
                 "rank_name": WRESTLER_RANKS[new_rank_index]["name"],
-                "rank_jp": WRESTLER_RANKS[new_rank_index]["jp"]
+                "rank_jp": WRESTLER_RANKS[new_rank_index]["jp"],
+                **rating_fields[winner_id],
             })
+            versions.touch_wrestler(winner_id)
+            leaderboard.upsert(winner_id, {**w_data, "wins": new_wins, "xp": new_xp,
+                                           "rank_name": WRESTLER_RANKS[new_rank_index]["name"]})
             print(f"[Stats] Winner {winner_id}: +{XP_BASE_WIN}XP, +{SP_WIN}SP, Streak:{new_streak}, Rank:{WRESTLER_RANKS[new_rank_index]['name']}")
         
         # Update loser
-        loser_ref = db.collection('wrestlers').document(loser_id)
-        loser_doc = loser_ref.get()
         if loser_doc.exists:
             l_data = loser_doc.to_dict()
             new_losses = l_data.get("losses", 0) + 1
@@ -334,8 +479,12 @@ async def update_wrestler_stats(winner_id: str, loser_id: str):
                 "win_streak": 0,  # Reset streak on loss
                 "rank_index": new_rank_index,
                 "rank_name": WRESTLER_RANKS[new_rank_index]["name"],
-                "rank_jp": WRESTLER_RANKS[new_rank_index]["jp"]
+                "rank_jp": WRESTLER_RANKS[new_rank_index]["jp"],
+                **rating_fields[loser_id],
             })
+            versions.touch_wrestler(loser_id)
+            leaderboard.upsert(loser_id, {**l_data, "losses": new_losses, "xp": new_xp,
+                                          "rank_name": WRESTLER_RANKS[new_rank_index]["name"]})
             print(f"[Stats] Loser {loser_id}: +{XP_BASE_LOSS}XP, +{SP_LOSS}SP")
             
     except Exception as e:
@@ -362,25 +511,23 @@ class ActionRequest(BaseModel):
 async def root():
     return {"status": "online", "service": "Sumo Cloud Backend", "region": "global"}
 
+def _current_status():
+    # Only the lobby/direct match: room and matchmade bouts belong to their own clients
+    legacy = manager.legacy_match()
+    if legacy is not None and not legacy[1].game_over:
+        return {"status": "FIGHTING", "match_id": legacy[0]}
+    return {"status": "IDLE"}
+
 @app.get("/api/status")
-async def get_status():
+async def get_status(request: Request):
     """Returns the current game status for the controller to poll."""
     # Auto-cleanup stale matches first
     manager.cleanup_stale_matches()
-    
-    if manager.matches:
-        # Check if any match is still running (not game_over)
-        for match_id, engine in manager.matches.items():
-            if not engine.game_over:
-                return {"status": "FIGHTING", "match_id": match_id}
-        return {"status": "IDLE"}
-    return {"status": "IDLE"}
+    return conditional_json(request, versions.etag("matches", "status"), _current_status)
 
 # --- Wrestler CRUD (Restored & Adapted for Firestore) ---
 
-@app.get("/api/wrestlers")
-async def get_wrestlers():
-    db = get_db()
+def _list_wrestlers(db) -> List[dict]:
     docs = db.collection('wrestlers').stream()
     # Convert to list
     wrestlers = []
@@ -390,6 +537,84 @@ async def get_wrestlers():
         wrestlers.append(d)
     return wrestlers
 
+def _wrestlers_delta(db, since: int) -> dict:
+    """Wrestlers changed after `since`, or the full roster if `since` is too old."""
+    version = versions.version("wrestlers")
+    delta = versions.wrestler_changes_since(since)
+    if delta is None:
+        return {"version": version, "full": True, "wrestlers": _list_wrestlers(db), "deleted": []}
+
+    changed_ids, deleted_ids = delta
+    wrestlers = []
+    if changed_ids:
+        refs = [db.collection('wrestlers').document(w_id) for w_id in changed_ids]
+        for doc in db.get_all(refs):
+            if doc.exists:
+                d = doc.to_dict()
+                d['id'] = doc.id
+                wrestlers.append(d)
+    return {"version": version, "full": False, "wrestlers": wrestlers, "deleted": deleted_ids}
+
+@app.get("/api/wrestlers")
+async def get_wrestlers(request: Request, since: Optional[int] = None,
+                        view: Optional[str] = None, fields: Optional[str] = None,
+                        stable: Optional[str] = None, rank: Optional[int] = None,
+                        active: Optional[bool] = None, prefix: Optional[str] = None,
+                        sort: Optional[str] = None, limit: Optional[int] = None,
+                        after: Optional[str] = None):
+    """
+    List wrestlers. Supports If-None-Match revalidation, and `?since=<version>`
+    which returns only wrestlers changed after that version:
+    {"version", "full", "wrestlers", "deleted"}.
+
+    Any of view/fields/stable/rank/active/prefix/sort/limit/after switches to
+    an indexed query page instead: `view=picker` (or `fields=a,b`) projects,
+    `prefix` matches the start of the display name, and the X-Next-Cursor
+    response header goes back as `?after=` for the next page. `since` can't
+    be combined with those, and filter/sort mixes without an index are a 400.
+    """
+    query_params = (view, fields, stable, rank, active, prefix, sort, limit, after)
+    if any(p is not None for p in query_params):
+        if since is not None:
+            raise HTTPException(status_code=400, detail="since can't be combined with query parameters")
+        try:
+            projection = resolve_fields(view, fields)
+            validate_query(stable, rank, active, prefix, sort or "name")
+            if after:
+                decode_wrestler_cursor(after)  # Reject bad cursors before the ETag check
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        db = get_db()
+        _sync_stored_versions()
+
+        next_cursor = None
+
+        def build():
+            nonlocal next_cursor
+            try:
+                page, next_cursor = query_wrestlers(
+                    db, fields=projection, stable=stable, rank=rank, active=active, prefix=prefix,
+                    sort=sort or "name", limit=limit or 50, after=after,
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            return page
+
+        response = conditional_json(request, versions.etag("wrestlers", "q-" + hashlib.sha1(request.url.query.encode()).hexdigest()[:12]), build)
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return response
+
+    db = get_db()
+    _sync_stored_versions()
+    if since is None:
+        return conditional_json(request, versions.etag("wrestlers"), lambda: _list_wrestlers(db))
+    return conditional_json(
+        request,
+        versions.etag("wrestlers", f"since-{since}"),
+        lambda: _wrestlers_delta(db, since),
+    )
+
 @app.get("/api/wrestlers/{w_id}")
 async def get_wrestler(w_id: str):
     db = get_db()
@@ -400,18 +625,19 @@ async def get_wrestler(w_id: str):
     data['id'] = doc.id
     return data
 
+def _current_active_match():
+    # The lobby/direct match only; rooms and the queue hand their match_id to their own players
+    legacy = manager.legacy_match()
+    if legacy is not None and not manager.is_match_stale(legacy[0]):
+        return {"match_id": legacy[0], "status": "active"}
+    return {"match_id": None, "status": "idle"}
+
 @app.get("/api/matches/active")
-async def get_active_match():
-    """Returns the first active match ID for TV spectators to auto-connect."""
+async def get_active_match(request: Request):
+    """Returns the lobby match ID for TV spectators to auto-connect (room/queue matches excluded)."""
     # Auto-cleanup stale matches first
     manager.cleanup_stale_matches()
-    
-    if manager.matches:
-        # Return first active match that isn't stale
-        for match_id in manager.matches.keys():
-            if not manager.is_match_stale(match_id):
-                return {"match_id": match_id, "status": "active"}
-    return {"match_id": None, "status": "idle"}
+    return conditional_json(request, versions.etag("matches", "active"), _current_active_match)
 
 @app.post("/api/matches/clear")
 async def clear_all_matches():
@@ -432,7 +658,10 @@ async def create_wrestler(w: dict):
             doc_ref = db.collection('wrestlers').document(str(w['id']))
             w_copy = w.copy()
             del w_copy['id'] 
+            w_copy["search_name"] = search_name(w_copy)
             doc_ref.set(w_copy)
+            versions.touch_wrestler(doc_ref.id)
+            leaderboard.upsert(doc_ref.id, w_copy)
             return {"id": doc_ref.id, **w_copy}
         
         # Else auto-generate
@@ -473,8 +702,11 @@ async def create_wrestler(w: dict):
             "bio": f"{w.get('custom_name') or name} is a rising star in sumo wrestling.",
             "is_active": True
         }
+        data["search_name"] = search_name(data)  # Indexed for name-prefix search
         
         update_time, doc_ref = db.collection('wrestlers').add(data)
+        versions.touch_wrestler(doc_ref.id)
+        leaderboard.upsert(doc_ref.id, data)
         print(f"[Create] New wrestler '{data['name']}' created with ID {doc_ref.id}, SP={data['skill_points']}")
         return {"id": doc_ref.id, **data}
     except Exception as e:
@@ -490,78 +722,188 @@ async def delete_wrestler(w_id: str):
     if not doc.exists:
         raise HTTPException(status_code=404, detail="Wrestler not found")
     db.collection('wrestlers').document(w_id).delete()
+    versions.delete_wrestler(w_id)
+    leaderboard.remove(w_id)
     return {"success": True, "id": w_id}
 
+# --- Leaderboard ---
+
+LEADERBOARD_FIELDS = ["name", "custom_name", "color", "rank_name", "xp", "wins", "losses"]
+
+def _ensure_leaderboard(db) -> Leaderboard:
+    """Build the in-memory index from Firestore on first use; stat changes keep it current."""
+    _sync_stored_versions()
+    if not leaderboard.loaded:
+        docs = db.collection('wrestlers').select(LEADERBOARD_FIELDS).stream()
+        leaderboard.load((doc.id, doc.to_dict()) for doc in docs)
+        print(f"[Leaderboard] Loaded {len(leaderboard)} wrestlers")
+    return leaderboard
+
+@app.get("/api/leaderboard")
+async def get_leaderboard(offset: int = 0, limit: int = 50):
+    """Wrestlers ranked by XP then wins, paginated by offset."""
+    board = _ensure_leaderboard(get_db())
+    offset = max(0, offset)
+    limit = max(1, min(limit, 100))
+    return {"total": len(board), "offset": offset, "entries": board.page(offset, limit)}
+
+@app.get("/api/leaderboard/{w_id}")
+async def get_leaderboard_rank(w_id: str, radius: int = 0):
+    """A wrestler's rank, plus `radius` neighbours either side when requested."""
+    board = _ensure_leaderboard(get_db())
+    rank = board.rank_of(w_id)
+    if rank is None:
+        raise HTTPException(status_code=404, detail="Wrestler not found")
+    result = {"id": w_id, "rank": rank, "total": len(board)}
+    if radius > 0:
+        result["around"] = board.around(w_id, min(radius, 50))
+    return result
+
 @app.get("/api/history")
-async def get_history(wrestler_id: str = None, limit: int = 10):
-    """Get match history, optionally filtered by wrestler ID."""
+async def get_history(response: Response, wrestler_id: str = None, limit: int = 10,
+                      after: str = None, kind: str = KIND_RANKED):
+    """
+    Get match history, optionally filtered by wrestler ID.
+    Pass the X-Next-Cursor response header back as `?after=` for the next page.
+    """
     db = get_db()
-    query = db.collection('matches').order_by('timestamp', direction=firestore_module.Query.DESCENDING).limit(limit)
-    
-    matches = []
-    for doc in query.stream():
-        data = doc.to_dict()
-        data['id'] = doc.id
-        # Skip demo matches
-        if doc.id.startswith('demo-') or doc.id.startswith('sim-'):
-            continue
-        # Filter by wrestler if specified
-        if wrestler_id:
-            if str(data.get('p1_id')) != str(wrestler_id) and str(data.get('p2_id')) != str(wrestler_id):
-                continue
-        matches.append(data)
+    try:
+        matches, next_cursor = query_history(db, wrestler_id=wrestler_id, kind=kind, limit=limit, after=after)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return matches
 
+@app.get("/api/wrestlers/{w_id}/stats")
+async def get_wrestler_career_stats(w_id: str):
+    """Career aggregates for a wrestler (one doc read)."""
+    db = get_db()
+    doc = db.collection(WRESTLER_STATS).document(w_id).get()
+    stats = career_stats(doc.to_dict() if doc.exists else None)
+    stats['id'] = w_id
+    return stats
+
+@app.get("/api/head-to-head")
+async def get_head_to_head(a: str, b: str):
+    """Head-to-head record between two wrestlers, from a's point of view (one doc read)."""
+    if a == b:
+        raise HTTPException(status_code=400, detail="Need two different wrestlers")
+    db = get_db()
+    doc_id, _, _ = pair_key(a, b)
+    doc = db.collection(HEAD_TO_HEAD).document(doc_id).get()
+    return head_to_head(doc.to_dict() if doc.exists else None, a, b)
+
+# --- Matchup Odds ---
+
+ODDS_JOB_MAX_BOUTS = 500     # Per persona pairing
+ODDS_JOB_LIMIT = 200         # Finished jobs kept readable (oldest dropped first)
+ODDS_JOB_WORKERS = min(4, os.cpu_count() or 1)
+
+odds_table = OddsTable.load()  # None until scripts/build_odds_table.py has been run
+odds_jobs: "OrderedDict[str, dict]" = OrderedDict()
+_odds_executor: Optional[ProcessPoolExecutor] = None
+
+class OddsJobRequest(BaseModel):
+    p1_id: str
+    p2_id: str
+    bouts: int = 100
+
+async def _matchup_stats(p1: str, p2: str):
+    if p1 == p2:
+        raise HTTPException(status_code=400, detail="Need two different wrestlers")
+    p1_data, p2_data = await asyncio.gather(match_data.get(p1), match_data.get(p2))
+    if p1_data is None or p2_data is None:
+        raise HTTPException(status_code=404, detail="One or more wrestlers not found")
+    return p1_data, p2_data
+
+@app.get("/api/odds")
+async def get_odds(p1: str, p2: str):
+    """Pre-bout win probability from the precomputed table (skill procs not modelled)."""
+    if odds_table is None:
+        raise HTTPException(status_code=503, detail="Odds table not built")
+    p1_data, p2_data = await _matchup_stats(p1, p2)
+    p1_win = odds_table.p1_win(p1_data, p2_data)
+    return {"p1_id": p1, "p2_id": p2, "p1_win": round(p1_win, 3), "p2_win": round(1.0 - p1_win, 3),
+            "bouts_per_cell": odds_table.bouts_per_cell}
+
+async def _run_odds_job(job: dict, p1_data: dict, p2_data: dict):
+    global _odds_executor
+    if _odds_executor is None:
+        _odds_executor = ProcessPoolExecutor(max_workers=ODDS_JOB_WORKERS)
+    loop = asyncio.get_running_loop()
+    stats = [{k: float(d.get(k, 1.0)) for k in ("strength", "technique", "speed")} for d in (p1_data, p2_data)]
+    # Split the bouts across workers, each with its own seed
+    chunks = [job["bouts"] // ODDS_JOB_WORKERS + (1 if i < job["bouts"] % ODDS_JOB_WORKERS else 0)
+              for i in range(ODDS_JOB_WORKERS)]
+    job["status"] = "running"
+    try:
+        results = await asyncio.gather(*(
+            loop.run_in_executor(_odds_executor, run_batch, stats[0], stats[1], n, random.getrandbits(32))
+            for n in chunks if n
+        ))
+    except Exception as e:
+        print(f"[Odds] Job {job['job_id']} failed: {e}")
+        job["status"] = "failed"
+        return
+    total = sum(r["bouts"] for r in results)
+    p1_win = sum(r["p1_score"] for r in results) / total
+    job.update(status="done", total_bouts=total, timeouts=sum(r["timeouts"] for r in results),
+               p1_win=round(p1_win, 3), p2_win=round(1.0 - p1_win, 3))
+
+@app.post("/api/odds/jobs", status_code=202)
+async def create_odds_job(req: OddsJobRequest):
+    """Simulate a specific pairing in worker processes. Poll the job for the result."""
+    if not 1 <= req.bouts <= ODDS_JOB_MAX_BOUTS:
+        raise HTTPException(status_code=400, detail=f"bouts must be 1-{ODDS_JOB_MAX_BOUTS}")
+    p1_data, p2_data = await _matchup_stats(req.p1_id, req.p2_id)
+    job = {"job_id": f"odds-{int(time.time() * 1000)}-{random.randint(0, 0xffff):04x}",
+           "p1_id": req.p1_id, "p2_id": req.p2_id, "bouts": req.bouts, "status": "queued"}
+    odds_jobs[job["job_id"]] = job
+    while len(odds_jobs) > ODDS_JOB_LIMIT:
+        odds_jobs.popitem(last=False)
+    asyncio.create_task(_run_odds_job(job, p1_data, p2_data))
+    return job
+
+@app.get("/api/odds/jobs/{job_id}")
+async def get_odds_job(job_id: str):
+    job = odds_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+def _stream_match_json(db, match_id: str, summary: dict):
+    """Yield the summary as JSON with its event log streamed in as "events"."""
+    head = {k: v for k, v in summary.items() if k != 'events'}
+    yield json.dumps(jsonable_encoder(head))[:-1] + ', "events": ['
+    for i, event in enumerate(stream_match_log(db, match_id, summary)):
+        yield ("," if i else "") + json.dumps(event)
+    yield "]}"
+
 @app.get("/api/matches/{match_id}")
-async def get_match_details(match_id: str):
-    """Get detailed match data including event log."""
+async def get_match_details(match_id: str, include_events: bool = False):
+    """
+    Get match summary. The event log is only read (and streamed) with
+    `?include_events=true`.
+    """
     db = get_db()
     doc = db.collection('matches').document(match_id).get()
     if not doc.exists:
         raise HTTPException(status_code=404, detail="Match not found")
     data = doc.to_dict()
     data['id'] = doc.id
+    if include_events:
+        return StreamingResponse(_stream_match_json(db, match_id, data), media_type="application/json")
+    data.pop('events', None)  # Legacy docs embedded the log
     return data
 
 @app.get("/api/skills")
-async def get_skills():
-    """Get the skill tree definition."""
-    # Return a basic skill tree structure
-    return {
-        "strength": {
-            "name": "Strength",
-            "jp": "力",
-            "description": "Raw pushing power",
-            "color": "220,50,50",
-            "skills": [
-                {"id": "str_1", "name": "Iron Grip", "jp": "鉄握", "desc": "+10% push force", "tier": 1, "cost": 1, "effect": {"strength": 0.1}},
-                {"id": "str_2", "name": "Mountain Push", "jp": "山押し", "desc": "+15% push force", "tier": 2, "cost": 2, "effect": {"strength": 0.15}},
-                {"id": "str_3", "name": "Yokozuna Force", "jp": "横綱力", "desc": "+20% push force", "tier": 3, "cost": 3, "effect": {"strength": 0.2}}
-            ]
-        },
-        "technique": {
-            "name": "Technique", 
-            "jp": "技",
-            "description": "Grappling skill",
-            "color": "50,150,220",
-            "skills": [
-                {"id": "tech_1", "name": "Quick Hands", "jp": "速手", "desc": "+10% grab speed", "tier": 1, "cost": 1, "effect": {"technique": 0.1}},
-                {"id": "tech_2", "name": "Belt Master", "jp": "帯師", "desc": "+15% grab success", "tier": 2, "cost": 2, "effect": {"technique": 0.15}},
-                {"id": "tech_3", "name": "Kimarite Master", "jp": "決まり手", "desc": "+20% success", "tier": 3, "cost": 3, "effect": {"technique": 0.2}}
-            ]
-        },
-        "speed": {
-            "name": "Speed",
-            "jp": "速",
-            "description": "Movement and reaction",
-            "color": "50,220,100",
-            "skills": [
-                {"id": "spd_1", "name": "Quick Step", "jp": "速歩", "desc": "+10% movement", "tier": 1, "cost": 1, "effect": {"speed": 0.1}},
-                {"id": "spd_2", "name": "Lightning Dash", "jp": "雷走", "desc": "+15% movement", "tier": 2, "cost": 2, "effect": {"speed": 0.15}},
-                {"id": "spd_3", "name": "God Speed", "jp": "神速", "desc": "+20% movement", "tier": 3, "cost": 3, "effect": {"speed": 0.2}}
-            ]
-        }
-    }
+async def get_skills(request: Request):
+    """Get the skill tree definition (pre-encoded; revalidate with If-None-Match)."""
+    headers = {"ETag": CATALOG.etag, "Cache-Control": "no-cache"}
+    if if_none_match(request.headers.get("if-none-match"), CATALOG.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=CATALOG.encoded, media_type="application/json", headers=headers)
 
 @app.get("/api/wrestlers/{w_id}/skills")
 async def get_wrestler_skills(w_id: str):
@@ -593,37 +935,8 @@ async def get_wrestler_skills(w_id: str):
     return {
         "skill_points": data.get("skill_points", 0),
         "unlocked_skills": transformed_skills,
-        "total_bonuses": data.get("total_bonuses", {})
-    }
-
-
-def get_skill_tree_sync():
-    """Synchronous version of skill tree for internal use."""
-    return {
-        "strength": {
-            "name": "Strength", "jp": "力", "description": "Raw pushing power", "color": "220,50,50",
-            "skills": [
-                {"id": "str_1", "name": "Iron Grip", "jp": "鉄握", "desc": "+10% push force", "tier": 1, "cost": 1, "effect": {"strength": 0.1}},
-                {"id": "str_2", "name": "Mountain Push", "jp": "山押し", "desc": "+15% push force", "tier": 2, "cost": 2, "effect": {"strength": 0.15}},
-                {"id": "str_3", "name": "Yokozuna Force", "jp": "横綱力", "desc": "+20% push force", "tier": 3, "cost": 3, "effect": {"strength": 0.2}}
-            ]
-        },
-        "technique": {
-            "name": "Technique", "jp": "技", "description": "Grappling skill", "color": "50,150,220",
-            "skills": [
-                {"id": "tech_1", "name": "Quick Hands", "jp": "速手", "desc": "+10% grab speed", "tier": 1, "cost": 1, "effect": {"technique": 0.1}},
-                {"id": "tech_2", "name": "Belt Master", "jp": "帯師", "desc": "+15% grab success", "tier": 2, "cost": 2, "effect": {"technique": 0.15}},
-                {"id": "tech_3", "name": "Kimarite Master", "jp": "決まり手", "desc": "+20% success", "tier": 3, "cost": 3, "effect": {"technique": 0.2}}
-            ]
-        },
-        "speed": {
-            "name": "Speed", "jp": "速", "description": "Movement and reaction", "color": "50,220,100",
-            "skills": [
-                {"id": "spd_1", "name": "Quick Step", "jp": "速歩", "desc": "+10% movement", "tier": 1, "cost": 1, "effect": {"speed": 0.1}},
-                {"id": "spd_2", "name": "Lightning Dash", "jp": "雷走", "desc": "+15% movement", "tier": 2, "cost": 2, "effect": {"speed": 0.15}},
-                {"id": "spd_3", "name": "God Speed", "jp": "神速", "desc": "+20% movement", "tier": 3, "cost": 3, "effect": {"speed": 0.2}}
-            ]
-        }
+        # Stored at unlock time; only docs from before that are summed here
+        "total_bonuses": data.get("total_bonuses") or CATALOG.total_bonuses(unlocked_skill_ids(raw_skills))
     }
 
 
@@ -639,30 +952,32 @@ async def unlock_skill(w_id: str, skill_id: str):
     data = doc.to_dict()
     skill_points = data.get("skill_points", 0)
     
-    # Get actual skill cost from skill tree
-    skill_tree = get_skill_tree_sync()
-    cost = 1  # Default
-    for branch in skill_tree.values():
-        for skill in branch.get("skills", []):
-            if skill.get("id") == skill_id:
-                cost = skill.get("cost", 1)
-                break
-    
+    try:
+        skill = CATALOG.get(skill_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Unknown skill '{skill_id}'")
+    cost = skill["cost"]
+
+    unlocked = data.get("unlocked_skills", [])
+    existing_ids = unlocked_skill_ids(unlocked)
+    try:
+        CATALOG.check_unlock(skill_id, existing_ids)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     if skill_points < cost:
         raise HTTPException(status_code=400, detail=f"Not enough skill points. Need {cost}, have {skill_points}")
     
-    unlocked = data.get("unlocked_skills", [])
-    existing_ids = [s.get("skill_id") if isinstance(s, dict) else s for s in unlocked]
-    if skill_id in existing_ids:
-        raise HTTPException(status_code=400, detail="Skill already unlocked")
-    
     unlocked.append({"skill_id": skill_id, "unlocked_at": str(time.time())})
     new_sp = skill_points - cost
     
+    # Bonuses are summed once here so reads (and match setup) never recompute them
     doc_ref.update({
         "skill_points": new_sp,
-        "unlocked_skills": unlocked
+        "unlocked_skills": unlocked,
+        "total_bonuses": CATALOG.total_bonuses(existing_ids + [skill_id]),
     })
+    versions.touch_wrestler(w_id)
     
     print(f"[Skill] Wrestler {w_id} unlocked '{skill_id}' for {cost} SP. Remaining: {new_sp}")
     return {"success": True, "skill_id": skill_id, "cost": cost, "remaining_sp": new_sp}
@@ -743,8 +1058,8 @@ async def start_simulation():
 # --- Lobby Endpoints (Remote 2P) ---
 
 @app.get("/api/lobby/status")
-async def get_lobby_status():
-    return lobby_manager.get_status()
+async def get_lobby_status(request: Request):
+    return conditional_json(request, versions.etag("lobby"), lobby_manager.get_status)
 
 class JoinLobbyRequest(BaseModel):
     side: str # "p1" or "p2"
@@ -781,10 +1096,149 @@ async def start_lobby_match():
     await manager.create_match(match_id, p1_id, p2_id)
     
     # Lock lobby so others don't overwrite
-    lobby_manager.locked = True
+    lobby_manager.lock()
     
     return {"success": True, "match_id": match_id}
 
+# --- Rooms (many lobbies at once, joined by short code) ---
+
+rooms = RoomRegistry()
+
+def _get_room(code: str):
+    room = rooms.get(code)
+    if room is None:
+        raise HTTPException(status_code=404, detail="Room not found or expired")
+    return room
+
+def _room_etag(room) -> str:
+    return f'"room-{room.code}-{room.created_ns}-{room.version}"'
+
+@app.post("/api/rooms")
+async def create_room():
+    """Open a room and return its join code."""
+    rooms.ensure_timer()
+    try:
+        room = rooms.create()
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return room.get_status()
+
+@app.get("/api/rooms/{code}")
+async def get_room(request: Request, code: str):
+    room = _get_room(code)
+    return conditional_json(request, _room_etag(room), room.get_status)
+
+@app.post("/api/rooms/{code}/join")
+async def join_room(code: str, req: JoinLobbyRequest):
+    if req.side not in ["p1", "p2"]:
+        raise HTTPException(status_code=400, detail="Invalid side")
+    room = _get_room(code)
+    if not rooms.join(room, req.side, req.wrestler_id, req.wrestler_name):
+        raise HTTPException(status_code=400, detail="Room is locked")
+    match_data.prefetch(req.wrestler_id)
+    return {"success": True, "status": room.get_status()}
+
+@app.post("/api/rooms/{code}/reset")
+async def reset_room(code: str):
+    rooms.reset(_get_room(code))
+    return {"success": True}
+
+@app.post("/api/rooms/{code}/start")
+async def start_room_match(code: str):
+    room = _get_room(code)
+    status = room.get_status()
+    if not status["ready_to_start"]:
+        raise HTTPException(status_code=400, detail="Not all players ready")
+    if room.locked:
+        raise HTTPException(status_code=400, detail="Match already started")
+
+    match_id = f"m-{room.code}-{int(time.time())}"
+    rooms.bind_match(room, match_id)  # Lock first so a double tap can't start two matches
+    try:
+        await manager.create_match(match_id, status["p1"]["id"], status["p2"]["id"], exclusive=False)
+    except Exception:
+        rooms.unbind_match(room)
+        raise
+    return {"success": True, "match_id": match_id, "code": room.code}
+
+# --- Matchmaking Queue ---
+
+MATCH_PASS_INTERVAL = 1.0   # Seconds between pairing passes while anyone waits
+MATCH_RESULT_TTL = 600.0    # How long a paired ticket's result stays readable
+
+matchmaking = MatchmakingQueue()
+# Maps ticket id -> (paired_at, result) for tickets that left the queue matched
+matchmaking_results: "OrderedDict[str, tuple]" = OrderedDict()
+_matchmaking_task: Optional[asyncio.Task] = None
+
+class EnqueueRequest(BaseModel):
+    wrestler_id: str
+
+async def _start_matchmade(pairs):
+    """Hand each pair straight to the match manager."""
+    now = time.time()
+    for first, second in pairs:
+        match_id = f"m-q{int(now * 1000)}-{first.ticket_id}"
+        try:
+            await manager.create_match(match_id, first.wrestler_id, second.wrestler_id, exclusive=False)
+            result = {"status": "matched", "match_id": match_id}
+        except Exception as e:
+            print(f"[Matchmaking] Failed to start {first.wrestler_id} vs {second.wrestler_id}: {e}")
+            result = {"status": "failed", "match_id": None}
+        matchmaking_results[first.ticket_id] = (now, {**result, "side": "p1", "opponent": second.to_dict()})
+        matchmaking_results[second.ticket_id] = (now, {**result, "side": "p2", "opponent": first.to_dict()})
+
+    while matchmaking_results:
+        paired_at, _ = next(iter(matchmaking_results.values()))
+        if now - paired_at < MATCH_RESULT_TTL:
+            break
+        matchmaking_results.popitem(last=False)
+
+async def _matchmaking_loop():
+    # Windows widen with time, so waiting tickets are retried until the queue drains
+    while len(matchmaking):
+        await asyncio.sleep(MATCH_PASS_INTERVAL)
+        await _start_matchmade(matchmaking.match_pass())
+
+@app.post("/api/matchmaking/enqueue")
+async def enqueue_matchmaking(req: EnqueueRequest):
+    """Queue a wrestler for a rank/rating-matched opponent. Poll the ticket for the result."""
+    global _matchmaking_task
+    data = await match_data.get(req.wrestler_id)  # Also warms match creation
+    if data is None:
+        raise HTTPException(status_code=404, detail="Wrestler not found")
+    try:
+        ticket = matchmaking.enqueue(req.wrestler_id, data.get("custom_name") or data.get("name", ""),
+                                     rating=data.get("rating"), rank_index=data.get("rank_index", 0))
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    pair = matchmaking.pair(ticket.ticket_id)
+    if pair:
+        await _start_matchmade([pair])
+    elif _matchmaking_task is None or _matchmaking_task.done():
+        _matchmaking_task = asyncio.create_task(_matchmaking_loop())
+    return await get_matchmaking_ticket(ticket.ticket_id)
+
+@app.get("/api/matchmaking/metrics")
+async def get_matchmaking_metrics():
+    """Queue depth, per-bucket depth and recent wait times."""
+    return matchmaking.metrics()
+
+@app.get("/api/matchmaking/{ticket_id}")
+async def get_matchmaking_ticket(ticket_id: str):
+    if ticket_id in matchmaking:
+        return {"ticket_id": ticket_id, "status": "waiting"}
+    if ticket_id in matchmaking_results:
+        return {"ticket_id": ticket_id, **matchmaking_results[ticket_id][1]}
+    raise HTTPException(status_code=404, detail="Ticket not found")
+
+@app.delete("/api/matchmaking/{ticket_id}")
+async def cancel_matchmaking(ticket_id: str):
+    if not matchmaking.cancel(ticket_id):
+        raise HTTPException(status_code=404, detail="Ticket not waiting")
+    return {"success": True}
+
 # --- Demo Simulation for Watch Page ---
 # Persistent demo engine for background simulation on watch page
 _demo_engine = None
@@ -828,6 +1282,8 @@ async def get_demo_state():
     
     # Get state and add demo flag
     state = engine.get_state()
+    if live_odds is not None:
+        state['p1_win_prob'] = live_odds.p1_win(state)
     state['is_demo'] = True
     state['demo_label'] = 'DEMO MATCH'
     
@@ -842,6 +1298,65 @@ async def send_action(match_id: str, req: ActionRequest):
         return {"status": "ok"}
     raise HTTPException(status_code=404, detail="Match not found")
 
+# --- Control Channel (server push for lobby / status / matches) ---
+
+def _control_snapshot(resource: str) -> dict:
+    if resource == "lobby":
+        return lobby_manager.get_status()
+    if resource == "matches":
+        return {**_current_status(), "active": _current_active_match()}
+    return {}
+
+def _publish_resource_change(resource: str, version: int):
+    """Push a fresh snapshot of a changed resource to control subscribers."""
+    if not control.has_subscribers():
+        return
+    message_type = "status" if resource == "matches" else resource
+    control.publish(message_type, _control_snapshot(resource), version=version)
+
+versions.add_listener(_publish_resource_change)
+
+async def _wait_for_disconnect(websocket: WebSocket):
+    # Clients don't send anything on the control channel; this just notices closes
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+
+@app.websocket("/ws/control")
+async def control_websocket(websocket: WebSocket):
+    """
+    Push channel replacing lobby/status/active-match polling.
+    Sends a "hello" snapshot, then "lobby", "status", "wrestlers",
+    "match_started" (lobby/direct match only) and "match_ended" messages
+    as they happen.
+    """
+    await websocket.accept()
+    queue = control.subscribe()
+    closed = asyncio.create_task(_wait_for_disconnect(websocket))
+    try:
+        await websocket.send_json({
+            "type": "hello",
+            "data": {
+                "lobby": _control_snapshot("lobby"),
+                "status": _control_snapshot("matches"),
+                "wrestlers_version": versions.version("wrestlers"),
+            },
+        })
+        while True:
+            next_message = asyncio.create_task(queue.get())
+            done, _ = await asyncio.wait({next_message, closed}, return_when=asyncio.FIRST_COMPLETED)
+            if closed in done:
+                next_message.cancel()
+                break
+            await websocket.send_json(next_message.result())
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
+        control.unsubscribe(queue)
+        closed.cancel()
+
 # --- WebSocket Endpoint ---
 
 @app.websocket("/ws/{match_id}")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Backfill `participants` and `kind` on match docs saved before indexed history.
+
+/api/history now filters in Firestore on these fields, so older matches are
+invisible to it until this has run once. Safe to re-run: docs that already
+have both fields are skipped.
+
+Usage: python scripts/backfill_match_index.py [--dry-run]
+"""
+
+import sys
+import os
+
+# Add the parent directory to sys.path to import app modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.firebase import get_db
+from app.services.match_history import index_fields
+
+BATCH_SIZE = 400  # Firestore batches allow up to 500 writes
+
+
+def main():
+    dry_run = "--dry-run" in sys.argv
+    db = get_db()
+
+    scanned = 0
+    updated = 0
+    batch = db.batch()
+    pending = 0
+
+    for doc in db.collection('matches').stream():
+        scanned += 1
+        data = doc.to_dict()
+        if "participants" in data and "kind" in data:
+            continue
+
+        p1_id = data.get('p1_id') or (data.get('p1') or {}).get('id')
+        p2_id = data.get('p2_id') or (data.get('p2') or {}).get('id')
+        if p1_id is None or p2_id is None:
+            print(f"  Skipping {doc.id}: no participant IDs")
+            continue
+
+        updated += 1
+        if dry_run:
+            continue
+        batch.update(doc.reference, index_fields(doc.id, p1_id, p2_id))
+        pending += 1
+        if pending >= BATCH_SIZE:
+            batch.commit()
+            batch = db.batch()
+            pending = 0
+
+    if pending and not dry_run:
+        batch.commit()
+
+    action = "Would update" if dry_run else "Updated"
+    print(f"Scanned {scanned} matches. {action} {updated}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Backfill `search_name` on wrestler docs created before indexed roster queries.
+
+/api/wrestlers?prefix= and ?sort=name order on this field, and Firestore
+leaves out docs that lack it. Safe to re-run: docs whose value is already
+correct are skipped.
+
+Usage: python scripts/backfill_wrestler_search.py [--dry-run]
+"""
+
+import sys
+import os
+
+# Add the parent directory to sys.path to import app modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.firebase import get_db
+from app.services.version_sync import bump_stored_versions
+from app.services.wrestler_query import search_name
+
+BATCH_SIZE = 400  # Firestore batches allow up to 500 writes
+
+
+def main():
+    dry_run = "--dry-run" in sys.argv
+    db = get_db()
+
+    scanned = 0
+    updated = 0
+    batch = db.batch()
+    pending = 0
+
+    for doc in db.collection('wrestlers').stream():
+        scanned += 1
+        data = doc.to_dict()
+        value = search_name(data)
+        if data.get("search_name") == value:
+            continue
+
+        updated += 1
+        if dry_run:
+            continue
+        batch.update(doc.reference, {"search_name": value})
+        pending += 1
+        if pending >= BATCH_SIZE:
+            batch.commit()
+            batch = db.batch()
+            pending = 0
+
+    if pending and not dry_run:
+        batch.commit()
+    if updated and not dry_run:
+        bump_stored_versions(db, "wrestlers")  # The API's roster ETags are stale now
+
+    action = "Would update" if dry_run else "Updated"
+    print(f"Scanned {scanned} wrestlers. {action} {updated}.")
+
+
+if __name__ == "__main__":
+    main()
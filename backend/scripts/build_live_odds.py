@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Build the in-bout win-probability table added to live match snapshots.
+
+Plays headless bouts with random stats and personas across all CPU cores,
+buckets every fighting tick by discretized state (see app/core/live_odds.py)
+and stores the per-cell win rate as a raw .npy array, which the server
+memory-maps at startup. Rerun after changing engine physics or the bins.
+
+Usage: python scripts/build_live_odds.py [--bouts N] [--workers N] [--out PATH]
+"""
+
+import sys
+import os
+import time
+import argparse
+from multiprocessing import Pool
+
+# Add the parent directory to sys.path to import app modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from app.core.live_odds import DEFAULT_TABLE_PATH, SHAPE, build_table, sample_bouts
+
+DEFAULT_BOUTS = 8000
+CHUNK_BOUTS = 250  # Bouts per worker task
+
+
+def _run_chunk(job):
+    bouts, seed = job
+    return sample_bouts(bouts, seed)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bouts", type=int, default=DEFAULT_BOUTS)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--out", default=DEFAULT_TABLE_PATH)
+    args = parser.parse_args()
+
+    jobs = [(min(CHUNK_BOUTS, args.bouts - start), seed)
+            for seed, start in enumerate(range(0, args.bouts, CHUNK_BOUTS))]
+    print(f"Simulating {args.bouts} bouts in {len(jobs)} chunks on {args.workers} workers...")
+
+    started = time.time()
+    wins = np.zeros(SHAPE, dtype=np.float64)
+    counts = np.zeros(SHAPE, dtype=np.int64)
+    with Pool(args.workers) as pool:
+        for done, (chunk_wins, chunk_counts) in enumerate(pool.imap_unordered(_run_chunk, jobs), 1):
+            wins += chunk_wins
+            counts += chunk_counts
+            if done % 5 == 0:
+                print(f"  {done}/{len(jobs)} chunks")
+
+    os.makedirs(os.path.dirname(args.out), exist_ok=True)
+    np.save(args.out, build_table(wins, counts))
+    visited = int((counts > 0).sum())
+    print(f"Sampled {int(counts.sum()) // 2} ticks; {visited}/{counts.size} cells visited. "
+          f"Wrote {args.out} in {time.time() - started:.1f}s.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Build the matchup odds table served by /api/odds.
+
+Runs headless bouts for every (strength, technique) log-ratio cell on the
+grid in app/core/odds.py, across every persona pairing, spread over all
+CPU cores. The table is antisymmetric (p1 vs p2 is the mirror cell of
+p2 vs p1), so only half the cells are simulated. Rerun after changing
+engine physics or the personas.
+
+Usage: python scripts/build_odds_table.py [--bouts N] [--workers N] [--out PATH]
+"""
+
+import sys
+import os
+import math
+import time
+import argparse
+from multiprocessing import Pool
+
+# Add the parent directory to sys.path to import app modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.odds import DEFAULT_TABLE_PATH, PERSONAS, OddsTable, grid_axis, run_batch
+
+DEFAULT_BOUTS = 24  # Per persona pairing per cell
+
+
+def _run_cell(job):
+    s, t, strength_ratio, technique_ratio, bouts = job
+    p1 = {"strength": math.exp(strength_ratio / 2), "technique": math.exp(technique_ratio / 2)}
+    p2 = {"strength": math.exp(-strength_ratio / 2), "technique": math.exp(-technique_ratio / 2)}
+    result = run_batch(p1, p2, bouts, seed=s * 1000 + t)
+    return s, t, result["p1_score"] / result["bouts"]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bouts", type=int, default=DEFAULT_BOUTS)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--out", default=DEFAULT_TABLE_PATH)
+    args = parser.parse_args()
+
+    axis = grid_axis()
+    n = len(axis)
+    # Cells on or below the anti-diagonal; the rest are mirrors
+    jobs = [(s, t, axis[s], axis[t], args.bouts) for s in range(n) for t in range(n) if s * n + t <= (n * n - 1) // 2]
+    print(f"Simulating {len(jobs)} cells x {len(PERSONAS) ** 2} persona pairings x {args.bouts} bouts "
+          f"on {args.workers} workers...")
+
+    started = time.time()
+    win = [[0.5] * n for _ in range(n)]
+    with Pool(args.workers) as pool:
+        for done, (s, t, p) in enumerate(pool.imap_unordered(_run_cell, jobs), 1):
+            win[s][t] = p
+            win[n - 1 - s][n - 1 - t] = 1.0 - p
+            if done % 10 == 0:
+                print(f"  {done}/{len(jobs)} cells")
+    # The centre cell is an even matchup by definition
+    win[n // 2][n // 2] = 0.5
+
+    table = OddsTable(axis, win, bouts_per_cell=args.bouts * len(PERSONAS) ** 2)
+    table.save(args.out)
+    print(f"Wrote {args.out} in {time.time() - started:.1f}s.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Rebuild wrestler_stats and head_to_head from stored ranked matches.
+
+Aggregates are normally maintained incrementally at match end; run this once
+after deploying them (or to repair drift). Existing aggregate docs are
+overwritten.
+
+Usage: python scripts/rebuild_aggregates.py [--dry-run]
+"""
+
+import sys
+import os
+from collections import defaultdict
+
+# Add the parent directory to sys.path to import app modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.aggregates import HEAD_TO_HEAD, WRESTLER_STATS, match_contributions, pair_key
+from app.services.firebase import get_db
+from app.services.match_history import KIND_RANKED, match_kind
+from app.services.match_log import stream_match_log
+
+BATCH_SIZE = 400  # Firestore batches allow up to 500 writes
+
+
+def main():
+    dry_run = "--dry-run" in sys.argv
+    db = get_db()
+
+    wrestlers = defaultdict(lambda: defaultdict(float))
+    pairs = {}
+    scanned = 0
+
+    for doc in db.collection('matches').order_by('timestamp').stream():
+        data = doc.to_dict()
+        if data.get('kind', match_kind(doc.id)) != KIND_RANKED:
+            continue
+        p1_id, p2_id, winner_id = data.get('p1_id'), data.get('p2_id'), data.get('winner_id')
+        if not (p1_id and p2_id and winner_id):
+            continue
+        scanned += 1
+
+        events = list(stream_match_log(db, doc.id, data))
+        per_wrestler, pair = match_contributions(data, events, p1_id, p2_id, winner_id)
+        for w_id, deltas in per_wrestler.items():
+            for field, value in deltas.items():
+                wrestlers[w_id][field] += value
+            wrestlers[w_id]['last_match_id'] = doc.id
+
+        doc_id, low, high = pair_key(p1_id, p2_id)
+        totals = pairs.setdefault(doc_id, {"a_id": low, "b_id": high, "bouts": 0,
+                                           "wins": {low: 0, high: 0}, "total_duration": 0.0})
+        totals["bouts"] += pair["bouts"]
+        totals["total_duration"] += pair["total_duration"]
+        totals["wins"][low] += pair[f"wins.{low}"]
+        totals["wins"][high] += pair[f"wins.{high}"]
+        totals["last_match_id"] = doc.id
+        totals["last_winner_id"] = str(winner_id)
+
+    print(f"Scanned {scanned} ranked matches: {len(wrestlers)} wrestlers, {len(pairs)} pairs.")
+    if dry_run:
+        return
+
+    writes = [(db.collection(WRESTLER_STATS).document(w_id), dict(fields)) for w_id, fields in wrestlers.items()]
+    writes += [(db.collection(HEAD_TO_HEAD).document(doc_id), fields) for doc_id, fields in pairs.items()]
+    for start in range(0, len(writes), BATCH_SIZE):
+        batch = db.batch()
+        for ref, fields in writes[start:start + BATCH_SIZE]:
+            batch.set(ref, fields)
+        batch.commit()
+    print(f"Wrote {len(writes)} aggregate docs.")
+
+
+if __name__ == "__main__":
+    main()
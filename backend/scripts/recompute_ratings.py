@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Recompute every wrestler's rating from the full ranked match history.
+
+Use after deploying ratings (to backfill) or after changing the Elo
+parameters in app/core/rating.py. Matches are read once into columns and
+replayed with recompute_ratings(). Wrestlers with no rated bouts are reset
+to the default rating.
+
+Usage: python scripts/recompute_ratings.py [--dry-run]
+"""
+
+import sys
+import os
+import time
+
+# Add the parent directory to sys.path to import app modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.rating import DEFAULT_RATING, index_players, recompute_ratings
+from app.services.firebase import get_db
+from app.services.match_history import KIND_RANKED, match_kind
+from app.services.version_sync import bump_stored_versions
+
+BATCH_SIZE = 400  # Firestore batches allow up to 500 writes
+
+
+def main():
+    dry_run = "--dry-run" in sys.argv
+    db = get_db()
+
+    started = time.time()
+    rows = []
+    query = db.collection('matches').select(['winner_id', 'loser_id', 'kind']).order_by('timestamp')
+    for doc in query.stream():
+        data = doc.to_dict()
+        if data.get('kind', match_kind(doc.id)) != KIND_RANKED:
+            continue
+        if data.get('winner_id') and data.get('loser_id'):
+            rows.append((data['winner_id'], data['loser_id']))
+    loaded = time.time()
+
+    winners, losers, index = index_players(rows)
+    ratings, counts = recompute_ratings(winners, losers, len(index))
+    computed = time.time()
+    print(f"Read {len(rows)} ranked matches in {loaded - started:.1f}s, "
+          f"rated {len(index)} wrestlers in {computed - loaded:.2f}s.")
+
+    updates = {w_id: {"rating": round(ratings[i], 1), "rated_matches": counts[i]} for w_id, i in index.items()}
+    for doc in db.collection('wrestlers').select(['rating']).stream():
+        updates.setdefault(doc.id, {"rating": DEFAULT_RATING, "rated_matches": 0})
+
+    if dry_run:
+        top = sorted(updates.items(), key=lambda item: -item[1]["rating"])[:10]
+        for w_id, fields in top:
+            print(f"  {w_id}: {fields['rating']} ({fields['rated_matches']} bouts)")
+        return
+
+    items = list(updates.items())
+    for start in range(0, len(items), BATCH_SIZE):
+        batch = db.batch()
+        for w_id, fields in items[start:start + BATCH_SIZE]:
+            batch.set(db.collection('wrestlers').document(w_id), fields, merge=True)
+        batch.commit()
+    bump_stored_versions(db, "wrestlers")  # The API's roster ETags are stale now
+    print(f"Wrote ratings for {len(items)} wrestlers.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Unit tests for incremental career / head-to-head aggregate helpers.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.aggregates import career_stats, head_to_head, match_contributions, pair_key
+
+
+SUMMARY = {"duration_seconds": 12.5, "p1_push_count": 30, "p2_push_count": 20}
+EVENTS = [
+    {"t": 1.0, "type": "push", "player": "p1"},
+    {"t": 1.1, "type": "counter", "player": "p2"},
+    {"t": 1.2, "type": "clash", "player": "p1"},
+    {"t": 1.3, "type": "counter", "player": "p2"},
+    {"t": 1.4, "type": "tachiai"},
+]
+
+
+def test_pair_key_is_order_independent():
+    assert pair_key("b", "a") == pair_key("a", "b") == ("a__b", "a", "b")
+
+
+def test_match_contributions_per_wrestler():
+    per_wrestler, _ = match_contributions(SUMMARY, EVENTS, "w1", "w2", "w2")
+    assert per_wrestler["w1"]["wins"] == 0 and per_wrestler["w1"]["losses"] == 1
+    assert per_wrestler["w2"]["wins"] == 1 and per_wrestler["w2"]["losses"] == 0
+    assert per_wrestler["w1"]["pushes"] == 30
+    assert per_wrestler["w2"]["counters"] == 2
+    assert per_wrestler["w1"]["clashes"] == 1
+    assert per_wrestler["w2"]["total_duration"] == 12.5
+
+
+def test_match_contributions_pair_uses_sorted_ids():
+    _, pair = match_contributions(SUMMARY, EVENTS, "zed", "amy", "zed")
+    assert pair["wins.zed"] == 1 and pair["wins.amy"] == 0
+    assert pair["bouts"] == 1
+
+
+def test_career_stats_derived_rates():
+    stats = career_stats({"bouts": 4, "wins": 3, "losses": 1, "total_duration": 50.0,
+                          "pushes": 100, "counters": 10})
+    assert stats["win_rate"] == 0.75
+    assert stats["avg_duration"] == 12.5
+    assert stats["counter_rate"] == 0.1
+
+
+def test_career_stats_empty():
+    stats = career_stats(None)
+    assert stats["bouts"] == 0 and stats["win_rate"] == 0.0
+
+
+def test_head_to_head_oriented():
+    doc = {"bouts": 3, "wins": {"a": 1, "b": 2}, "total_duration": 30.0}
+    assert head_to_head(doc, "b", "a")["a_wins"] == 2
+    assert head_to_head(doc, "a", "b")["a_wins"] == 1
+    assert head_to_head(doc, "a", "b")["avg_duration"] == 10.0
@@ -0,0 +1,82 @@
+"""
+Unit tests for the indexable skiplist and the (xp, wins) leaderboard on top of it.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+
+from app.core.leaderboard import IndexableSkiplist, Leaderboard
+
+
+def test_skiplist_matches_sorted_list():
+    """Random inserts/removes keep index() and [] consistent with a sorted list."""
+    rng = random.Random(7)
+    skiplist = IndexableSkiplist(seed=1)
+    reference = []
+    for _ in range(2000):
+        key = rng.randint(0, 500)
+        if key in reference and rng.random() < 0.5:
+            skiplist.remove(key)
+            reference.remove(key)
+        elif key not in reference:
+            skiplist.insert(key)
+            reference.append(key)
+    reference.sort()
+
+    assert len(skiplist) == len(reference)
+    assert list(skiplist.iter_from(0)) == reference
+    for i, key in enumerate(reference):
+        assert skiplist[i] == key
+        assert skiplist.index(key) == i
+    assert list(skiplist.iter_from(10))[:5] == reference[10:15]
+
+
+def test_skiplist_missing_key_raises():
+    skiplist = IndexableSkiplist()
+    skiplist.insert(1)
+    try:
+        skiplist.remove(2)
+        assert False, "expected KeyError"
+    except KeyError:
+        pass
+
+
+def _board():
+    board = Leaderboard()
+    board.load([
+        ("a", {"name": "A", "xp": 100, "wins": 5}),
+        ("b", {"name": "B", "xp": 300, "wins": 2}),
+        ("c", {"name": "C", "xp": 100, "wins": 9}),
+        ("d", {"name": "D", "custom_name": "Dee", "xp": 0, "wins": 0}),
+    ])
+    return board
+
+
+def test_rank_orders_by_xp_then_wins():
+    board = _board()
+    assert [row["id"] for row in board.page(0, 10)] == ["b", "c", "a", "d"]
+    assert board.rank_of("a") == 3
+    assert board.page(3, 10)[0]["name"] == "Dee"
+
+
+def test_upsert_moves_wrestler():
+    board = _board()
+    board.upsert("d", {"name": "D", "xp": 500, "wins": 1})
+    assert board.rank_of("d") == 1
+    board.remove("b")
+    assert board.rank_of("b") is None
+    assert len(board) == 3
+
+
+def test_around_clamps_at_top():
+    board = _board()
+    assert [row["id"] for row in board.around("c", radius=1)] == ["b", "c", "a"]
+    assert [row["rank"] for row in board.around("b", radius=2)] == [1, 2, 3]
+
+
+def test_updates_ignored_before_load():
+    board = Leaderboard()
+    board.upsert("x", {"xp": 10, "wins": 1})
+    assert len(board) == 0 and not board.loaded
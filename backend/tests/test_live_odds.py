@@ -0,0 +1,57 @@
+"""
+Unit tests for the discretized in-bout state table.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from app.core.engine import SumoEngine, STATE_FIGHTING, STATE_WAITING
+from app.core.live_odds import SHAPE, LiveOddsTable, build_table, mirror_index, sample_bouts, state_index
+
+
+def _wrestler(x, vx=0.0, stamina=100.0, strength=1.0):
+    return {"x": x, "y": 0.0, "vx": vx, "vy": 0.0, "stamina": stamina, "strength": strength}
+
+
+def test_mirror_matches_swapped_wrestlers():
+    p1 = _wrestler(-3.0, vx=0.6, stamina=80.0, strength=1.3)
+    p2 = _wrestler(4.0, vx=0.2, stamina=30.0, strength=0.9)
+    forward = state_index(p1, p2, 0.2, 0.7)
+    assert mirror_index(forward) == state_index(p2, p1, 0.7, 0.2)
+    assert mirror_index(mirror_index(forward)) == forward
+
+
+def test_sample_bouts_counts_both_sides():
+    wins, counts = sample_bouts(3, seed=5)
+    assert wins.shape == counts.shape == SHAPE
+    assert counts.sum() > 0 and counts.sum() % 2 == 0
+    # Every sample is mirrored with the result flipped, so wins total half the samples
+    assert abs(wins.sum() - counts.sum() / 2) < 1e-6
+
+
+def test_build_table_shrinks_sparse_cells():
+    wins = np.zeros(SHAPE)
+    counts = np.zeros(SHAPE, dtype=np.int64)
+    table = build_table(wins, counts)
+    assert np.allclose(table, 0.5)  # Nothing seen: even odds everywhere
+
+    wins[0, 9, 4, 2, 2] = counts[0, 9, 4, 2, 2] = 1000  # p1 at centre, p2 at the edge
+    table = build_table(wins, counts)
+    assert table[0, 9, 4, 2, 2] > 0.95
+    assert table[0, 9, 0, 0, 0] > 0.9  # Unvisited cell borrows the edge-pair estimate
+
+
+def test_lookup_only_while_fighting(tmp_path):
+    path = str(tmp_path / "live.npy")
+    np.save(path, np.full(SHAPE, 0.25, dtype=np.float32))
+    table = LiveOddsTable.load(path)
+    state = SumoEngine().get_state()
+    assert state["state"] == STATE_WAITING and table.p1_win(state) is None
+    state["state"] = STATE_FIGHTING
+    assert table.p1_win(state) == 0.25
+
+    np.save(path, np.zeros((2, 2), dtype=np.float32))
+    assert LiveOddsTable.load(path) is None
+    assert LiveOddsTable.load(str(tmp_path / "missing.npy")) is None
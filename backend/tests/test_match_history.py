@@ -0,0 +1,39 @@
+"""
+Unit tests for indexed match history helpers (kinds and opaque cursors).
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from datetime import datetime, timezone
+
+from app.services.match_history import (
+    KIND_DEMO, KIND_RANKED, KIND_SIM, decode_cursor, encode_cursor, index_fields, match_kind,
+)
+
+
+def test_match_kind_from_prefix():
+    assert match_kind("m-1702470000") == KIND_RANKED
+    assert match_kind("sim-1702470000") == KIND_SIM
+    assert match_kind("demo-1") == KIND_DEMO
+
+
+def test_index_fields_stringify_participants():
+    fields = index_fields("m-1", 12, "34")
+    assert fields == {"participants": ["12", "34"], "kind": KIND_RANKED}
+
+
+def test_cursor_round_trip():
+    ts = datetime(2025, 12, 13, 18, 8, 22, 960362, tzinfo=timezone.utc)
+    cursor = encode_cursor(ts, "m-1702490902")
+    assert "=" not in cursor, "Cursor should be URL-safe without padding"
+    assert decode_cursor(cursor) == (ts, "m-1702490902")
+
+
+def test_bad_cursor_raises_value_error():
+    for bad in ("not-a-cursor", encode_cursor(datetime.now(timezone.utc), "x")[:-4]):
+        try:
+            decode_cursor(bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"Cursor {bad!r} should be rejected")
@@ -0,0 +1,37 @@
+"""
+Unit tests for compressed match event logs.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services import match_log
+from app.services.match_log import compress_events, iter_events
+
+
+def _events(n):
+    return [{"t": round(i / 60.0, 3), "type": "push", "player": "p1" if i % 2 else "p2", "stamina": 100 - i % 50}
+            for i in range(n)]
+
+
+def test_round_trip_single_chunk():
+    events = _events(500)
+    chunks = compress_events(events)
+    assert len(chunks) == 1
+    assert list(iter_events(iter(chunks))) == events
+
+
+def test_round_trip_across_chunks():
+    original = match_log.CHUNK_BYTES
+    match_log.CHUNK_BYTES = 64  # Force many chunks, splitting lines mid-stream
+    try:
+        events = _events(300)
+        chunks = compress_events(events)
+        assert len(chunks) > 1
+        assert list(iter_events(iter(chunks))) == events
+    finally:
+        match_log.CHUNK_BYTES = original
+
+
+def test_empty_log():
+    assert list(iter_events(iter(compress_events([])))) == []
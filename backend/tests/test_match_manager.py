@@ -0,0 +1,125 @@
+"""
+Unit tests for MatchManager scoping: the lobby/direct match is replaced by the
+next one, while room and matchmade matches keep running beside it.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from app.core.rooms import Room
+
+
+def _wrestler(w_id):
+    return {"id": w_id, "name": w_id, "strength": 1.0, "technique": 1.0, "speed": 1.0,
+            "weight": 150, "color": "200,50,50"}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    async def fake_get(w_id):
+        return _wrestler(w_id)
+
+    monkeypatch.setattr(main.match_data, "get", fake_get)
+    monkeypatch.setattr(main.match_data, "prefetch", lambda w_id: None)
+    monkeypatch.setattr(main, "_sync_stored_versions", lambda: None)  # No Firestore here
+    main.manager.clear_all_matches()
+    main.lobby_manager.reset()
+    with TestClient(main.app) as c:
+        yield c
+    main.manager.clear_all_matches()
+    main.lobby_manager.reset()
+
+
+def _running(match_id):
+    engine = main.manager.matches.get(match_id)
+    return engine is not None and not engine.game_over
+
+
+def _start_room(client):
+    code = client.post("/api/rooms").json()["code"]
+    client.post(f"/api/rooms/{code}/join", json={"side": "p1", "wrestler_id": "r1", "wrestler_name": "R1"})
+    client.post(f"/api/rooms/{code}/join", json={"side": "p2", "wrestler_id": "r2", "wrestler_name": "R2"})
+    return client.post(f"/api/rooms/{code}/start").json()["match_id"]
+
+
+def _start_lobby(client):
+    client.post("/api/lobby/join", json={"side": "p1", "wrestler_id": "l1", "wrestler_name": "L1"})
+    client.post("/api/lobby/join", json={"side": "p2", "wrestler_id": "l2", "wrestler_name": "L2"})
+    return client.post("/api/lobby/start").json()["match_id"]
+
+
+def test_lobby_match_leaves_room_match_running(client):
+    room_match = _start_room(client)
+    lobby_match = _start_lobby(client)
+    assert room_match != lobby_match
+    assert _running(room_match) and _running(lobby_match)
+    assert room_match in main.manager.connections
+
+
+def test_direct_match_replaces_only_the_lobby_match(client):
+    room_match = _start_room(client)
+    _start_lobby(client)
+    lobby_engine = main.manager.legacy_match()[1]
+    direct = client.post("/api/match", json={"p1_id": "d1", "p2_id": "d2"}).json()["match_id"]
+    assert main.manager.legacy_match() == (direct, main.manager.matches[direct])
+    assert main.manager.matches[direct] is not lobby_engine
+    assert _running(room_match)
+
+
+def test_matchmade_match_survives_lobby_and_direct_matches(client):
+    main.matchmaking.enqueue("q1", rating=1500, now=0)
+    main.matchmaking.enqueue("q2", rating=1500, now=0)
+    pairs = main.matchmaking.match_pass(now=0)
+    client.portal.call(main._start_matchmade, pairs)
+    matchmade = next(m for m in main.manager.matches if m.startswith("m-q"))
+
+    _start_lobby(client)
+    client.post("/api/match", json={"p1_id": "d1", "p2_id": "d2"})
+    client.post("/api/match/simulate")
+    assert _running(matchmade)
+
+
+def _drain(queue):
+    messages = []
+    while not queue.empty():
+        messages.append(queue.get_nowait())
+    return messages
+
+
+def test_room_match_does_not_move_the_watch_target(client):
+    queue = main.control.subscribe()
+    try:
+        _start_room(client)
+        messages = _drain(queue)
+        assert not [m for m in messages if m["type"] == "match_started"]
+        assert all(m["data"]["active"]["match_id"] is None for m in messages if m["type"] == "status")
+
+        lobby_match = _start_lobby(client)
+        started = [m["data"]["match_id"] for m in _drain(queue) if m["type"] == "match_started"]
+        assert started == [lobby_match]
+    finally:
+        main.control.unsubscribe(queue)
+
+
+def test_status_endpoints_only_report_the_lobby_match(client):
+    _start_room(client)
+    assert client.get("/api/status").json() == {"status": "IDLE"}
+    assert client.get("/api/matches/active").json()["match_id"] is None
+
+    lobby_match = _start_lobby(client)
+    assert client.get("/api/status").json() == {"status": "FIGHTING", "match_id": lobby_match}
+    assert client.get("/api/matches/active").json()["match_id"] == lobby_match
+
+
+def test_reused_room_code_gets_a_new_etag():
+    first = Room("ABCD", expires_at=0)
+    time.sleep(0.002)
+    second = Room("ABCD", expires_at=0)  # Same code after the first expired, version 0 again
+    assert first.version == second.version
+    assert main._room_etag(first) != main._room_etag(second)
@@ -0,0 +1,76 @@
+"""
+Unit tests for the rating-bucketed matchmaking queue.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+
+from app.core.matchmaking import BASE_WINDOW, MatchmakingQueue
+
+
+def test_close_ratings_pair_immediately():
+    queue = MatchmakingQueue()
+    queue.enqueue("a", rating=1500, now=0)
+    b = queue.enqueue("b", rating=1540, now=1)
+    first, second = queue.pair(b.ticket_id, now=1)
+    assert (first.wrestler_id, second.wrestler_id) == ("a", "b")  # Longer wait is p1
+    assert len(queue) == 0
+
+
+def test_window_widens_with_wait():
+    queue = MatchmakingQueue()
+    queue.enqueue("a", rating=1500, now=0)
+    queue.enqueue("b", rating=1500 + BASE_WINDOW + 150, now=0)
+    assert queue.match_pass(now=1) == []
+    pairs = queue.match_pass(now=10)
+    assert len(pairs) == 1
+
+
+def test_prefers_closest_rating_and_respects_rank_gap():
+    queue = MatchmakingQueue()
+    queue.enqueue("far", rating=1580, now=0)
+    queue.enqueue("near", rating=1510, now=0)
+    queue.enqueue("ranked_up", rating=1500, rank_index=5, now=0)
+    t = queue.enqueue("me", rating=1500, now=0)
+    paired = {ticket.wrestler_id for ticket in queue.pair(t.ticket_id, now=0)}
+    assert paired == {"me", "near"}
+
+
+def test_rank_cells_skip_unreachable_tiers():
+    queue = MatchmakingQueue()
+    for i in range(50):
+        queue.enqueue(f"high{i}", rating=1500, rank_index=6, now=0)
+    me = queue.enqueue("me", rating=1500, rank_index=0, now=0)
+    assert queue.pair(me.ticket_id, now=0) is None
+    queue.enqueue("peer", rating=1520, rank_index=1, now=0)
+    paired = {ticket.wrestler_id for ticket in queue.pair(me.ticket_id, now=0)}
+    assert paired == {"me", "peer"}
+    assert queue.metrics()["buckets"] == {1500: 50}
+
+
+def test_duplicate_and_cancel():
+    queue = MatchmakingQueue()
+    t = queue.enqueue("a", now=0)
+    try:
+        queue.enqueue("a", now=0)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+    assert queue.cancel(t.ticket_id) and not queue.cancel(t.ticket_id)
+    queue.enqueue("a", now=1)  # Free to queue again
+
+
+def test_many_waiting_all_pair_and_metrics():
+    rng = random.Random(11)
+    queue = MatchmakingQueue()
+    for i in range(2000):
+        queue.enqueue(f"w{i}", rating=rng.gauss(1500, 200), rank_index=rng.randint(0, 3), now=0)
+    pairs = queue.match_pass(now=60)
+    assert len(pairs) == 1000
+    for first, second in pairs:
+        assert first.wrestler_id != second.wrestler_id
+    metrics = queue.metrics(now=60)
+    assert metrics["depth"] == 0 and metrics["matched_pairs"] == 1000
+    assert metrics["wait_p50_seconds"] == 60.0
@@ -0,0 +1,47 @@
+"""
+Unit tests for batch bout simulation and the interpolated odds table.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.odds import OddsTable, PERSONAS, grid_axis, run_batch
+
+
+def _linear_table():
+    axis = grid_axis(5)  # -1, -0.5, 0, 0.5, 1
+    # Depends on strength only: 0.1 .. 0.9
+    win = [[0.1 + 0.2 * s] * 5 for s in range(5)]
+    return OddsTable(axis, win, bouts_per_cell=10)
+
+
+def test_lookup_interpolates_between_cells():
+    table = _linear_table()
+    assert abs(table.p1_win({"strength": 1.0}, {"strength": 1.0}) - 0.5) < 1e-9
+    # log(e^0.25) = 0.25 lies halfway between the 0 and 0.5 rows
+    p = table.p1_win({"strength": 2.718281828 ** 0.25}, {"strength": 1.0})
+    assert abs(p - 0.6) < 1e-6
+
+
+def test_lookup_clamps_outside_grid():
+    table = _linear_table()
+    assert abs(table.p1_win({"strength": 100.0}, {"strength": 1.0}) - 0.9) < 1e-9
+    assert abs(table.p1_win({"strength": 0.01}, {"strength": 1.0}) - 0.1) < 1e-9
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "odds.npz")
+    _linear_table().save(path)
+    loaded = OddsTable.load(path)
+    assert loaded.bouts_per_cell == 10
+    assert abs(loaded.p1_win({"strength": 1.0}, {"strength": 1.0}) - 0.5) < 1e-6
+    assert OddsTable.load(str(tmp_path / "missing.npz")) is None
+
+
+def test_run_batch_is_seeded_and_favours_stronger():
+    strong = {"strength": 1.6, "technique": 1.0}
+    weak = {"strength": 0.8, "technique": 1.0}
+    first = run_batch(strong, weak, bouts=2, seed=7)
+    assert first == run_batch(strong, weak, bouts=2, seed=7)
+    assert first["bouts"] == 2 * len(PERSONAS) ** 2
+    assert first["p1_score"] / first["bouts"] > 0.7
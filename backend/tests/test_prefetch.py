@@ -0,0 +1,68 @@
+"""
+Unit tests for the lobby wrestler prefetch cache.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+
+from app.core.prefetch import WrestlerPrefetchCache
+
+
+class FakeStore:
+    def __init__(self):
+        self.loads = []
+        self.versions = {}
+        self.docs = {"w1": {"name": "Taka", "strength": 1.2}}
+
+    def load(self, w_id):
+        self.loads.append(w_id)
+        return self.docs.get(w_id)
+
+    def version_of(self, w_id):
+        return self.versions.get(w_id, 0)
+
+
+def test_prefetch_then_get_reads_once():
+    store = FakeStore()
+    cache = WrestlerPrefetchCache(store.load, store.version_of)
+
+    async def run():
+        cache.prefetch("w1")
+        cache.prefetch("w1")  # Already in flight
+        first = await cache.get("w1")
+        second = await cache.get("w1")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == second == {"name": "Taka", "strength": 1.2}
+    assert store.loads == ["w1"]
+    assert cache.misses == 0
+
+
+def test_version_change_invalidates():
+    store = FakeStore()
+    cache = WrestlerPrefetchCache(store.load, store.version_of)
+
+    async def run():
+        await cache.get("w1")
+        store.versions["w1"] = 5
+        store.docs["w1"] = {"name": "Taka", "strength": 1.5}
+        return await cache.get("w1")
+
+    assert asyncio.run(run())["strength"] == 1.5
+    assert store.loads == ["w1", "w1"]
+
+
+def test_missing_wrestler_and_expiry():
+    store = FakeStore()
+    cache = WrestlerPrefetchCache(store.load, store.version_of, ttl=-1)
+
+    async def run():
+        assert await cache.get("nobody") is None
+        await cache.get("w1")
+        await cache.get("w1")  # Expired immediately (ttl < 0)
+
+    asyncio.run(run())
+    assert store.loads == ["nobody", "w1", "w1"]
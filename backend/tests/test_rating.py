@@ -0,0 +1,57 @@
+"""
+Unit tests for Elo updates and the wave-batched full-history recompute.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+
+from app.core import rating
+from app.core.rating import DEFAULT_RATING, elo_update, expected_score, index_players, recompute_ratings
+
+
+def _sequential(winners, losers, n_players):
+    ratings = [DEFAULT_RATING] * n_players
+    played = [0] * n_players
+    for w, l in zip(winners, losers):
+        ratings[w], ratings[l] = elo_update(ratings[w], ratings[l], played[w], played[l])
+        played[w] += 1
+        played[l] += 1
+    return ratings, played
+
+
+def test_elo_update_zero_sum_when_established():
+    new_w, new_l = elo_update(1500, 1500, 20, 20)
+    assert new_w - 1500 == 1500 - new_l == rating.K_FACTOR / 2
+    assert expected_score(1600, 1400) > 0.75
+
+
+def test_upset_moves_more():
+    favourite_win, _ = elo_update(1700, 1300, 20, 20)
+    underdog_win, _ = elo_update(1300, 1700, 20, 20)
+    assert underdog_win - 1300 > favourite_win - 1700
+
+
+def test_recompute_matches_sequential_replay():
+    rng = random.Random(3)
+    n_players = 40
+    winners, losers = [], []
+    for _ in range(3000):
+        a, b = rng.sample(range(n_players), 2)
+        winners.append(a)
+        losers.append(b)
+
+    expected, expected_counts = _sequential(winners, losers, n_players)
+    ratings, counts = recompute_ratings(winners, losers, n_players)
+    assert counts == expected_counts
+    assert max(abs(x - y) for x, y in zip(ratings, expected)) < 1e-6
+
+
+def test_recompute_without_numpy_matches(monkeypatch):
+    winners, losers, index = index_players([("a", "b"), ("b", "c"), ("a", "c"), ("c", "a")])
+    with_numpy, _ = recompute_ratings(winners, losers, len(index))
+    monkeypatch.setattr(rating, "np", None)
+    without_numpy, _ = recompute_ratings(winners, losers, len(index))
+    assert index == {"a": 0, "b": 1, "c": 2}
+    assert max(abs(x - y) for x, y in zip(with_numpy, without_numpy)) < 1e-9
@@ -0,0 +1,71 @@
+"""
+Unit tests for the multi-room lobby registry (codes, joining, heap expiry).
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+
+from app.core.rooms import CODE_ALPHABET, CODE_LENGTH, RoomRegistry
+
+
+def test_create_gives_unique_codes():
+    registry = RoomRegistry(seed=3)
+    codes = {registry.create(now=0).code for _ in range(2000)}
+    assert len(codes) == 2000 == len(registry)
+    assert all(len(c) == CODE_LENGTH and set(c) <= set(CODE_ALPHABET) for c in codes)
+
+
+def test_join_ready_and_lock():
+    registry = RoomRegistry(seed=1)
+    room = registry.create(now=0)
+    assert registry.get(room.code.lower()) is room
+    assert registry.join(room, "p1", "w1", "Taka")
+    assert not room.get_status()["ready_to_start"]
+    registry.join(room, "p2", "w2", "Haku")
+    assert room.get_status()["ready_to_start"]
+
+    registry.bind_match(room, "m-1")
+    assert not registry.join(room, "p1", "w3", "Other")
+    assert room.get_status()["match_id"] == "m-1"
+    registry.unbind_match(room)
+    assert not room.locked and room.p1["id"] == "w1"
+
+
+def test_expiry_respects_touch():
+    registry = RoomRegistry(ttl=10, seed=2)
+    idle = registry.create(now=0)
+    busy = registry.create(now=0)
+    registry.touch(busy, now=8)  # New deadline 18
+
+    assert registry.expire(now=5) == 0
+    assert registry.expire(now=11) == 1
+    assert registry.get(idle.code) is None and registry.get(busy.code) is busy
+    assert registry.next_deadline() == 18
+    assert registry.expire(now=18) == 1
+    assert len(registry) == 0
+
+
+def test_capacity_limit():
+    registry = RoomRegistry(ttl=10, max_rooms=2, seed=4)
+    registry.create(now=0)
+    registry.create(now=0)
+    try:
+        registry.create(now=1)
+        assert False, "expected RuntimeError"
+    except RuntimeError:
+        pass
+    registry.create(now=20)  # Expired rooms make space
+
+
+def test_timer_expires_rooms():
+    registry = RoomRegistry(ttl=0.01, seed=5)
+
+    async def run():
+        registry.ensure_timer()
+        registry.create()
+        await asyncio.sleep(0.05)
+        return len(registry)
+
+    assert asyncio.run(run()) == 0
@@ -0,0 +1,78 @@
+"""
+Unit tests for the compiled skill catalog, effective stats and proc tables.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+
+from app.core.engine import PROC_CRIT, PROC_DOUBLE, PROC_DRAIN, compile_procs
+from app.core.skills import CATALOG, SKILL_TREE, SkillCatalog, effective_stats, unlocked_skill_ids
+
+
+def test_lookup_and_prerequisite():
+    assert CATALOG.get("str_2")["cost"] == 2
+    assert CATALOG.get("str_2")["branch"] == "strength"
+    assert CATALOG.prerequisite("str_1") is None
+    assert CATALOG.prerequisite("tech_3") == "tech_2"
+
+
+def test_check_unlock_rules():
+    CATALOG.check_unlock("spd_1", [])
+    CATALOG.check_unlock("spd_2", ["spd_1"])
+    for skill_id, owned in (("spd_2", []), ("spd_1", ["spd_1"])):
+        try:
+            CATALOG.check_unlock(skill_id, owned)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+    try:
+        CATALOG.check_unlock("nope", [])
+        assert False, "expected KeyError"
+    except KeyError:
+        pass
+
+
+def test_total_bonuses_sums_effects():
+    totals = CATALOG.total_bonuses(["str_1", "str_2", "tech_1", "unknown"])
+    assert totals == {"strength": 0.25, "technique": 0.1}
+
+
+def test_unlocked_skill_ids_accepts_both_shapes():
+    assert unlocked_skill_ids([{"skill_id": "a"}, {"id": "b"}, "c"]) == ["a", "b", "c"]
+
+
+def test_encoded_response_and_etag():
+    assert json.loads(CATALOG.encoded) == SKILL_TREE
+    assert CATALOG.etag == SkillCatalog(SKILL_TREE).etag
+
+
+def test_rejects_tier_gaps():
+    tree = {"x": {"skills": [{"id": "x1", "tier": 1, "cost": 1, "effect": {}},
+                             {"id": "x3", "tier": 3, "cost": 1, "effect": {}}]}}
+    try:
+        SkillCatalog(tree)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_effective_stats_folds_skill_and_style_bonuses():
+    data = {"strength": 1.0, "technique": 1.2, "speed": 0.9,
+            "total_bonuses": {"strength": 0.25}, "fighting_style": "grand_champion"}
+    result = effective_stats(data)
+    assert result["strength"] == 1.3
+    assert result["technique"] == 1.26
+    assert result["base_stats"]["strength"] == 1.0
+    assert data["strength"] == 1.0  # input untouched
+
+
+def test_effective_stats_legacy_doc_sums_unlocked():
+    result = effective_stats({"strength": 2.0, "unlocked_skills": [{"skill_id": "str_1"}]})
+    assert result["strength"] == 2.2 and result["speed"] == 1.0
+
+
+def test_compile_procs_table():
+    procs = compile_procs([{"skill_id": "str_1"}, "tech_2", {"skill_id": "spd_2"}, "mystery", {}])
+    assert procs == [(PROC_CRIT, 1.5), (PROC_DRAIN, 20.0), (PROC_DOUBLE, 1.8)]
@@ -0,0 +1,107 @@
+"""
+Unit tests for VersionTracker (ETag / ?since= support for polled endpoints).
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+
+from app.core.leaderboard import Leaderboard
+from app.core.prefetch import WrestlerPrefetchCache
+from app.core.versions import VersionTracker, if_none_match
+
+
+def test_etag_changes_only_on_bump():
+    tracker = VersionTracker()
+    etag = tracker.etag("lobby")
+    assert tracker.etag("lobby") == etag, "ETag should be stable without changes"
+
+    tracker.bump("lobby")
+    assert tracker.etag("lobby") != etag, "ETag should change after a bump"
+    assert tracker.etag("matches") == f'"matches-{tracker.boot_version}"'
+
+
+def test_wrestler_changes_since():
+    tracker = VersionTracker()
+    start = tracker.version("wrestlers")
+
+    tracker.touch_wrestler("a")
+    mid = tracker.version("wrestlers")
+    tracker.touch_wrestler("b")
+    tracker.delete_wrestler("a")
+
+    changed, deleted = tracker.wrestler_changes_since(start)
+    assert changed == ["b"]
+    assert deleted == ["a"]
+
+    changed, deleted = tracker.wrestler_changes_since(mid)
+    assert changed == ["b"] and deleted == ["a"]
+
+    assert tracker.wrestler_changes_since(tracker.version("wrestlers")) == ([], [])
+
+
+def test_stale_since_requires_full_resync():
+    tracker = VersionTracker()
+    assert tracker.wrestler_changes_since(0) is None
+
+
+def test_if_none_match():
+    assert if_none_match('"x-1"', '"x-1"')
+    assert if_none_match('W/"x-1", "y-2"', '"x-1"')
+    assert if_none_match("*", '"x-1"')
+    assert not if_none_match(None, '"x-1"')
+    assert not if_none_match('"x-0"', '"x-1"')
+
+
+def test_stored_counter_changes_invalidate():
+    tracker = VersionTracker()
+    etag = tracker.etag("wrestlers")
+    tracker.touch_wrestler("a")
+    since = tracker.version("wrestlers")
+    assert tracker.wrestler_changes_since(since) == ([], [])
+
+    # First sighting counts: a script may have written before the first check
+    assert tracker.sync_stored({"wrestlers": 3}) == ["wrestlers"]
+    assert tracker.etag("wrestlers") != etag
+    assert tracker.wrestler_changes_since(since) is None  # Full resync: no per-id log for it
+    synced = tracker.version("wrestlers")
+
+    assert tracker.sync_stored({"wrestlers": 3}) == []
+    assert tracker.version("wrestlers") == synced
+    assert tracker.sync_stored({"wrestlers": 4}) == ["wrestlers"]
+    assert tracker.wrestler_changes_since(tracker.version("wrestlers")) == ([], [])
+
+
+def test_stored_counter_change_stales_prefetched_wrestlers():
+    tracker = VersionTracker()
+    loads = []
+
+    def load(w_id):
+        loads.append(w_id)
+        return {"id": w_id, "rating": 1500 + len(loads)}
+
+    cache = WrestlerPrefetchCache(load, tracker.wrestler_version)
+
+    async def scenario():
+        first = await cache.get("a")
+        assert await cache.get("a") == first  # From memory
+        tracker.sync_stored({"wrestlers": 1})  # e.g. recompute_ratings.py rewrote ratings
+        return first, await cache.get("a")
+
+    first, second = asyncio.run(scenario())
+    assert loads == ["a", "a"] and second != first
+
+
+def test_stored_counter_change_drops_leaderboard(monkeypatch):
+    import main
+
+    monkeypatch.setattr(main, "get_db", lambda: None)
+    monkeypatch.setattr(main, "read_stored_versions", lambda db: {"wrestlers": 7})
+    monkeypatch.setattr(main, "_stored_versions_read_at", float("-inf"))
+    monkeypatch.setattr(main, "versions", VersionTracker())
+    monkeypatch.setattr(main, "leaderboard", Leaderboard())
+    main.leaderboard.load([("a", {"xp": 10, "wins": 1})])
+
+    main._sync_stored_versions()
+    assert not main.leaderboard.loaded and len(main.leaderboard) == 0
@@ -0,0 +1,53 @@
+"""
+Unit tests for roster query helpers (projections, search names, cursors).
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.wrestler_query import VIEWS, decode_cursor, encode_cursor, resolve_fields, search_name, validate_query
+
+
+def test_resolve_fields_views_and_explicit():
+    assert resolve_fields(None, None) is None
+    assert resolve_fields("full", None) is None
+    assert resolve_fields("picker", None) == VIEWS["picker"]
+    assert resolve_fields("picker", "name, color") == ["name", "color"]  # fields wins
+
+
+def test_resolve_fields_rejects_unknown():
+    for view, fields in (("tiny", None), (None, "name,password")):
+        try:
+            resolve_fields(view, fields)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+
+
+def test_search_name_prefers_custom_name():
+    assert search_name({"name": "Takayama", "custom_name": " Big Ed "}) == "big ed"
+    assert search_name({"name": "Takayama"}) == "takayama"
+    assert search_name({}) == ""
+
+
+def test_cursor_round_trip():
+    for value in ("takayama", 1200, None):
+        assert decode_cursor(encode_cursor(value, "abc")) == (value, "abc")
+    try:
+        decode_cursor("@@not-a-cursor")
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_validate_query_rejects_unindexed_mixes():
+    validate_query(stable="Isegahama", sort="xp")
+    validate_query(prefix="tak", active=True, sort="name")
+    validate_query(stable="Isegahama", rank=3, active=True, sort="id")
+    for kwargs in ({"stable": "Isegahama", "rank": 3}, {"active": True, "stable": "Isegahama", "sort": "wins"},
+                   {"prefix": "tak", "sort": "id"}, {"sort": "height"}):
+        try:
+            validate_query(**kwargs)
+            assert False, f"expected ValueError for {kwargs}"
+        except ValueError:
+            pass
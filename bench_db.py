@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: fresh sqlite3 connection per request vs the pooled db layer.
+
+Runs the LED device's two hottest request shapes against throwaway
+database files: the roster listing (read) and a match result (two
+wrestler updates + match insert, committed). The "legacy" side mirrors
+the old code path: connect, default rollback journal, close per request.
+Run it on the Pi itself for numbers that matter; SD card fsyncs dominate
+the write case there.
+
+Usage: python3 bench_db.py [--seconds N] [--wrestlers N]
+"""
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+from db import Database
+
+SCHEMA = '''CREATE TABLE wrestlers (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, custom_name TEXT, stable TEXT,
+    strength REAL, technique REAL, speed REAL, wins INTEGER DEFAULT 0, losses INTEGER DEFAULT 0,
+    matches INTEGER DEFAULT 0, xp INTEGER DEFAULT 0, is_active INTEGER DEFAULT 1);
+CREATE INDEX idx_wrestlers_active_wins ON wrestlers(is_active, wins DESC);
+CREATE TABLE matches (id INTEGER PRIMARY KEY AUTOINCREMENT, p1_id INTEGER, p2_id INTEGER,
+    winner_id INTEGER, timestamp DATETIME DEFAULT CURRENT_TIMESTAMP);'''
+
+READ_SQL = 'SELECT * FROM wrestlers WHERE is_active = 1 ORDER BY wins DESC'
+WIN_SQL = 'UPDATE wrestlers SET matches = matches + 1, wins = wins + 1, xp = xp + 50 WHERE id = ?'
+LOSS_SQL = 'UPDATE wrestlers SET matches = matches + 1, losses = losses + 1, xp = xp + 10 WHERE id = ?'
+MATCH_SQL = 'INSERT INTO matches (p1_id, p2_id, winner_id) VALUES (?, ?, ?)'
+
+
+def make_db(path: str, wrestlers: int) -> None:
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    conn.executemany('INSERT INTO wrestlers (name, stable, strength, technique, speed) VALUES (?, ?, 1, 1, 1)',
+                     [(f"W{i}", "Bench") for i in range(wrestlers)])
+    conn.commit()
+    conn.close()
+
+
+def legacy_read(path: str) -> None:
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute(READ_SQL).fetchall()
+    conn.close()
+
+
+def legacy_write(path: str, winner: int, loser: int) -> None:
+    conn = sqlite3.connect(path)
+    c = conn.cursor()
+    c.execute(WIN_SQL, (winner,))
+    c.execute(LOSS_SQL, (loser,))
+    c.execute(MATCH_SQL, (winner, loser, winner))
+    conn.commit()
+    conn.close()
+
+
+def pooled_write(db: Database, winner: int, loser: int) -> None:
+    with db.unit_of_work() as c:
+        c.execute(WIN_SQL, (winner,))
+        c.execute(LOSS_SQL, (loser,))
+        c.execute(MATCH_SQL, (winner, loser, winner))
+
+
+def rate(fn, seconds: float) -> float:
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        fn(count)
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seconds', type=float, default=2.0)
+    parser.add_argument('--wrestlers', type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = os.path.join(tmp, 'legacy.db')
+        pooled_path = os.path.join(tmp, 'pooled.db')
+        make_db(legacy_path, args.wrestlers)
+        make_db(pooled_path, args.wrestlers)
+        db = Database(pooled_path)
+        n = args.wrestlers
+
+        results = [
+            ("roster read", rate(lambda i: legacy_read(legacy_path), args.seconds),
+             rate(lambda i: db.query(READ_SQL), args.seconds)),
+            ("match write", rate(lambda i: legacy_write(legacy_path, i % n + 1, (i + 1) % n + 1), args.seconds),
+             rate(lambda i: pooled_write(db, i % n + 1, (i + 1) % n + 1), args.seconds)),
+        ]
+        db.close_all()
+
+    print(f"{'request':<14}{'legacy/s':>12}{'pooled/s':>12}{'speedup':>10}")
+    for name, legacy, pooled in results:
+        print(f"{name:<14}{legacy:>12.0f}{pooled:>12.0f}{pooled / legacy:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark: match history on a synthetic large database, before and after
+the history indexes.
+
+Builds a throwaway database with N matches between W wrestlers, then times
+the old /api/history query (OR filter, ORDER BY timestamp, no indexes)
+against match_history.query_history() with HISTORY_INDEXES applied: the
+first page, and a page deep into one wrestler's history via the cursor.
+
+Usage: python3 bench_history.py [--matches N] [--wrestlers N] [--repeat N]
+"""
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from db import Database
+from match_history import HISTORY_INDEXES, query_history
+
+SCHEMA = '''CREATE TABLE wrestlers (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, custom_name TEXT);
+CREATE TABLE matches (id INTEGER PRIMARY KEY AUTOINCREMENT, p1_id INTEGER, p2_id INTEGER,
+    winner_id INTEGER, timestamp DATETIME DEFAULT CURRENT_TIMESTAMP);'''
+
+LEGACY_SQL = '''
+    SELECT m.id, m.timestamp,
+           w1.name as p1_name, w1.custom_name as p1_custom,
+           w2.name as p2_name, w2.custom_name as p2_custom,
+           wWin.name as winner_name, wWin.custom_name as winner_custom
+    FROM matches m
+    JOIN wrestlers w1 ON m.p1_id = w1.id
+    JOIN wrestlers w2 ON m.p2_id = w2.id
+    JOIN wrestlers wWin ON m.winner_id = wWin.id
+    WHERE (m.p1_id = ? OR m.p2_id = ?) ORDER BY m.timestamp DESC LIMIT 50'''
+
+
+def make_db(path: str, matches: int, wrestlers: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    conn.executemany('INSERT INTO wrestlers (name) VALUES (?)', [(f"W{i}",) for i in range(wrestlers)])
+
+    def rows():
+        start = 1_700_000_000
+        for i in range(matches):
+            p1 = rng.randint(1, wrestlers)
+            p2 = rng.randint(1, wrestlers - 1)
+            p2 += p2 >= p1
+            # Several bouts share each second, so paging has to break timestamp ties on id
+            ts = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(start + i // 3))
+            yield p1, p2, rng.choice((p1, p2)), ts
+
+    conn.executemany('INSERT INTO matches (p1_id, p2_id, winner_id, timestamp) VALUES (?, ?, ?, ?)', rows())
+    conn.commit()
+    conn.close()
+
+
+def timed(fn, repeat: int) -> float:
+    """Best-of-repeat milliseconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--matches', type=int, default=1_000_000)
+    parser.add_argument('--wrestlers', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'history.db')
+        print(f"Building {args.matches} matches between {args.wrestlers} wrestlers...")
+        make_db(path, args.matches, args.wrestlers)
+        db = Database(path)
+        w_id = 7
+
+        legacy_ms = timed(lambda: db.query(LEGACY_SQL, (w_id, w_id)), args.repeat)
+        legacy_all_ms = timed(lambda: db.query(LEGACY_SQL.replace(
+            'WHERE (m.p1_id = ? OR m.p2_id = ?) ', '')), args.repeat)
+
+        start = time.perf_counter()
+        with db.unit_of_work() as c:
+            for statement in HISTORY_INDEXES:
+                c.execute(statement)
+        index_s = time.perf_counter() - start
+
+        first_ms = timed(lambda: query_history(db, wrestler_id=w_id), args.repeat)
+        all_ms = timed(lambda: query_history(db), args.repeat)
+        # Walk 20 pages in, then time the page after that
+        cursor = None
+        for _ in range(20):
+            _, cursor = query_history(db, wrestler_id=w_id, after=cursor)
+        deep_ms = timed(lambda: query_history(db, wrestler_id=w_id, after=cursor), args.repeat)
+        db.close_all()
+
+    print(f"Index build: {index_s:.1f}s")
+    print(f"{'query':<26}{'legacy ms':>12}{'indexed ms':>12}")
+    print(f"{'wrestler, first page':<26}{legacy_ms:>12.2f}{first_ms:>12.2f}")
+    print(f"{'wrestler, page 21':<26}{'-':>12}{deep_ms:>12.2f}")
+    print(f"{'all matches, first page':<26}{legacy_all_ms:>12.2f}{all_ms:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
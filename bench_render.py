@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: LED game loop cost on the headless NumPy panel.
+
+Runs sumo_game with SUMO_HEADLESS=1 against a throwaway database, plays
+scripted matches between two freshly created wrestlers (fixed seed, so
+runs are comparable) and times SumoGame.logic() and draw() per frame.
+Every frame is also redrawn in full with dirty-frame skipping bypassed, to
+report the raw cost of a draw and of each SetPixel it makes. Off the Pi
+this measures the Python side only; the hardware's own SetPixel and swap
+costs come on top.
+
+Usage: python3 bench_render.py [--matches N] [--seed N]
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import tempfile
+import time
+
+
+def play(sumo_game, game, matches: int, full_redraw: bool):
+    """Ticks through `matches` scripted bouts. Returns (frames, logic_s, draw_s, set_pixel_calls)."""
+    C = sumo_game.C
+    frames = 0
+    logic_s = draw_s = 0.0
+    set_pixel_calls = 0
+    for _ in range(matches):
+        sumo_game.GAME_STATE['reset_requested'] = True
+        seen_fight = False
+        while True:
+            start = time.perf_counter()
+            game.logic()
+            mid = time.perf_counter()
+            if full_redraw:
+                game._last_frame = None
+            calls_before = game.canvas.set_pixel_calls
+            canvas = game.canvas
+            game.draw()
+            end = time.perf_counter()
+            set_pixel_calls += canvas.set_pixel_calls - calls_before
+            logic_s += mid - start
+            draw_s += end - mid
+            frames += 1
+            seen_fight = seen_fight or game.state == C.STATE_WINNER
+            if seen_fight and game.state == C.STATE_WAITING:
+                break
+    return frames, logic_s, draw_s, set_pixel_calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--matches', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    os.environ['SUMO_HEADLESS'] = '1'
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)  # sumo_game opens C.DB_FILE relative to the working directory
+        with contextlib.redirect_stdout(io.StringIO()):
+            import sumo_game
+            client = sumo_game.app.test_client()
+            for _ in range(2):
+                client.post('/api/wrestlers', json={})
+            p1, p2 = client.get('/api/wrestlers').get_json()[:2]
+            sumo_game.GAME_STATE['p1_data'] = p1
+            sumo_game.GAME_STATE['p2_data'] = p2
+
+            results = {}
+            for label, full_redraw in (("skip unchanged", False), ("full redraw", True)):
+                random.seed(args.seed)
+                game = sumo_game.SumoGame()
+                results[label] = play(sumo_game, game, args.matches, full_redraw)
+            sumo_game.result_writer.close()
+            sumo_game.db.close_all()
+
+    print(f"{args.matches} matches, seed {args.seed}")
+    print(f"{'mode':<16}{'frames':>8}{'logic us':>10}{'draw us':>10}{'max fps':>10}{'px/frame':>10}{'ns/px':>8}")
+    for label, (frames, logic_s, draw_s, calls) in results.items():
+        logic_us = logic_s / frames * 1e6
+        draw_us = draw_s / frames * 1e6
+        per_px = f"{draw_s / calls * 1e9:>8.0f}" if calls else f"{'-':>8}"
+        print(f"{label:<16}{frames:>8}{logic_us:>10.1f}{draw_us:>10.1f}"
+              f"{1e6 / (logic_us + draw_us):>10.0f}{calls / frames:>10.1f}{per_px}")
+
+
+if __name__ == '__main__':
+    main()
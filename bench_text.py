@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sidebar text rendering, per-bit font walk vs cached sprites.
+
+Draws the intro sidebar (two names, two records, "VS") onto a counting
+canvas the way draw_text_small used to (walk FONT_3x5 rows and bits for
+every character, every frame) and with render.text_sprite(). SetPixel is
+a no-op here, so the numbers are the Python overhead per frame; on the Pi
+the hardware SetPixel cost is the same for both.
+
+Usage: python3 bench_text.py [--seconds N]
+"""
+import argparse
+import time
+
+import constants as C
+import fonts
+from render import draw_sprite, text_sprite, text_width
+
+LINES = [("Takanohana", C.COLOR_RED), ("12-3", C.COLOR_GREY), ("VS", C.COLOR_WHITE),
+         ("Asashoryu", C.COLOR_BLUE), ("9-6", C.COLOR_GREY)]
+
+
+class CountingCanvas:
+    def __init__(self):
+        self.calls = 0
+
+    def SetPixel(self, x, y, r, g, b):
+        self.calls += 1
+
+
+def legacy_text(canvas, x, y, text, color):
+    cursor_x = int(x)
+    cursor_y = int(y)
+    for char in text.upper():
+        if char in fonts.FONT_3x5:
+            rows = fonts.FONT_3x5[char]
+            for r, row_bits in enumerate(rows):
+                for bit in range(3):
+                    if (row_bits >> (2 - bit)) & 1:
+                        canvas.SetPixel(cursor_x + bit, cursor_y + r, *color)
+        cursor_x += 4
+
+
+def legacy_frame(canvas):
+    # Layout recomputed every frame, as draw_sidebar_text used to
+    curr_y = 3
+    for text, color in LINES:
+        w = len(text) * 4 - 1
+        legacy_text(canvas, 16 - w / 2, curr_y, text, color)
+        curr_y += 6
+
+
+LAYOUT = [(int(16 - text_width(text) / 2), 3 + i * 6, text_sprite(text, color))
+          for i, (text, color) in enumerate(LINES)]
+
+
+def cached_frame(canvas):
+    for x, y, sprite in LAYOUT:
+        draw_sprite(canvas, x, y, sprite)
+
+
+def rate(fn, seconds: float) -> float:
+    canvas = CountingCanvas()
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        fn(canvas)
+        count += 1
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seconds', type=float, default=2.0)
+    args = parser.parse_args()
+
+    legacy_us = rate(legacy_frame, args.seconds)
+    cached_us = rate(cached_frame, args.seconds)
+    print(f"{'sidebar frame':<16}{'legacy us':>12}{'cached us':>12}{'speedup':>10}")
+    print(f"{'intro':<16}{legacy_us:>12.1f}{cached_us:>12.1f}{legacy_us / cached_us:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -87,8 +87,12 @@ HEIGHT = 32
 CENTER_X = 48  # Moved to right side
 CENTER_Y = HEIGHT // 2
 RING_RADIUS = 13  # Slightly smaller to fit safely
-FPS = 30
+FPS = 30  # Fixed logic rate (perf.FrameClock)
+RENDER_FPS = 60  # Draw rate: frames between logic steps interpolate positions (unchanged ones are skipped)
+MAX_CATCHUP_STEPS = 5  # Logic steps run back-to-back after a stall before the rest are dropped
+PERF_WINDOW_SECONDS = 60  # Rolling window behind /api/perf
 VSYNC = True
+BOOT_BUDGET_MS = 3000  # Power-on to first frame drawn (sumo_game.report_boot)
 
 # --- Colors (R, G, B) - GBA-Inspired Sumo Palette ---
 COLOR_BLACK = (0, 0, 0)
@@ -0,0 +1,235 @@
+"""
+SQLite access layer for the LED device.
+
+Connections are opened once and reused: a thread checks one out of a small
+idle pool for the duration of a query or unit of work, and any nested call
+on the same thread reuses it (so helpers can be composed into one
+transaction). Each connection is set up once with WAL journaling and tuned
+pragmas, and keeps sqlite3's per-connection prepared-statement cache warm.
+In-memory state that mirrors a write (caches, log lines) goes through
+after_commit(), so a rolled-back transaction never leaves it ahead of the DB.
+"""
+import contextlib
+import queue
+import sqlite3
+import threading
+import traceback
+from typing import Any, Callable, Iterator, List, Optional, Sequence
+
+import constants as C
+
+# Applied once per new connection
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",      # Readers never block the writer (and vice versa)
+    "PRAGMA synchronous=NORMAL",    # Safe with WAL; avoids an fsync per commit on the SD card
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-4000",      # ~4 MB page cache per connection
+    "PRAGMA busy_timeout=5000",     # Wait for a competing writer instead of failing
+)
+STATEMENT_CACHE = 128   # Prepared statements kept per connection
+MAX_IDLE = 4            # Idle connections kept for reuse
+MAX_PENDING_WRITES = 64 # BatchWriter queue bound
+MAX_BATCH = 16          # Write jobs committed per transaction
+
+
+class Database:
+    def __init__(self, path: str = C.DB_FILE, max_idle: int = MAX_IDLE):
+        self.path = path
+        self.max_idle = max_idle
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._local = threading.local()
+        self.opened = 0  # Connections created over the lifetime (for benchmarks/diagnostics)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode: transactions are only the explicit BEGINs in unit_of_work()
+        conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False,
+                               cached_statements=STATEMENT_CACHE)
+        conn.row_factory = sqlite3.Row
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        self.opened += 1
+        return conn
+
+    @contextlib.contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """This thread's connection if it already holds one, else one from the pool."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            yield conn
+            return
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        self._local.conn = conn
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            if conn.in_transaction:
+                conn.rollback()  # Never hand out a connection mid-transaction
+            if self._idle.qsize() < self.max_idle:
+                self._idle.put(conn)
+            else:
+                conn.close()
+
+    @contextlib.contextmanager
+    def unit_of_work(self) -> Iterator[sqlite3.Connection]:
+        """
+        One transaction. Nested units on the same thread join the outer one,
+        so everything commits (or rolls back) together, and after_commit()
+        callbacks from any of them run once the outermost one has committed.
+        """
+        with self.connection() as conn:
+            if conn.in_transaction:
+                yield conn
+                return
+            conn.execute("BEGIN IMMEDIATE")
+            self._local.after_commit = []
+            try:
+                yield conn
+            except BaseException:
+                self._local.after_commit = None
+                conn.rollback()
+                raise
+            callbacks, self._local.after_commit = self._local.after_commit, None
+            conn.commit()
+            for fn in callbacks:
+                try:
+                    fn()
+                except Exception:
+                    traceback.print_exc()  # The data is committed; don't let a callback undo that
+
+    def after_commit(self, fn: Callable[[], Any]) -> None:
+        """
+        Run fn once this thread's unit of work commits; it is dropped if the
+        unit rolls back. Outside a unit of work, runs fn straight away.
+        """
+        pending = getattr(self._local, "after_commit", None)
+        if pending is None:
+            fn()
+        else:
+            pending.append(fn)
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        with self.connection() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def query_one(self, sql: str, params: Sequence[Any] = ()) -> Optional[sqlite3.Row]:
+        with self.connection() as conn:
+            return conn.execute(sql, params).fetchone()
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> sqlite3.Cursor:
+        """Single write statement (commits on its own outside a unit of work)."""
+        with self.connection() as conn:
+            return conn.execute(sql, params)
+
+    def migrate(self, migrations: Sequence[Callable[[sqlite3.Connection], None]]) -> int:
+        """
+        Bring the schema up to len(migrations), tracked in PRAGMA user_version.
+        migrations[i] upgrades version i to i + 1; each step commits with its
+        version bump. A current database costs one PRAGMA read. Returns the
+        number of steps applied.
+        """
+        current = self.query_one('PRAGMA user_version')[0]
+        for version in range(current, len(migrations)):
+            with self.unit_of_work() as conn:
+                migrations[version](conn)
+                conn.execute(f'PRAGMA user_version = {version + 1}')
+        return max(0, len(migrations) - current)
+
+    def close_all(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+
+class BatchWriter:
+    """
+    Applies write jobs on one background thread so callers (the render
+    loop) never wait on SQLite. Jobs queued together are committed in a
+    single transaction; if that fails, each is retried on its own so one bad
+    job cannot lose the others. A job can therefore run more than once, so
+    anything besides its writes (logging, caches) belongs in
+    Database.after_commit().
+    """
+
+    _STOP = object()
+
+    def __init__(self, database: Database, max_pending: int = MAX_PENDING_WRITES, max_batch: int = MAX_BATCH):
+        self.db = database
+        self.max_batch = max_batch
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.applied = 0
+        self.batches = 0
+        self.failed = 0
+        self.dropped = 0
+
+    def _ensure_thread(self) -> None:
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+                self._thread.start()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> bool:
+        """Queue fn(*args) without blocking. Returns False (and drops it) if the queue is full."""
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait((fn, args))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            print(f"[DB] Write queue full, dropped {getattr(fn, '__name__', fn)}")
+            return False
+
+    def flush(self) -> None:
+        """Block until everything queued so far has been applied."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Apply what is queued, then stop the thread."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(job is self._STOP for job in batch)
+            jobs = [job for job in batch if job is not self._STOP]
+            if jobs:
+                self._apply(jobs)
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _apply(self, jobs: List[Any]) -> None:
+        try:
+            with self.db.unit_of_work():
+                for fn, args in jobs:
+                    fn(*args)
+            self.applied += len(jobs)
+            self.batches += 1
+            return
+        except Exception:
+            if len(jobs) == 1:
+                self.failed += 1
+                traceback.print_exc()
+                return
+        for job in jobs:
+            self._apply([job])
+
+
+db = Database()
@@ -0,0 +1,76 @@
+"""
+Headless stand-in for rpi-rgb-led-matrix, backed by NumPy.
+
+Implements the part of the rgbmatrix API the game uses (RGBMatrixOptions,
+RGBMatrix.CreateFrameCanvas / SwapOnVSync, and canvas SetPixel / Clear /
+Fill / SetImage) on in-memory uint8 framebuffers, so the renderer can run
+and be measured without a panel or the emulator's display. Selected with
+SUMO_HEADLESS=1 (see sumo_game.py); needs numpy, which the Pi build does not.
+
+Like the real library, SwapOnVSync is double-buffered: it shows the canvas
+passed in and hands back the previous front buffer to draw the next frame on.
+"""
+from typing import Any, Optional
+
+import numpy as np
+
+graphics = None  # rgbmatrix.graphics (fonts/lines) is not used by the game
+
+
+class RGBMatrixOptions:
+    def __init__(self):
+        self.rows = 32
+        self.cols = 32
+        self.chain_length = 1
+        self.parallel = 1
+        self.hardware_mapping = 'regular'
+
+
+class HeadlessCanvas:
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.buffer = np.zeros((height, width, 3), dtype=np.uint8)
+        self.set_pixel_calls = 0
+
+    def SetPixel(self, x: int, y: int, r: int, g: int, b: int) -> None:
+        self.set_pixel_calls += 1
+        # Off-panel pixels are ignored, as on the hardware
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.buffer[y, x] = (r, g, b)
+
+    def Clear(self) -> None:
+        self.buffer.fill(0)
+
+    def Fill(self, r: int, g: int, b: int) -> None:
+        self.buffer[:] = (r, g, b)
+
+    def SetImage(self, image: Any, offset_x: int = 0, offset_y: int = 0, unsafe: bool = True) -> None:
+        """Copy an RGB image (PIL Image or HxWx3 array) onto the canvas, clipped to the panel."""
+        pixels = np.asarray(image, dtype=np.uint8)[..., :3]
+        h, w = pixels.shape[:2]
+        x0, y0 = max(0, offset_x), max(0, offset_y)
+        x1, y1 = min(self.width, offset_x + w), min(self.height, offset_y + h)
+        if x0 < x1 and y0 < y1:
+            self.buffer[y0:y1, x0:x1] = pixels[y0 - offset_y:y1 - offset_y, x0 - offset_x:x1 - offset_x]
+
+
+class RGBMatrix:
+    def __init__(self, options: Optional[RGBMatrixOptions] = None):
+        options = options or RGBMatrixOptions()
+        self.width = options.cols * options.chain_length
+        self.height = options.rows * options.parallel
+        self.front = HeadlessCanvas(self.width, self.height)  # What the "panel" shows
+        self.swaps = 0
+
+    def CreateFrameCanvas(self) -> HeadlessCanvas:
+        return HeadlessCanvas(self.width, self.height)
+
+    def SwapOnVSync(self, canvas: HeadlessCanvas, framerate_fraction: int = 1) -> HeadlessCanvas:
+        self.swaps += 1
+        previous, self.front = self.front, canvas
+        return previous
+
+    def frame(self) -> np.ndarray:
+        """Copy of the displayed frame, HxWx3 uint8."""
+        return self.front.buffer.copy()
@@ -0,0 +1,95 @@
+"""
+Match history queries for the LED device.
+
+Pages are newest-first and keyset-paginated on (timestamp, id), so every
+page is an index range scan no matter how deep it is. The per-wrestler
+query is split into one branch per side (p1 / p2) so each can walk its own
+(p?_id, timestamp) index from HISTORY_INDEXES (migration v3 in sumo_game.py).
+"""
+import base64
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from db import Database
+
+DEFAULT_HISTORY_LIMIT = 50
+MAX_HISTORY_LIMIT = 100
+
+# The rowid (id) is implicitly the last key column, so these order by (timestamp, id)
+HISTORY_INDEXES = (
+    'CREATE INDEX IF NOT EXISTS idx_matches_p1_time ON matches(p1_id, timestamp)',
+    'CREATE INDEX IF NOT EXISTS idx_matches_p2_time ON matches(p2_id, timestamp)',
+    'CREATE INDEX IF NOT EXISTS idx_matches_time ON matches(timestamp)',
+)
+
+_COLUMNS = '''m.id, m.timestamp,
+       w1.name as p1_name, w1.custom_name as p1_custom,
+       w2.name as p2_name, w2.custom_name as p2_custom,
+       wWin.name as winner_name, wWin.custom_name as winner_custom'''
+
+_JOINS = '''JOIN wrestlers w1 ON m.p1_id = w1.id
+JOIN wrestlers w2 ON m.p2_id = w2.id
+JOIN wrestlers wWin ON m.winner_id = wWin.id'''
+
+
+def encode_cursor(timestamp: str, match_id: int) -> str:
+    """Opaque cursor for the position after (timestamp, match_id)."""
+    raw = json.dumps({"t": timestamp, "id": match_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """Inverse of encode_cursor. Raises ValueError on malformed input."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return str(data["t"]), int(data["id"])
+    except (KeyError, TypeError, ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+
+
+def _side(column: str, keyset: str, exclude_self: bool = False) -> str:
+    # One index range scan per side; the outer query merges the two short lists
+    extra = ' AND p1_id != ?' if exclude_self else ''
+    return f'''SELECT * FROM (
+        SELECT id, timestamp, p1_id, p2_id, winner_id FROM matches
+        WHERE {column} = ?{extra}{keyset}
+        ORDER BY timestamp DESC, id DESC LIMIT ?)'''
+
+
+def query_history(
+    database: Database,
+    wrestler_id: Optional[int] = None,
+    limit: int = DEFAULT_HISTORY_LIMIT,
+    after: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Newest-first match history, optionally for one wrestler. Returns
+    (matches, next_cursor); next_cursor is None on the last page.
+    """
+    limit = max(1, min(limit, MAX_HISTORY_LIMIT))
+    keyset = ''
+    keyset_params: List[Any] = []
+    if after:
+        keyset = ' AND (timestamp, id) < (?, ?)'
+        keyset_params = list(decode_cursor(after))
+
+    if wrestler_id is not None:
+        # p1_id != ? keeps a self-match from showing up twice
+        source = f'({_side("p1_id", keyset)} UNION ALL {_side("p2_id", keyset, exclude_self=True)})'
+        params = ([wrestler_id, *keyset_params, limit]
+                  + [wrestler_id, wrestler_id, *keyset_params, limit])
+    else:
+        source = f'''(SELECT id, timestamp, p1_id, p2_id, winner_id FROM matches
+            WHERE 1{keyset} ORDER BY timestamp DESC, id DESC LIMIT ?)'''
+        params = [*keyset_params, limit]
+
+    rows = database.query(f'''SELECT {_COLUMNS} FROM {source} m
+        {_JOINS}
+        ORDER BY m.timestamp DESC, m.id DESC LIMIT ?''', [*params, limit])
+    matches = [dict(row) for row in rows]
+
+    next_cursor = None
+    if len(matches) == limit:
+        next_cursor = encode_cursor(matches[-1]['timestamp'], matches[-1]['id'])
+    return matches, next_cursor
@@ -0,0 +1,104 @@
+"""
+Frame pacing for the LED game loop.
+
+FrameClock runs logic at a fixed rate off time.perf_counter and wakes the
+loop at the faster render rate: each wake-up runs the logic steps that are
+due (often none) and draws with an interpolation factor between the last
+two steps, so motion is smoothed rather than stepping at the logic rate. If the loop
+falls behind (a slow frame, the Pi being busy), it catches up by running at
+most C.MAX_CATCHUP_STEPS steps and drops the rest, so one stall cannot
+snowball into a burst of fast-forwarded logic.
+
+FrameStats keeps a rolling window of frame periods and work times for
+/api/perf, so late and dropped frames are visible in the field.
+"""
+import bisect
+import collections
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+import constants as C
+
+# Histogram bucket upper bounds for frame periods, in ms (last bucket is open-ended)
+HISTOGRAM_MS = (17, 20, 30, 34, 40, 50, 67, 100, 250)
+
+
+class FrameClock:
+    def __init__(self, hz: float = C.FPS, max_catchup: int = C.MAX_CATCHUP_STEPS,
+                 render_hz: float = C.RENDER_FPS):
+        self.step = 1.0 / hz
+        self.frame = 1.0 / render_hz
+        self.max_catchup = max_catchup
+        self.lag = 0.0
+        self.last = time.perf_counter()
+        self.dropped_steps = 0
+
+    def advance(self) -> Tuple[int, float]:
+        """Logic steps due since the last call, and the period since then (s)."""
+        now = time.perf_counter()
+        period = now - self.last
+        self.last = now
+        self.lag += period
+        steps = int(self.lag / self.step)
+        if steps > self.max_catchup:
+            self.dropped_steps += steps - self.max_catchup
+            steps = self.max_catchup
+            self.lag = self.lag % self.step
+        else:
+            self.lag -= steps * self.step
+        return steps, period
+
+    def alpha(self) -> float:
+        """How far between the last two logic steps to draw (0..1)."""
+        return min(1.0, self.lag / self.step)
+
+    def sleep_time(self) -> float:
+        """Time left until the next logic step or the next frame, whichever comes first."""
+        return max(0.0, min(self.step - self.lag, self.frame) - (time.perf_counter() - self.last))
+
+
+class FrameStats:
+    def __init__(self, window: int = C.RENDER_FPS * C.PERF_WINDOW_SECONDS, target_hz: float = C.RENDER_FPS):
+        self.target_ms = 1000.0 / target_hz
+        self._periods: "collections.deque[float]" = collections.deque(maxlen=window)
+        self._work: "collections.deque[float]" = collections.deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.frames = 0
+        self.dropped_steps = 0  # Logic steps FrameClock gave up on (set by the game loop)
+
+    def record(self, period: float, work: float) -> None:
+        """One loop iteration: time since the previous one, and time spent in logic + draw (s)."""
+        with self._lock:
+            self._periods.append(period * 1000)
+            self._work.append(work * 1000)
+            self.frames += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            periods = sorted(self._periods)
+            work = sorted(self._work)
+            frames = self.frames
+
+        def pct(values, p):
+            return round(values[min(len(values) - 1, int(len(values) * p))], 2) if values else None
+
+        counts = [0] * (len(HISTOGRAM_MS) + 1)
+        for ms in periods:
+            counts[bisect.bisect_left(HISTOGRAM_MS, ms)] += 1
+
+        mean = sum(periods) / len(periods) if periods else 0.0
+        return {
+            "frames": frames,
+            "window": len(periods),
+            "target_ms": round(self.target_ms, 2),
+            "fps": round(1000.0 / mean, 1) if mean else None,
+            "period_ms": {"p50": pct(periods, 0.5), "p95": pct(periods, 0.95),
+                          "p99": pct(periods, 0.99), "max": pct(periods, 1.0)},
+            "work_ms": {"p50": pct(work, 0.5), "p95": pct(work, 0.95), "max": pct(work, 1.0)},
+            # A frame counts as late once it overruns its slot by half a frame
+            "late": sum(1 for ms in periods if ms > self.target_ms * 1.5),
+            "dropped_steps": self.dropped_steps,
+            # Ordered buckets of frame periods; max_ms None is everything above the last edge
+            "histogram": [{"max_ms": edge, "count": n} for edge, n in zip((*HISTOGRAM_MS, None), counts)],
+        }
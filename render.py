@@ -0,0 +1,136 @@
+"""
+Cached rasterization for the LED renderer.
+
+The arena (sidebar separator, dohyo ring, salt piles) never changes, so it
+is rasterized once per panel size and screen-shake offset instead of being
+re-plotted with trig and ~110 SetPixel calls every frame. With Pillow
+installed each variant is a ready-made RGB image pushed with one
+canvas.SetImage() (a bulk copy in rpi-rgb-led-matrix, which also replaces
+the Clear()); without it, each variant falls back to a precomputed pixel list.
+
+Text works the same way: fonts.FONT_3x5 is compiled to per-glyph pixel
+offsets at import, and each (text, color) pair is laid out once into a
+sprite that draw_sprite() replays with one SetPixel per lit pixel.
+"""
+import functools
+import math
+from typing import Any, Dict, List, Tuple
+
+import constants as C
+import fonts
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+SHAKE_RANGE = 1  # SumoGame.draw shakes the ring by -1..1 px on each axis
+
+SALT_PILES = ((35, 2), (35, 29), (61, 2), (61, 29))
+SALT_COLOR = (80, 80, 80)
+SEPARATOR_X = 32
+SEPARATOR_COLOR = (20, 20, 20)
+
+GLYPH_WIDTH = 3
+GLYPH_ADVANCE = 4       # 3px char + 1px gap
+TEXT_CACHE_SIZE = 256   # (text, color) sprites kept
+
+Pixel = Tuple[int, int, int, int, int]  # x, y, r, g, b
+Sprite = Tuple[Pixel, ...]              # Pixels relative to the top-left corner
+
+
+def arena_pixels(width: int, height: int, sx: int = 0, sy: int = 0) -> List[Pixel]:
+    """The static scene with the ring shifted by (sx, sy), in draw order."""
+    pixels: Dict[Tuple[int, int], Tuple[int, int, int]] = {}
+
+    # Sidebar Separator Line
+    for y in range(height):
+        pixels[(SEPARATOR_X, y)] = SEPARATOR_COLOR
+
+    # Ring (Dohyo) - Right Side
+    for angle in range(0, 360, 5):
+        rad = math.radians(angle)
+        x = int(C.CENTER_X + sx + math.cos(rad) * C.RING_RADIUS)
+        y = int(C.CENTER_Y + sy + math.sin(rad) * C.RING_RADIUS)
+        if 0 <= x < width and 0 <= y < height:
+            pixels[(x, y)] = C.COLOR_RING
+
+    # Balance Elements: Salt Piles (not shaken)
+    for x, y in SALT_PILES:
+        pixels[(x, y)] = SALT_COLOR
+
+    return [(x, y, *color) for (x, y), color in pixels.items()]
+
+
+class StaticBackground:
+    """Every shake variant of the arena for one panel size, built up front."""
+
+    def __init__(self, width: int = C.WIDTH, height: int = C.HEIGHT):
+        self.width = width
+        self.height = height
+        offsets = range(-SHAKE_RANGE, SHAKE_RANGE + 1)
+        self.pixels: Dict[Tuple[int, int], List[Pixel]] = {
+            (sx, sy): arena_pixels(width, height, sx, sy) for sx in offsets for sy in offsets
+        }
+        self.images: Dict[Tuple[int, int], Any] = {}
+        if Image is not None:
+            for offset, pixels in self.pixels.items():
+                image = Image.new('RGB', (width, height))
+                for x, y, r, g, b in pixels:
+                    image.putpixel((x, y), (r, g, b))
+                self.images[offset] = image
+
+    def blit(self, canvas: Any, sx: int = 0, sy: int = 0) -> None:
+        """Reset the canvas to the arena (shaken by sx, sy); replaces canvas.Clear()."""
+        image = self.images.get((sx, sy))
+        if image is not None and hasattr(canvas, 'SetImage'):
+            canvas.SetImage(image, 0, 0)
+            return
+        canvas.Clear()
+        set_pixel = canvas.SetPixel
+        for x, y, r, g, b in self.pixels[(sx, sy)]:
+            set_pixel(x, y, r, g, b)
+
+
+_backgrounds: Dict[Tuple[int, int], StaticBackground] = {}
+
+
+def static_background(width: int = C.WIDTH, height: int = C.HEIGHT) -> StaticBackground:
+    """Shared StaticBackground per resolution (built on first use)."""
+    key = (width, height)
+    if key not in _backgrounds:
+        _backgrounds[key] = StaticBackground(width, height)
+    return _backgrounds[key]
+
+
+def _compile_glyph(rows: List[int]) -> Tuple[Tuple[int, int], ...]:
+    return tuple((bit, r) for r, row_bits in enumerate(rows)
+                 for bit in range(GLYPH_WIDTH) if (row_bits >> (GLYPH_WIDTH - 1 - bit)) & 1)
+
+
+# Lit (dx, dy) offsets per character
+GLYPHS: Dict[str, Tuple[Tuple[int, int], ...]] = {
+    char: _compile_glyph(rows) for char, rows in fonts.FONT_3x5.items()
+}
+
+
+def text_width(text: str) -> int:
+    return len(text) * GLYPH_ADVANCE - 1
+
+
+@functools.lru_cache(maxsize=TEXT_CACHE_SIZE)
+def text_sprite(text: str, color: Tuple[int, int, int]) -> Sprite:
+    """text in the 3x5 font (upper-cased; unknown characters leave a gap)."""
+    r, g, b = color
+    pixels = []
+    for i, char in enumerate(text.upper()):
+        x0 = i * GLYPH_ADVANCE
+        for dx, dy in GLYPHS.get(char, ()):
+            pixels.append((x0 + dx, dy, r, g, b))
+    return tuple(pixels)
+
+
+def draw_sprite(canvas: Any, x: int, y: int, sprite: Sprite) -> None:
+    set_pixel = canvas.SetPixel
+    for dx, dy, r, g, b in sprite:
+        set_pixel(x + dx, y + dy, r, g, b)
@@ -0,0 +1,87 @@
+"""
+In-memory stat bonuses (unlocked skills + fighting style) per wrestler.
+
+Building a Wrestler for a fight reads its bonuses from here instead of
+joining wrestler_skills and skills on every match. The cache is loaded once
+at startup with each skill's effect_json parsed a single time, then kept
+current by the skill unlock and fighting-style writes, which update it only
+after their transaction commits (Database.after_commit), so a rollback never
+leaves it holding a bonus the DB does not have.
+"""
+import json
+import threading
+from typing import Dict, List
+
+import constants as C
+from db import Database
+
+
+def _zero() -> Dict[str, float]:
+    return {"strength": 0.0, "technique": 0.0, "speed": 0.0}
+
+
+class SkillBonusCache:
+    def __init__(self, database: Database):
+        self.db = database
+        self._lock = threading.Lock()
+        self._effects: Dict[str, Dict[str, float]] = {}   # skill id -> parsed effect
+        self._skills: Dict[int, List[str]] = {}            # wrestler id -> unlocked skill ids
+        self._styles: Dict[int, str] = {}                  # wrestler id -> fighting style
+        self._bonuses: Dict[int, Dict[str, float]] = {}
+
+    def load(self) -> None:
+        db = self.db
+        effects = {row['id']: json.loads(row['effect_json']) for row in db.query('SELECT id, effect_json FROM skills')}
+        skills: Dict[int, List[str]] = {}
+        for row in db.query('SELECT wrestler_id, skill_id FROM wrestler_skills'):
+            skills.setdefault(row['wrestler_id'], []).append(row['skill_id'])
+        styles = {row['id']: row['fighting_style']
+                  for row in db.query('SELECT id, fighting_style FROM wrestlers WHERE fighting_style IS NOT NULL')}
+        with self._lock:
+            self._effects, self._skills, self._styles = effects, skills, styles
+            self._bonuses = {w_id: self._compute(w_id) for w_id in set(skills) | set(styles)}
+
+    def _compute(self, w_id: int) -> Dict[str, float]:
+        bonuses = _zero()
+        for skill_id in self._skills.get(w_id, ()):
+            for stat, value in self._effects.get(skill_id, {}).items():
+                if stat in bonuses:
+                    bonuses[stat] += value
+
+        # Add Fighting Style Bonus
+        style_key = self._styles.get(w_id)
+        if style_key in C.FIGHTING_STYLES:
+            style_bonus = C.FIGHTING_STYLES[style_key]['bonus']
+            for stat, value in style_bonus.items():
+                if stat in bonuses:
+                    bonuses[stat] += value
+                elif stat == 'all': # Handle "Grand Champion" all stats
+                    bonuses['strength'] += value
+                    bonuses['technique'] += value
+                    bonuses['speed'] += value
+        return bonuses
+
+    def get(self, w_id: int) -> Dict[str, float]:
+        with self._lock:
+            bonuses = self._bonuses.get(int(w_id))
+        return dict(bonuses) if bonuses else _zero()
+
+    def skill_unlocked(self, w_id: int, skill_id: str) -> None:
+        """Record an unlock written in the current unit of work (applied on commit)."""
+        w_id = int(w_id)
+
+        def apply():
+            with self._lock:
+                self._skills.setdefault(w_id, []).append(skill_id)
+                self._bonuses[w_id] = self._compute(w_id)
+        self.db.after_commit(apply)
+
+    def style_changed(self, w_id: int, style: str) -> None:
+        """Record a fighting-style change written in the current unit of work (applied on commit)."""
+        w_id = int(w_id)
+
+        def apply():
+            with self._lock:
+                self._styles[w_id] = style
+                self._bonuses[w_id] = self._compute(w_id)
+        self.db.after_commit(apply)
@@ -1,15 +1,37 @@
 #!/usr/bin/env python3
 import time
+_BOOT_START = time.perf_counter()
 import random
 import math
 import sys
 import os
+import atexit
+import signal
 import threading
 import json
+import hashlib
 import logging
 import sqlite3
 from typing import Tuple, Dict, List, Optional, Any, Union
 
+# --- Boot Timing ---
+# (phase, seconds since process start), in order; see report_boot()
+BOOT_TIMINGS: List[Tuple[str, float]] = []
+
+def boot_mark(phase: str) -> None:
+    BOOT_TIMINGS.append((phase, time.perf_counter() - _BOOT_START))
+
+def report_boot() -> None:
+    """Print how long each startup phase took against C.BOOT_BUDGET_MS."""
+    print("Boot timings:")
+    previous = 0.0
+    for phase, at in BOOT_TIMINGS:
+        print(f"  {phase:<14}{(at - previous) * 1000:8.1f} ms")
+        previous = at
+    total_ms = previous * 1000
+    verdict = "OK" if total_ms <= C.BOOT_BUDGET_MS else "OVER BUDGET"
+    print(f"  {'total':<14}{total_ms:8.1f} ms (budget {C.BOOT_BUDGET_MS} ms) {verdict}")
+
 # Flask imports
 try:
     from flask import Flask, request, jsonify
@@ -17,31 +39,45 @@ try:
 except ImportError:
     print("Flask or Flask-CORS not found. Please install: pip install flask flask-cors")
     sys.exit(1)
+boot_mark("flask")
 
 # Hardware imports
-try:
-    from rgbmatrix import RGBMatrix, RGBMatrixOptions, graphics
-    print("Hardware library found: rpi-rgb-led-matrix")
-    IS_EMULATOR = False
-except ImportError:
-    print("Hardware library NOT found. Falling back to RGBMatrixEmulator...")
+IS_HEADLESS = os.environ.get('SUMO_HEADLESS', '') not in ('', '0')
+if IS_HEADLESS:
+    # In-memory NumPy panel for benchmarks and CI (see headless.py)
+    from headless import RGBMatrix, RGBMatrixOptions, graphics
+    print("Headless mode: rendering to an in-memory framebuffer")
+    IS_EMULATOR = True
+else:
     try:
-        from RGBMatrixEmulator import RGBMatrix, RGBMatrixOptions, graphics
-        IS_EMULATOR = True
+        from rgbmatrix import RGBMatrix, RGBMatrixOptions, graphics
+        print("Hardware library found: rpi-rgb-led-matrix")
+        IS_EMULATOR = False
     except ImportError:
-        print("Error: Neither rpi-rgb-led-matrix nor RGBMatrixEmulator is installed.")
-        print("Please install the emulator: pip install rgbmatrixemulator")
-        sys.exit(1)
+        print("Hardware library NOT found. Falling back to RGBMatrixEmulator...")
+        try:
+            from RGBMatrixEmulator import RGBMatrix, RGBMatrixOptions, graphics
+            IS_EMULATOR = True
+        except ImportError:
+            print("Error: Neither rpi-rgb-led-matrix nor RGBMatrixEmulator is installed.")
+            print("Please install the emulator: pip install rgbmatrixemulator")
+            print("(or set SUMO_HEADLESS=1 to run without a display)")
+            sys.exit(1)
+boot_mark("hardware")
 
 # Local imports
 import constants as C
-import fonts
+from db import BatchWriter, db
+from match_history import DEFAULT_HISTORY_LIMIT, HISTORY_INDEXES, query_history
+from perf import FrameClock, FrameStats
+from render import SHAKE_RANGE, Sprite, draw_sprite, static_background, text_sprite, text_width
+from skills_cache import SkillBonusCache
+boot_mark("local modules")
 
 # --- Database Setup ---
 
-def init_db() -> None:
-    conn = sqlite3.connect(C.DB_FILE)
-    c = conn.cursor()
+def _migration_baseline(c: sqlite3.Connection) -> None:
+    """v1: the schema as it stood before versioning (also upgrades older DBs in place)."""
     # Wrestlers
     c.execute('''CREATE TABLE IF NOT EXISTS wrestlers (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -62,24 +98,23 @@ def init_db() -> None:
         avatar_seed INTEGER DEFAULT 0
     )''')
     
-    # Migrations
-    def run_migration(column: str, definition: str) -> None:
-        try:
-            c.execute(f'SELECT {column} FROM wrestlers LIMIT 1')
-        except sqlite3.OperationalError:
+    # Columns added over time (pre-versioning DBs may lack any of them)
+    existing = {row['name'] for row in c.execute('PRAGMA table_info(wrestlers)')}
+    for column, definition in (
+        ('custom_name', 'TEXT'),
+        ('is_active', 'INTEGER DEFAULT 1'),
+        ('bio', 'TEXT'),
+        ('avatar_seed', 'INTEGER DEFAULT 0'),
+        ('skill_points', 'INTEGER DEFAULT 0'),
+        ('xp', 'INTEGER DEFAULT 0'),
+        ('rank_index', 'INTEGER DEFAULT 0'),
+        ('win_streak', 'INTEGER DEFAULT 0'),
+        ('fighting_style', 'TEXT'),
+    ):
+        if column not in existing:
             print(f"Migrating DB: Adding {column} column...")
             c.execute(f'ALTER TABLE wrestlers ADD COLUMN {column} {definition}')
 
-    run_migration('custom_name', 'TEXT')
-    run_migration('is_active', 'INTEGER DEFAULT 1')
-    run_migration('bio', 'TEXT')
-    run_migration('avatar_seed', 'INTEGER DEFAULT 0')
-    run_migration('skill_points', 'INTEGER DEFAULT 0')
-    run_migration('xp', 'INTEGER DEFAULT 0')
-    run_migration('rank_index', 'INTEGER DEFAULT 0')
-    run_migration('win_streak', 'INTEGER DEFAULT 0')
-    run_migration('fighting_style', 'TEXT')
-
     # Milestones (Achievements)
     c.execute('''CREATE TABLE IF NOT EXISTS wrestler_milestones (
         wrestler_id INTEGER,
@@ -119,36 +154,88 @@ def init_db() -> None:
         FOREIGN KEY (wrestler_id) REFERENCES wrestlers(id),
         FOREIGN KEY (skill_id) REFERENCES skills(id)
     )''')
-    
-    # Populate skills from constants (idempotent)
-    for branch_key, branch_data in C.SKILL_BRANCHES.items():
-        for skill in branch_data['skills']:
-            c.execute('''INSERT OR REPLACE INTO skills 
-                      (id, branch, name, jp_name, description, tier, cost, effect_json)
-                      VALUES (?, ?, ?, ?, ?, ?, ?, ?)''',
-                      (skill['id'], branch_key, skill['name'], skill['jp'], 
-                       skill['desc'], skill['tier'], skill['cost'], json.dumps(skill['effect'])))
-    
-    conn.commit()
-    conn.close()
+
+def _migration_meta(c: sqlite3.Connection) -> None:
+    """v2: key/value table for boot-time bookkeeping (e.g. the seeded skill catalog hash)."""
+    c.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+
+def _migration_history_indexes(c: sqlite3.Connection) -> None:
+    """v3: serve match history pages from index range scans (see match_history.py)."""
+    for statement in HISTORY_INDEXES:
+        c.execute(statement)
+
+def _migration_roster_index(c: sqlite3.Connection) -> None:
+    """v4: GET /api/wrestlers lists active wrestlers by wins; walk an index instead of sorting the table."""
+    c.execute('CREATE INDEX IF NOT EXISTS idx_wrestlers_active_wins ON wrestlers(is_active, wins DESC)')
+
+# Append-only: MIGRATIONS[i] upgrades user_version i -> i + 1
+MIGRATIONS = [
+    _migration_baseline,
+    _migration_meta,
+    _migration_history_indexes,
+    _migration_roster_index,
+]
+
+def skill_catalog_hash() -> str:
+    return hashlib.sha1(json.dumps(C.SKILL_BRANCHES, sort_keys=True).encode()).hexdigest()
+
+def seed_skills() -> bool:
+    """Copy constants.SKILL_BRANCHES into the skills table if it changed since the last seed."""
+    catalog_hash = skill_catalog_hash()
+    with db.unit_of_work() as c:
+        row = c.execute("SELECT value FROM meta WHERE key = 'skills_hash'").fetchone()
+        if row and row['value'] == catalog_hash:
+            return False
+        for branch_key, branch_data in C.SKILL_BRANCHES.items():
+            for skill in branch_data['skills']:
+                c.execute('''INSERT OR REPLACE INTO skills 
+                          (id, branch, name, jp_name, description, tier, cost, effect_json)
+                          VALUES (?, ?, ?, ?, ?, ?, ?, ?)''',
+                          (skill['id'], branch_key, skill['name'], skill['jp'], 
+                           skill['desc'], skill['tier'], skill['cost'], json.dumps(skill['effect'])))
+        c.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('skills_hash', ?)", (catalog_hash,))
+    print("Skill catalog changed: skills table reseeded.")
+    return True
+
+def init_db() -> None:
+    # A current DB costs two reads here: user_version and the catalog hash
+    applied = db.migrate(MIGRATIONS)
+    if applied:
+        print(f"DB schema migrated to v{len(MIGRATIONS)} ({applied} step(s)).")
+    seed_skills()
 
 # Initialize on start
 init_db()
+boot_mark("database")
+
+# Match results are written off the render thread (see SumoGame.logic).
+# Whatever is still queued is applied on any normal exit (see also SIGTERM below).
+result_writer = BatchWriter(db)
+atexit.register(result_writer.close)
+
+def log_after_commit(message: str) -> None:
+    """Print once the current write commits, so a rolled-back or retried job logs nothing extra."""
+    db.after_commit(lambda: print(message))
 
 # --- Flask Setup (API Server) ---
 log = logging.getLogger('werkzeug')
 log.setLevel(logging.ERROR)
 
 app = Flask(__name__)
-CORS(app)
+CORS(app, expose_headers=["X-Next-Cursor"])
 
 # Shared State (Game Loop <-> Web Server)
 GAME_STATE: Dict[str, Any] = {
     "p1_data": None,
     "p2_data": None,
-    "reset_requested": False
+    "reset_requested": False,
+    "frames_drawn": 0,
+    "frames_skipped": 0,  # Unchanged frames not redrawn (SumoGame.draw)
 }
 
+# Frame pacing (SumoGame.run -> /api/perf)
+FRAME_STATS = FrameStats()
+
 def generate_random_wrestler() -> Tuple[str, str, float, float, float, float, float, str]:
     name = random.choice(C.NAMES_FIRST) + random.choice(C.NAMES_LAST)
     stable = random.choice(C.STABLES)
@@ -182,12 +269,7 @@ def generate_madlib_bio(name: str, stable: str) -> str:
 
 @app.route('/api/wrestlers', methods=['GET'])
 def get_wrestlers():
-    conn = sqlite3.connect(C.DB_FILE)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
-    c.execute('SELECT * FROM wrestlers WHERE is_active = 1 ORDER BY wins DESC')
-    rows = c.fetchall()
-    conn.close()
+    rows = db.query('SELECT * FROM wrestlers WHERE is_active = 1 ORDER BY wins DESC')
     return jsonify([dict(row) for row in rows])
 
 @app.route('/api/wrestlers', methods=['POST'])
@@ -206,48 +288,33 @@ def create_wrestler():
     bio = generate_madlib_bio(display_name, data[1])
     avatar_seed = random.randint(0, 999999)
 
-    conn = sqlite3.connect(C.DB_FILE)
-    c = conn.cursor()
-    c.execute('''INSERT INTO wrestlers 
+    c = db.execute('''INSERT INTO wrestlers 
               (name, custom_name, stable, height, weight, strength, technique, speed, color, bio, avatar_seed)
               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''', 
               (data[0], custom_name, data[1], data[2], data[3], data[4], data[5], data[6], data[7], bio, avatar_seed))
     new_id = c.lastrowid
-    conn.commit()
-    conn.close()
     return jsonify({"id": new_id, "name": data[0], "custom_name": custom_name, "stable": data[1], "bio": bio})
 
 @app.route('/api/wrestlers/<int:w_id>', methods=['GET'])
 def get_wrestler_detail(w_id: int):
-    conn = sqlite3.connect(C.DB_FILE)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
-    c.execute('SELECT * FROM wrestlers WHERE id = ?', (w_id,))
-    row = c.fetchone()
+    row = db.query_one('SELECT * FROM wrestlers WHERE id = ?', (w_id,))
     if row:
         w_data = dict(row)
         
         # Fetch Milestones
-        c.execute('SELECT milestone_id FROM wrestler_milestones WHERE wrestler_id = ?', (w_id,))
-        ms_rows = c.fetchall()
+        ms_rows = db.query('SELECT milestone_id FROM wrestler_milestones WHERE wrestler_id = ?', (w_id,))
         w_data['milestones'] = [r['milestone_id'] for r in ms_rows]
         
         # Add Rank Data
         w_data['rank_name'] = C.WRESTLER_RANKS[w_data['rank_index']]['name']
         w_data['rank_jp'] = C.WRESTLER_RANKS[w_data['rank_index']]['jp']
         
-        conn.close()
         return jsonify(w_data)
-    conn.close()
     return jsonify({"error": "Not found"}), 404
 
 @app.route('/api/wrestlers/<int:w_id>', methods=['DELETE'])
 def delete_wrestler(w_id: int):
-    conn = sqlite3.connect(C.DB_FILE)
-    c = conn.cursor()
-    c.execute('UPDATE wrestlers SET is_active = 0 WHERE id = ?', (w_id,))
-    conn.commit()
-    conn.close()
+    db.execute('UPDATE wrestlers SET is_active = 0 WHERE id = ?', (w_id,))
     return jsonify({"success": True})
 
 @app.route('/api/fight', methods=['POST'])
@@ -259,12 +326,7 @@ def api_fight():
     if not p1_id or not p2_id:
         return jsonify({"error": "Missing wrestler IDs"}), 400
 
-    conn = sqlite3.connect(C.DB_FILE)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
-    c.execute('SELECT * FROM wrestlers WHERE id IN (?, ?)', (p1_id, p2_id))
-    rows = c.fetchall()
-    conn.close()
+    rows = db.query('SELECT * FROM wrestlers WHERE id IN (?, ?)', (p1_id, p2_id))
     
     if len(rows) != 2:
          return jsonify({"error": "Wrestlers not found"}), 404
@@ -305,76 +367,40 @@ def api_fight_action():
             
     return jsonify({"error": "Game not active or wrestler not found"}), 404
 
+def _int_arg(name: str, default: Optional[int] = None) -> Optional[int]:
+    """Integer query arg; raises ValueError (-> 400) rather than silently ignoring bad input."""
+    value = request.args.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer")
+
 @app.route('/api/history', methods=['GET'])
 def get_history():
-    wrestler_id = request.args.get('wrestler_id')
-    
-    conn = sqlite3.connect(C.DB_FILE)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
-    
-    query = '''
-        SELECT m.id, m.timestamp, 
-               w1.name as p1_name, w1.custom_name as p1_custom,
-               w2.name as p2_name, w2.custom_name as p2_custom,
-               wWin.name as winner_name, wWin.custom_name as winner_custom
-        FROM matches m
-        JOIN wrestlers w1 ON m.p1_id = w1.id
-        JOIN wrestlers w2 ON m.p2_id = w2.id
-        JOIN wrestlers wWin ON m.winner_id = wWin.id
-    '''
-    
-    params = []
-    if wrestler_id:
-        query += ' WHERE (m.p1_id = ? OR m.p2_id = ?)'
-        params = [wrestler_id, wrestler_id]
-        
-    query += ' ORDER BY m.timestamp DESC LIMIT 50'
-    
-    c.execute(query, params)
-    rows = c.fetchall()
-    conn.close()
-    return jsonify([dict(row) for row in rows])
+    """Newest first; pass the X-Next-Cursor response header back as ?after= for the next page."""
+    try:
+        wrestler_id = _int_arg('wrestler_id')
+        limit = _int_arg('limit', DEFAULT_HISTORY_LIMIT)
+        matches, next_cursor = query_history(db, wrestler_id=wrestler_id, limit=limit,
+                                             after=request.args.get('after'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    response = jsonify(matches)
+    if next_cursor:
+        response.headers['X-Next-Cursor'] = next_cursor
+    return response
 
 # --- Skill Tree API ---
 
+skill_bonuses = SkillBonusCache(db)
+skill_bonuses.load()
+boot_mark("skill cache")
+
 def get_skill_bonuses(wrestler_id: int) -> Dict[str, float]:
-    """Calculate total stat bonuses from unlocked skills for a wrestler."""
-    conn = sqlite3.connect(C.DB_FILE)
-    c = conn.cursor()
-    c.execute('''SELECT s.effect_json FROM wrestler_skills ws
-                 JOIN skills s ON ws.skill_id = s.id
-                 WHERE ws.wrestler_id = ?''', (wrestler_id,))
-    rows = c.fetchall()
-    
-    bonuses = {"strength": 0.0, "technique": 0.0, "speed": 0.0}
-    for row in rows:
-        effect = json.loads(row[0])
-        for stat, value in effect.items():
-            if stat in bonuses:
-                bonuses[stat] += value
-                
-    # Add Fighting Style Bonus
-    c.execute('SELECT fighting_style FROM wrestlers WHERE id = ?', (wrestler_id,))
-    row = c.fetchone()
-    conn.close()
-
-    if row and row[0]: # Use index 0 or row['fighting_style'] if row_factory set. Default cursor is tuple? 
-        # Wait, default cursor returns tuples unless row_factory set. 
-        # In this function I didn't set row_factory! 
-        # So row is tuple. row[0] is correct. 
-        style_key = row[0]
-        if style_key in C.FIGHTING_STYLES:
-            style_bonus = C.FIGHTING_STYLES[style_key]['bonus']
-            for stat, value in style_bonus.items():
-                if stat in bonuses:
-                    bonuses[stat] += value
-                elif stat == 'all': # Handle "Grand Champion" all stats
-                    bonuses['strength'] += value
-                    bonuses['technique'] += value
-                    bonuses['speed'] += value
-                    
-    return bonuses
+    """Total stat bonuses from unlocked skills and fighting style (cached, no I/O)."""
+    return skill_bonuses.get(wrestler_id)
 
 @app.route('/api/skills', methods=['GET'])
 def get_skills():
@@ -393,22 +419,14 @@ def get_skills():
 @app.route('/api/wrestlers/<int:w_id>/skills', methods=['GET'])
 def get_wrestler_skills(w_id: int):
     """Get a wrestler's unlocked skills and skill points."""
-    conn = sqlite3.connect(C.DB_FILE)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
-    
-    c.execute('SELECT skill_points FROM wrestlers WHERE id = ?', (w_id,))
-    wrestler = c.fetchone()
+    wrestler = db.query_one('SELECT skill_points FROM wrestlers WHERE id = ?', (w_id,))
     if not wrestler:
-        conn.close()
         return jsonify({"error": "Wrestler not found"}), 404
     
-    c.execute('''SELECT s.*, ws.unlocked_at 
+    skills = db.query('''SELECT s.*, ws.unlocked_at 
                  FROM wrestler_skills ws
                  JOIN skills s ON ws.skill_id = s.id
                  WHERE ws.wrestler_id = ?''', (w_id,))
-    skills = c.fetchall()
-    conn.close()
     
     bonuses = get_skill_bonuses(w_id)
     return jsonify({
@@ -420,130 +438,101 @@ def get_wrestler_skills(w_id: int):
 @app.route('/api/wrestlers/<int:w_id>/skills/<skill_id>', methods=['POST'])
 def unlock_skill(w_id: int, skill_id: str):
     """Unlock a skill for a wrestler (costs skill points)."""
-    conn = sqlite3.connect(C.DB_FILE)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
-    
-    c.execute('SELECT skill_points FROM wrestlers WHERE id = ?', (w_id,))
-    wrestler = c.fetchone()
-    if not wrestler:
-        conn.close()
-        return jsonify({"error": "Wrestler not found"}), 404
-    
-    c.execute('SELECT * FROM skills WHERE id = ?', (skill_id,))
-    skill = c.fetchone()
-    if not skill:
-        conn.close()
-        return jsonify({"error": "Skill not found"}), 404
-    
-    c.execute('SELECT 1 FROM wrestler_skills WHERE wrestler_id = ? AND skill_id = ?', (w_id, skill_id))
-    if c.fetchone():
-        conn.close()
-        return jsonify({"error": "Skill already unlocked"}), 400
-    
-    if skill['tier'] > 1:
-        c.execute('''SELECT 1 FROM wrestler_skills ws
-                     JOIN skills s ON ws.skill_id = s.id
-                     WHERE ws.wrestler_id = ? AND s.branch = ? AND s.tier = ?''',
-                  (w_id, skill['branch'], skill['tier'] - 1))
-        if not c.fetchone():
-            conn.close()
-            return jsonify({"error": f"Must unlock tier {skill['tier'] - 1} skill first"}), 400
-    
-    cost = skill['cost']
-    if wrestler['skill_points'] < cost:
-        conn.close()
-        return jsonify({"error": f"Need {cost} SP, have {wrestler['skill_points']}"}), 400
-    
-    c.execute('UPDATE wrestlers SET skill_points = skill_points - ? WHERE id = ?', (cost, w_id))
-    c.execute('INSERT INTO wrestler_skills (wrestler_id, skill_id) VALUES (?, ?)', (w_id, skill_id))
-    conn.commit()
-    conn.close()
-    
-    print(f"Skill unlocked: {skill['name']} for wrestler {w_id} (-{cost}SP)")
-    
-    # Update Fighting Style
-    update_fighting_style(w_id)
-    
-    # Check Skill Milestones
-    check_milestones(w_id)
+    # Unlock, style change and skill milestones commit together
+    with db.unit_of_work() as c:
+        wrestler = c.execute('SELECT skill_points FROM wrestlers WHERE id = ?', (w_id,)).fetchone()
+        if not wrestler:
+            return jsonify({"error": "Wrestler not found"}), 404
+        
+        skill = c.execute('SELECT * FROM skills WHERE id = ?', (skill_id,)).fetchone()
+        if not skill:
+            return jsonify({"error": "Skill not found"}), 404
+        
+        if c.execute('SELECT 1 FROM wrestler_skills WHERE wrestler_id = ? AND skill_id = ?', (w_id, skill_id)).fetchone():
+            return jsonify({"error": "Skill already unlocked"}), 400
+        
+        if skill['tier'] > 1:
+            prereq = c.execute('''SELECT 1 FROM wrestler_skills ws
+                         JOIN skills s ON ws.skill_id = s.id
+                         WHERE ws.wrestler_id = ? AND s.branch = ? AND s.tier = ?''',
+                      (w_id, skill['branch'], skill['tier'] - 1)).fetchone()
+            if not prereq:
+                return jsonify({"error": f"Must unlock tier {skill['tier'] - 1} skill first"}), 400
+        
+        cost = skill['cost']
+        if wrestler['skill_points'] < cost:
+            return jsonify({"error": f"Need {cost} SP, have {wrestler['skill_points']}"}), 400
+        
+        c.execute('UPDATE wrestlers SET skill_points = skill_points - ? WHERE id = ?', (cost, w_id))
+        c.execute('INSERT INTO wrestler_skills (wrestler_id, skill_id) VALUES (?, ?)', (w_id, skill_id))
+        skill_bonuses.skill_unlocked(w_id, skill_id)
+        
+        log_after_commit(f"Skill unlocked: {skill['name']} for wrestler {w_id} (-{cost}SP)")
+        
+        # Update Fighting Style
+        update_fighting_style(w_id)
+        
+        # Check Skill Milestones
+        check_milestones(w_id)
     
     return jsonify({"success": True, "skill_id": skill_id, "cost": cost})
 
 def update_fighting_style(w_id: int) -> None:
-    conn = sqlite3.connect(C.DB_FILE)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
-    
-    # Get skill counts
-    c.execute('''SELECT s.branch, COUNT(*) as count 
-                 FROM wrestler_skills ws 
-                 JOIN skills s ON ws.skill_id = s.id 
-                 WHERE ws.wrestler_id = ? 
-                 GROUP BY s.branch''', (w_id,))
-    counts = {row['branch']: row['count'] for row in c.fetchall()}
-    
-    # Check Styles
-    new_style = None
-    # Check generic specific styles first using lambda condition
-    for key, data in C.FIGHTING_STYLES.items():
-        if data.get('condition') and data['condition'](counts):
-             new_style = key
-             # Keep checking to find best fit? For now last match wins or prioritize?
-             # Let's prioritize Grand Champion if met
-             if key == 'grand_champion': break
-             
-    if new_style:
-        c.execute('UPDATE wrestlers SET fighting_style = ? WHERE id = ?', (new_style, w_id))
-        conn.commit()
-        print(f"  Fighting Style Updated: {C.FIGHTING_STYLES[new_style]['name']}")
+    with db.unit_of_work() as c:
+        # Get skill counts
+        rows = c.execute('''SELECT s.branch, COUNT(*) as count 
+                     FROM wrestler_skills ws 
+                     JOIN skills s ON ws.skill_id = s.id 
+                     WHERE ws.wrestler_id = ? 
+                     GROUP BY s.branch''', (w_id,)).fetchall()
+        counts = {row['branch']: row['count'] for row in rows}
         
-    conn.close()
+        # Check Styles
+        new_style = None
+        # Check generic specific styles first using lambda condition
+        for key, data in C.FIGHTING_STYLES.items():
+            if data.get('condition') and data['condition'](counts):
+                 new_style = key
+                 # Keep checking to find best fit? For now last match wins or prioritize?
+                 # Let's prioritize Grand Champion if met
+                 if key == 'grand_champion': break
+                 
+        if new_style:
+            current = c.execute('SELECT fighting_style FROM wrestlers WHERE id = ?', (w_id,)).fetchone()
+            if current and current['fighting_style'] != new_style:
+                c.execute('UPDATE wrestlers SET fighting_style = ? WHERE id = ?', (new_style, w_id))
+                skill_bonuses.style_changed(w_id, new_style)
+                log_after_commit(f"  Fighting Style Updated: {C.FIGHTING_STYLES[new_style]['name']}")
 
 def check_milestones(w_id: int) -> None:
-    conn = sqlite3.connect(C.DB_FILE)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
-    
-    # Get Wrestler State
-    c.execute('SELECT * FROM wrestlers WHERE id = ?', (w_id,))
-    w = c.fetchone()
-    if not w: 
-        conn.close()
-        return
-        
-    # Get Unlocked Skills Count
-    c.execute('SELECT COUNT(*) as count FROM wrestler_skills WHERE wrestler_id = ?', (w_id,))
-    skill_count = c.fetchone()['count']
-    
-    rank_name = C.WRESTLER_RANKS[w['rank_index']]['name']
-    
-    # Check each milestone
-    unlocked_any = False
-    for m in C.MILESTONES:
-        condition_met = False
-        
-        # Hardcoded checks based on ID for safety/simplicity
-        if m['id'] == 'first_blood' and w['wins'] >= 1: condition_met = True
-        elif m['id'] == 'win_streak_3' and w['win_streak'] >= 3: condition_met = True
-        elif m['id'] == 'win_streak_10' and w['win_streak'] >= 10: condition_met = True
-        elif m['id'] == 'rank_juryo' and w['rank_index'] >= 4: condition_met = True # Juryo index
-        elif m['id'] == 'rank_yokozuna' and w['rank_index'] >= 9: condition_met = True # Yokozuna index
-        elif m['id'] == 'skill_master' and skill_count >= 10: condition_met = True
+    with db.unit_of_work() as c:
+        # Get Wrestler State
+        w = c.execute('SELECT * FROM wrestlers WHERE id = ?', (w_id,)).fetchone()
+        if not w: 
+            return
+            
+        # Get Unlocked Skills Count
+        skill_count = c.execute('SELECT COUNT(*) as count FROM wrestler_skills WHERE wrestler_id = ?', (w_id,)).fetchone()['count']
+        unlocked = {row['milestone_id'] for row in c.execute(
+            'SELECT milestone_id FROM wrestler_milestones WHERE wrestler_id = ?', (w_id,))}
         
-        if condition_met:
-            # Check if already unlocked
-            c.execute('SELECT 1 FROM wrestler_milestones WHERE wrestler_id = ? AND milestone_id = ?', (w_id, m['id']))
-            if not c.fetchone():
+        # Check each milestone
+        for m in C.MILESTONES:
+            condition_met = False
+            
+            # Hardcoded checks based on ID for safety/simplicity
+            if m['id'] == 'first_blood' and w['wins'] >= 1: condition_met = True
+            elif m['id'] == 'win_streak_3' and w['win_streak'] >= 3: condition_met = True
+            elif m['id'] == 'win_streak_10' and w['win_streak'] >= 10: condition_met = True
+            elif m['id'] == 'rank_juryo' and w['rank_index'] >= 4: condition_met = True # Juryo index
+            elif m['id'] == 'rank_yokozuna' and w['rank_index'] >= 9: condition_met = True # Yokozuna index
+            elif m['id'] == 'skill_master' and skill_count >= 10: condition_met = True
+            
+            if condition_met and m['id'] not in unlocked:
                 # Unlock!
                 c.execute('INSERT INTO wrestler_milestones (wrestler_id, milestone_id) VALUES (?, ?)', (w_id, m['id']))
                 c.execute('UPDATE wrestlers SET skill_points = skill_points + ? WHERE id = ?', (m['reward_sp'], w_id))
-                print(f"  MILESTONE UNLOCKED: {m['name']} (+{m['reward_sp']} SP)")
-                unlocked_any = True
-                
-    if unlocked_any:
-        conn.commit()
-    conn.close()
+                log_after_commit(f"  MILESTONE UNLOCKED: {m['name']} (+{m['reward_sp']} SP)")
 
 def get_rank_info(xp: int) -> Tuple[int, Dict[str, Any]]:
     """Returns (rank_index, rank_data) based on XP."""
@@ -554,98 +543,93 @@ def get_rank_info(xp: int) -> Tuple[int, Dict[str, Any]]:
     return (0, C.WRESTLER_RANKS[0])
 
 def record_win(winner_data: Dict[str, Any], loser_data: Dict[str, Any]) -> None:
-    conn = sqlite3.connect(C.DB_FILE)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
+    # Result and milestones commit in one transaction
+    with db.unit_of_work() as c:
+        # 1. Fetch fresh data for calculations
+        rows = c.execute('SELECT id, xp, rank_index, win_streak FROM wrestlers WHERE id IN (?, ?)', 
+                         (winner_data['id'], loser_data['id'])).fetchall()
+        stats = {row['id']: dict(row) for row in rows}
     
-    # 1. Fetch fresh data for calculations
-    c.execute('SELECT id, xp, rank_index, win_streak FROM wrestlers WHERE id IN (?, ?)', 
-              (winner_data['id'], loser_data['id']))
-    stats = {row['id']: dict(row) for row in c.fetchall()}
+        w_stats = stats[winner_data['id']]
+        l_stats = stats[loser_data['id']]
     
-    w_stats = stats[winner_data['id']]
-    l_stats = stats[loser_data['id']]
+        # 2. Calculate Rewards (XP)
+        # Base XP
+        w_xp_gain = C.XP_BASE_WIN
+        l_xp_gain = C.XP_BASE_LOSS
     
-    # 2. Calculate Rewards (XP)
-    # Base XP
-    w_xp_gain = C.XP_BASE_WIN
-    l_xp_gain = C.XP_BASE_LOSS
+        # Rank Difference Bonus (Underdog XP)
+        rank_diff = l_stats['rank_index'] - w_stats['rank_index']
+        if rank_diff > 0:
+            w_xp_gain += rank_diff * C.XP_RANK_DIFF_BONUS
+            log_after_commit(f"  Underdog Bonus! +{rank_diff * C.XP_RANK_DIFF_BONUS} XP")
+
+        # 3. Calculate Rewards (SP)
+        # Get Rank Multipliers
+        w_rank_data = C.WRESTLER_RANKS[w_stats['rank_index']]
+        l_rank_data = C.WRESTLER_RANKS[l_stats['rank_index']]
     
-    # Rank Difference Bonus (Underdog XP)
-    rank_diff = l_stats['rank_index'] - w_stats['rank_index']
-    if rank_diff > 0:
-        w_xp_gain += rank_diff * C.XP_RANK_DIFF_BONUS
-        print(f"  Underdog Bonus! +{rank_diff * C.XP_RANK_DIFF_BONUS} XP")
-
-    # 3. Calculate Rewards (SP)
-    # Get Rank Multipliers
-    w_rank_data = C.WRESTLER_RANKS[w_stats['rank_index']]
-    l_rank_data = C.WRESTLER_RANKS[l_stats['rank_index']]
+        # Streak Bonus (Every 3 wins)
+        streak_bonus = 0
+        new_streak = w_stats['win_streak'] + 1
+        if new_streak % 3 == 0:
+            streak_bonus = C.SP_STREAK_BONUS
     
-    # Streak Bonus (Every 3 wins)
-    streak_bonus = 0
-    new_streak = w_stats['win_streak'] + 1
-    if new_streak % 3 == 0:
-        streak_bonus = C.SP_STREAK_BONUS
+        # Underdog SP Bonus
+        underdog_sp = C.SP_UNDERDOG_BONUS if rank_diff > 0 else 0
     
-    # Underdog SP Bonus
-    underdog_sp = C.SP_UNDERDOG_BONUS if rank_diff > 0 else 0
+        # Final Calculation with Diminishing Returns
+        w_sp_raw = C.SP_BASE_WIN + streak_bonus + underdog_sp
+        w_sp_gain = math.floor(w_sp_raw * w_rank_data['sp_multiplier'])
     
-    # Final Calculation with Diminishing Returns
-    w_sp_raw = C.SP_BASE_WIN + streak_bonus + underdog_sp
-    w_sp_gain = math.floor(w_sp_raw * w_rank_data['sp_multiplier'])
+        l_sp_gain = math.floor(C.SP_BASE_LOSS * l_rank_data['sp_multiplier'])
+        # Minimum 1 SP if base was > 0
+        if w_sp_gain < 1 and w_sp_raw > 0: w_sp_gain = 1
+        if l_sp_gain < 1: l_sp_gain = 1
     
-    l_sp_gain = math.floor(C.SP_BASE_LOSS * l_rank_data['sp_multiplier'])
-    # Minimum 1 SP if base was > 0
-    if w_sp_gain < 1 and w_sp_raw > 0: w_sp_gain = 1
-    if l_sp_gain < 1: l_sp_gain = 1
+        # 4. Check Rank Ups
+        w_new_xp = w_stats['xp'] + w_xp_gain
+        l_new_xp = l_stats['xp'] + l_xp_gain
     
-    # 4. Check Rank Ups
-    w_new_xp = w_stats['xp'] + w_xp_gain
-    l_new_xp = l_stats['xp'] + l_xp_gain
+        w_new_rank_idx, _ = get_rank_info(w_new_xp)
+        l_new_rank_idx, _ = get_rank_info(l_new_xp)
     
-    w_new_rank_idx, _ = get_rank_info(w_new_xp)
-    l_new_rank_idx, _ = get_rank_info(l_new_xp)
-    
-    if w_new_rank_idx > w_stats['rank_index']:
-        print(f"  RANK UP! {winner_data['name']} is now {C.WRESTLER_RANKS[w_new_rank_idx]['name']}!")
+        if w_new_rank_idx > w_stats['rank_index']:
+            log_after_commit(f"  RANK UP! {winner_data['name']} is now {C.WRESTLER_RANKS[w_new_rank_idx]['name']}!")
         
-    # 5. Update Database
-    # Winner
-    c.execute('''UPDATE wrestlers SET 
-              matches = matches + 1, 
-              wins = wins + 1, 
-              win_streak = ?, 
-              xp = ?, 
-              rank_index = ?, 
-              skill_points = skill_points + ? 
-              WHERE id = ?''', 
-              (new_streak, w_new_xp, w_new_rank_idx, w_sp_gain, winner_data['id']))
-              
-    # Loser
-    c.execute('''UPDATE wrestlers SET 
-              matches = matches + 1, 
-              losses = losses + 1, 
-              win_streak = 0, 
-              xp = ?, 
-              rank_index = ?, 
-              skill_points = skill_points + ? 
-              WHERE id = ?''', 
-              (l_new_xp, l_new_rank_idx, l_sp_gain, loser_data['id']))
+        # 5. Update Database
+        # Winner
+        c.execute('''UPDATE wrestlers SET 
+                  matches = matches + 1, 
+                  wins = wins + 1, 
+                  win_streak = ?, 
+                  xp = ?, 
+                  rank_index = ?, 
+                  skill_points = skill_points + ? 
+                  WHERE id = ?''', 
+                  (new_streak, w_new_xp, w_new_rank_idx, w_sp_gain, winner_data['id']))
               
-    # Record Match
-    c.execute('INSERT INTO matches (p1_id, p2_id, winner_id) VALUES (?, ?, ?)', 
-              (winner_data['id'], loser_data['id'], winner_data['id']))
+        # Loser
+        c.execute('''UPDATE wrestlers SET 
+                  matches = matches + 1, 
+                  losses = losses + 1, 
+                  win_streak = 0, 
+                  xp = ?, 
+                  rank_index = ?, 
+                  skill_points = skill_points + ? 
+                  WHERE id = ?''', 
+                  (l_new_xp, l_new_rank_idx, l_sp_gain, loser_data['id']))
               
-    conn.commit()
-    conn.close()
-    
-    # Check Milestones AFTER update/commit so stats are fresh
-    check_milestones(winner_data['id'])
-    
-    print(f"Match recorded: {winner_data['name']} def. {loser_data['name']}")
-    print(f"  Winner: +{w_xp_gain} XP, +{w_sp_gain} SP (Streak: {new_streak})")
-    print(f"  Loser: +{l_xp_gain} XP, +{l_sp_gain} SP")
+        # Record Match
+        c.execute('INSERT INTO matches (p1_id, p2_id, winner_id) VALUES (?, ?, ?)', 
+                  (winner_data['id'], loser_data['id'], winner_data['id']))
+
+        # Milestones see the updated stats (same transaction)
+        check_milestones(winner_data['id'])
+
+        log_after_commit(f"Match recorded: {winner_data['name']} def. {loser_data['name']}\n"
+                         f"  Winner: +{w_xp_gain} XP, +{w_sp_gain} SP (Streak: {new_streak})\n"
+                         f"  Loser: +{l_xp_gain} XP, +{l_sp_gain} SP")
 
 @app.route('/api/status', methods=['GET'])
 def get_status():
@@ -653,7 +637,16 @@ def get_status():
     state = GAME_STATE.get('current_state', C.STATE_WAITING)
     if state != C.STATE_WAITING:
         status = "FIGHTING"
-    return jsonify({"status": status, "state_id": state})
+    return jsonify({"status": status, "state_id": state,
+                    "frames_drawn": GAME_STATE['frames_drawn'], "frames_skipped": GAME_STATE['frames_skipped']})
+
+@app.route('/api/perf', methods=['GET'])
+def get_perf():
+    """Rolling frame pacing stats from the game loop."""
+    stats = FRAME_STATS.snapshot()
+    stats["frames_drawn"] = GAME_STATE['frames_drawn']
+    stats["frames_skipped"] = GAME_STATE['frames_skipped']
+    return jsonify(stats)
 
 def run_flask():
     app.run(host=C.FLASK_HOST, port=C.FLASK_PORT)
@@ -661,20 +654,8 @@ def run_flask():
 # --- Game Classes ---
 
 def draw_text_small(canvas: Any, x: float, y: float, text: str, color: Tuple[int, int, int]) -> None:
-    """Draws text using the internal 3x5 font map from fonts.py."""
-    cursor_x = int(x)
-    cursor_y = int(y)
-    
-    for char in text.upper():
-        if char in fonts.FONT_3x5:
-            rows = fonts.FONT_3x5[char]
-            for r, row_bits in enumerate(rows):
-                # 3 bits wide
-                for bit in range(3):
-                    if (row_bits >> (2 - bit)) & 1:
-                        canvas.SetPixel(cursor_x + bit, cursor_y + r, *color)
-        
-        cursor_x += 4 # 3px char + 1px gap
+    """Draws text using the internal 3x5 font map from fonts.py (sprites cached in render.py)."""
+    draw_sprite(canvas, int(x), int(y), text_sprite(text, tuple(color)))
 
 class Wrestler:
     def __init__(self, x: float, y: float, color: Tuple[int, int, int], name_or_data: Union[str, Dict[str, Any]]):
@@ -682,6 +663,8 @@ class Wrestler:
         self.start_y = y
         self.x = float(x)
         self.y = float(y)
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.vx = 0.0
         self.vy = 0.0
         self.is_out = False
@@ -740,6 +723,9 @@ class Wrestler:
         self.speed = self.base_speed * 1.2
 
     def update(self) -> None:
+        # Position at the start of this logic step, for render interpolation
+        self.prev_x = self.x
+        self.prev_y = self.y
         if self.boost_timer > 0:
             self.boost_timer -= 1
             if self.boost_timer == 0:
@@ -751,6 +737,8 @@ class Wrestler:
     def reset(self) -> None:
         self.x = float(self.start_x)
         self.y = float(self.start_y)
+        self.prev_x = self.x  # Teleport, don't slide
+        self.prev_y = self.y
         self.vx = 0.0
         self.vy = 0.0
         self.is_out = False
@@ -761,16 +749,21 @@ class Wrestler:
         if not self.data:
             self.mass = random.uniform(0.8, 1.2)
 
-    def draw(self, canvas: Any, shake_x: int = 0, shake_y: int = 0) -> None:
-        draw_x = int(self.x + shake_x)
-        draw_y = int(self.y + shake_y)
+    def draw_params(self, shake_x: int = 0, shake_y: int = 0,
+                    alpha: float = 1.0) -> Tuple[int, int, Tuple[int, int, int]]:
+        """Where and in what color draw() will put this wrestler, alpha of the way through the last step."""
+        draw_x = int(self.prev_x + (self.x - self.prev_x) * alpha + shake_x)
+        draw_y = int(self.prev_y + (self.y - self.prev_y) * alpha + shake_y)
         
         draw_color = self.color
         # Flash if boosted
         if self.boost_timer > 0:
             if (self.boost_timer // 2) % 2 == 0:
                 draw_color = C.COLOR_WHITE
-                
+        return draw_x, draw_y, draw_color
+
+    def draw(self, canvas: Any, shake_x: int = 0, shake_y: int = 0, alpha: float = 1.0) -> None:
+        draw_x, draw_y, draw_color = self.draw_params(shake_x, shake_y, alpha)
         for i in range(C.WRESTLER_SIZE):
             for j in range(C.WRESTLER_SIZE):
                 canvas.SetPixel(draw_x + i, draw_y + j, *draw_color)
@@ -786,6 +779,12 @@ class SumoGame:
         
         self.matrix = RGBMatrix(options=self.options)
         self.canvas = self.matrix.CreateFrameCanvas()
+        self.background = static_background(C.WIDTH, C.HEIGHT)
+        self._sidebar_key: Optional[Tuple[Any, ...]] = None
+        self._sidebar: List[Tuple[int, int, Sprite, bool]] = []
+        self._last_frame: Optional[Tuple[Any, ...]] = None  # Signature of what the panel shows
+        self.frames_drawn = 0
+        self.frames_skipped = 0
         
         self.state = C.STATE_WAITING
         self.timer = 0
@@ -905,12 +904,12 @@ class SumoGame:
             if self.check_ring_out(self.p1):
                 self.winner = self.p2
                 self.state = C.STATE_WINNER
-                if self.p1.data and self.p2.data: record_win(self.p2.data, self.p1.data)
+                if self.p1.data and self.p2.data: result_writer.submit(record_win, self.p2.data, self.p1.data)
                 self.apply_screen_shake(10)
             elif self.check_ring_out(self.p2):
                 self.winner = self.p1
                 self.state = C.STATE_WINNER
-                if self.p1.data and self.p2.data: record_win(self.p1.data, self.p2.data)
+                if self.p1.data and self.p2.data: result_writer.submit(record_win, self.p1.data, self.p2.data)
                 self.apply_screen_shake(10)
             
             dist_from_center = abs((self.p1.x + C.WRESTLER_SIZE/2) - C.CENTER_X)
@@ -930,7 +929,7 @@ class SumoGame:
                     loser = self.p1
                     dir = -1
                 
-                if self.p1.data and self.p2.data: record_win(self.winner.data, loser.data)
+                if self.p1.data and self.p2.data: result_writer.submit(record_win, self.winner.data, loser.data)
 
                 loser.vx = dir * C.THROW_IMPULSE
                 loser.vy = random.uniform(-2, 2)
@@ -954,9 +953,14 @@ class SumoGame:
                 self.state = C.STATE_WAITING
                 self.timer = 0
 
-    def draw_sidebar_text(self) -> None:
+    def sidebar_layout(self) -> List[Tuple[int, int, Sprite, bool]]:
+        """(x, y, sprite, blinks) for each sidebar line in the current state."""
         col_center = 16
-        
+        layout = []
+
+        def add(text: str, y: int, color: Tuple[int, int, int], blinks: bool = False) -> None:
+            layout.append((int(col_center - text_width(text) / 2), y, text_sprite(text, tuple(color)), blinks))
+
         if self.state == C.STATE_INTRO:
              lines = []
              # 1. P1 Name
@@ -978,108 +982,94 @@ class SumoGame:
                  rec2 = f"{self.p2.data.get('wins',0)}-{self.p2.data.get('losses',0)}"
                  lines.append((rec2, C.COLOR_GREY))
                  
-             # Calculate Layout
-             print(f"DEBUG Layout: {lines}")
-                 
              # Calculate Layout
              num_lines = len(lines)
              line_height = 5
              spacing = 1
              total_h = (num_lines * line_height) + ((num_lines - 1) * spacing)
-             start_y = int((C.HEIGHT - total_h) / 2)
-             
-             # Draw
-             curr_y = start_y
+             curr_y = int((C.HEIGHT - total_h) / 2)
              for text, color in lines:
-                 w = len(text) * 4 - 1
-                 draw_text_small(self.canvas, col_center - w/2, curr_y, text, color)
+                 add(text, curr_y, color)
                  curr_y += line_height + spacing
 
         elif self.state == C.STATE_READY:
-             txt1 = "HAKKEYOI"
-             w1 = len(txt1) * 4 - 1
-             draw_text_small(self.canvas, col_center - w1/2, 8, txt1, C.COLOR_WHITE)
-             
-             txt2 = "READY"
-             w2 = len(txt2) * 4 - 1
-             draw_text_small(self.canvas, col_center - w2/2, 16, txt2, C.COLOR_GREY)
+             add("HAKKEYOI", 8, C.COLOR_WHITE)
+             add("READY", 16, C.COLOR_GREY)
 
         elif self.state == C.STATE_TACHIAI:
-             if (time.time() * 10) % 2 > 1: pass
-             else:
-                txt1 = "HAKKEYOI"
-                w1 = len(txt1) * 4 - 1
-                draw_text_small(self.canvas, col_center - w1/2, 8, txt1, C.COLOR_WHITE)
-             
-             txt2 = "READY"
-             w2 = len(txt2) * 4 - 1
-             draw_text_small(self.canvas, col_center - w2/2, 16, txt2, C.COLOR_GREY)
+             add("HAKKEYOI", 8, C.COLOR_WHITE, blinks=True)
+             add("READY", 16, C.COLOR_GREY)
 
         elif self.state == C.STATE_STRUGGLE:
-             if (self.timer // 10) % 2 == 0:
-                txt1 = "NOKOTTA"
-                w1 = len(txt1) * 4 - 1
-                draw_text_small(self.canvas, col_center - w1/2, 8, txt1, C.COLOR_WHITE)
-             
-             txt2 = "FIGHT!"
-             w2 = len(txt2) * 4 - 1
-             draw_text_small(self.canvas, col_center - w2/2, 16, txt2, C.COLOR_GREY)
+             add("NOKOTTA", 8, C.COLOR_WHITE, blinks=True)
+             add("FIGHT!", 16, C.COLOR_GREY)
 
         elif self.state == C.STATE_WINNER:
-             txt1 = "WINNER"
-             w1 = len(txt1) * 4 - 1
-             draw_text_small(self.canvas, col_center - w1/2, 8, txt1, C.COLOR_WHITE)
-             
+             add("WINNER", 8, C.COLOR_WHITE)
              if self.winner:
-                 txt2 = self.winner.name.upper()
-                 w2 = len(txt2) * 4 - 1
-                 draw_text_small(self.canvas, col_center - w2/2, 16, txt2, self.winner.color)
+                 add(self.winner.name.upper(), 16, self.winner.color)
 
         elif self.state == C.STATE_WAITING:
-             col_center = 16
-             txt = "WAITING"
-             w = len(txt) * 4 - 1
-             draw_text_small(self.canvas, col_center - w/2, 12, txt, C.COLOR_GREY)
-
-    def draw(self) -> None:
-        self.canvas.Clear()
-        
+             add("WAITING", 12, C.COLOR_GREY)
+
+        return layout
+
+    def sidebar_blink_off(self) -> bool:
+        """Whether this frame hides the sidebar's blinking line."""
+        if self.state == C.STATE_TACHIAI:
+            return (time.time() * 10) % 2 > 1
+        if self.state == C.STATE_STRUGGLE:
+            return (self.timer // 10) % 2 != 0
+        return False
+
+    def draw_sidebar_text(self, blink_off: bool = False) -> None:
+        # Layout only depends on the state and who is on the dohyo; rebuild it when those change
+        key = (self.state, self.p1, self.p2, self.winner)
+        if key != self._sidebar_key:
+            self._sidebar_key = key
+            self._sidebar = self.sidebar_layout()
+
+        for x, y, sprite, blinks in self._sidebar:
+            if not (blinks and blink_off):
+                draw_sprite(self.canvas, x, y, sprite)
+
+    def draw(self, alpha: float = 1.0) -> None:
+        """Render the current state; alpha (0..1) interpolates wrestlers from the previous logic step."""
         sx = 0
         sy = 0
         if self.shake_time > 0:
-            sx = random.randint(-1, 1)
-            sy = random.randint(-1, 1)
+            sx = random.randint(-SHAKE_RANGE, SHAKE_RANGE)
+            sy = random.randint(-SHAKE_RANGE, SHAKE_RANGE)
             self.shake_time -= 1
 
-        # Sidebar Separator Line
-        for y in range(C.HEIGHT):
-            self.canvas.SetPixel(32, y, 20, 20, 20) 
-
-        # Draw Ring (Dohyo) - Right Side
-        for angle in range(0, 360, 5):
-            rad = math.radians(angle)
-            x = int(C.CENTER_X + sx + math.cos(rad) * C.RING_RADIUS)
-            y = int(C.CENTER_Y + sy + math.sin(rad) * C.RING_RADIUS)
-            if 0 <= x < C.WIDTH and 0 <= y < C.HEIGHT:
-                self.canvas.SetPixel(x, y, *C.COLOR_RING)
+        blink_off = self.sidebar_blink_off()
+        winner_blink = self.state == C.STATE_WINNER and self.winner is not None and (self.timer // 5) % 2 == 0
+
+        # Everything the frame is drawn from; if none of it changed, the panel already shows it
+        p1_params = self.p1.draw_params(sx, sy, alpha)
+        p2_params = self.p2.draw_params(sx, sy, alpha)
+        signature = (sx, sy, p1_params, p2_params,
+                     self.state, self.p1, self.p2, self.winner, blink_off, winner_blink)
+        if signature == self._last_frame:
+            self.frames_skipped += 1
+            GAME_STATE['frames_skipped'] = self.frames_skipped
+            return
+        self._last_frame = signature
+        self.frames_drawn += 1
+        GAME_STATE['frames_drawn'] = self.frames_drawn
+
+        # Separator, ring and salt piles come pre-rasterized (render.py)
+        self.background.blit(self.canvas, sx, sy)
+
+        self.p1.draw(self.canvas, sx, sy, alpha)
+        self.p2.draw(self.canvas, sx, sy, alpha)
         
-        # Balance Elements: Salt Piles
-        self.canvas.SetPixel(35, 2, 80, 80, 80)
-        self.canvas.SetPixel(35, 29, 80, 80, 80)
-        self.canvas.SetPixel(61, 2, 80, 80, 80)
-        self.canvas.SetPixel(61, 29, 80, 80, 80)
-
-        self.p1.draw(self.canvas, sx, sy)
-        self.p2.draw(self.canvas, sx, sy)
-        
-        self.draw_sidebar_text()
+        self.draw_sidebar_text(blink_off)
         
         # Winner Blink
-        if self.state == C.STATE_WINNER and self.winner:
-            if (self.timer // 5) % 2 == 0:
-                 wx = int(self.winner.x + sx)
-                 wy = int(self.winner.y + sy)
-                 self.canvas.SetPixel(wx, wy-2, *self.winner.color)
+        if winner_blink:
+             wx, wy, _ = p1_params if self.winner is self.p1 else p2_params
+             self.canvas.SetPixel(wx, wy-2, *self.winner.color)
 
         self.canvas = self.matrix.SwapOnVSync(self.canvas)
 
@@ -1091,21 +1081,32 @@ class SumoGame:
         flask_thread.start()
         
         try:
+            self.logic()
+            self.draw()
+            boot_mark("first frame")
+            report_boot()
+
+            # Fixed-rate logic; every wake-up draws, interpolated between steps (see perf.py)
+            clock = FrameClock()
             while True:
-                start_time = time.time()
-                
-                self.logic()
-                self.draw()
-                
-                elapsed = time.time() - start_time
-                delay = (1.0 / C.FPS) - elapsed
-                if delay > 0:
-                    time.sleep(delay)
-                    
+                steps, period = clock.advance()
+                start = time.perf_counter()
+                for _ in range(steps):
+                    self.logic()
+                self.draw(clock.alpha())
+                FRAME_STATS.record(period, time.perf_counter() - start)
+                FRAME_STATS.dropped_steps = clock.dropped_steps
+                time.sleep(clock.sleep_time())
+
         except KeyboardInterrupt:
             print("\nExiting...")
+            print(f"Frames drawn: {self.frames_drawn}, skipped unchanged: {self.frames_skipped}")
+            result_writer.close()
             sys.exit(0)
 
 if __name__ == "__main__":
+    # systemd/docker stop with SIGTERM: exit normally so atexit flushes result_writer
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
     game = SumoGame()
+    boot_mark("game init")
     game.run()
@@ -0,0 +1,198 @@
+"""
+Unit tests for the pooled SQLite access layer (db.py).
+"""
+import sqlite3
+import threading
+
+from db import BatchWriter, Database
+
+
+def _make(tmp_path):
+    db = Database(str(tmp_path / "test.db"))
+    db.execute('CREATE TABLE t (id INTEGER PRIMARY KEY, v INTEGER)')
+    return db
+
+
+def test_connections_are_reused_and_wal(tmp_path):
+    db = _make(tmp_path)
+    for i in range(20):
+        db.execute('INSERT INTO t (v) VALUES (?)', (i,))
+        db.query('SELECT * FROM t')
+    assert db.opened == 1
+    assert db.query_one('PRAGMA journal_mode')[0] == 'wal'
+
+
+def test_nested_units_share_one_transaction(tmp_path):
+    db = _make(tmp_path)
+
+    def inner():
+        with db.unit_of_work() as c:
+            c.execute('INSERT INTO t (v) VALUES (2)')
+
+    try:
+        with db.unit_of_work() as c:
+            c.execute('INSERT INTO t (v) VALUES (1)')
+            inner()
+            raise RuntimeError("abort")
+    except RuntimeError:
+        pass
+    assert db.query_one('SELECT COUNT(*) FROM t')[0] == 0  # Inner write rolled back too
+
+    with db.unit_of_work():
+        inner()
+        inner()
+    assert db.query_one('SELECT COUNT(*) FROM t')[0] == 2
+
+
+def test_after_commit_runs_only_on_outer_commit(tmp_path):
+    db = _make(tmp_path)
+    ran = []
+    db.after_commit(lambda: ran.append("now"))  # No unit of work: runs straight away
+
+    with db.unit_of_work():
+        with db.unit_of_work():
+            db.after_commit(lambda: ran.append("inner"))
+        assert ran == ["now"]
+    assert ran == ["now", "inner"]
+
+    try:
+        with db.unit_of_work():
+            db.after_commit(lambda: ran.append("rolled back"))
+            raise RuntimeError("abort")
+    except RuntimeError:
+        pass
+    with db.unit_of_work():
+        pass
+    assert ran == ["now", "inner"]
+
+
+def test_threads_get_their_own_connection(tmp_path):
+    db = _make(tmp_path)
+    errors = []
+
+    def worker():
+        try:
+            for _ in range(50):
+                with db.unit_of_work() as c:
+                    c.execute('INSERT INTO t (v) VALUES (1)')
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    assert db.query_one('SELECT COUNT(*) FROM t')[0] == 200
+    assert db.opened <= 5
+
+
+def _insert(db, v):
+    with db.unit_of_work() as c:
+        c.execute('INSERT INTO t (v) VALUES (?)', (v,))
+
+
+def test_batch_writer_applies_in_background(tmp_path):
+    db = _make(tmp_path)
+    writer = BatchWriter(db)
+    for i in range(40):
+        assert writer.submit(_insert, db, i)
+    writer.flush()
+    assert db.query_one('SELECT COUNT(*) FROM t')[0] == 40
+    assert writer.applied == 40
+    assert writer.batches <= 40
+    writer.close()
+
+
+def test_batch_writer_isolates_failing_job(tmp_path):
+    db = _make(tmp_path)
+    writer = BatchWriter(db)
+    gate = threading.Event()
+    writer.submit(gate.wait)  # Hold the thread so the next jobs land in one batch
+    writer.submit(_insert, db, 1)
+    writer.submit(db.execute, 'INSERT INTO missing VALUES (1)')  # Fails the batch...
+    writer.submit(_insert, db, 3)
+    gate.set()
+    writer.flush()
+    # ...but the good jobs are retried on their own
+    assert sorted(r[0] for r in db.query('SELECT v FROM t')) == [1, 3]
+    assert writer.failed == 1
+    writer.close()
+
+
+def test_batch_writer_retry_runs_side_effects_once(tmp_path):
+    db = _make(tmp_path)
+    writer = BatchWriter(db)
+    logged = []
+    gate = threading.Event()
+
+    def insert_and_log(v):
+        _insert(db, v)
+        db.after_commit(lambda: logged.append(v))
+
+    def fail():
+        raise ValueError("bad row")
+
+    writer.submit(gate.wait)
+    writer.submit(insert_and_log, 1)
+    writer.submit(fail)  # Rolls back the batch; insert_and_log is then retried alone
+    gate.set()
+    writer.flush()
+    assert logged == [1]
+    assert db.query_one('SELECT COUNT(*) FROM t')[0] == 1
+    writer.close()
+
+
+def test_batch_writer_drops_when_full(tmp_path):
+    db = _make(tmp_path)
+    writer = BatchWriter(db, max_pending=2)
+    started = threading.Event()
+    gate = threading.Event()
+
+    def hold():
+        started.set()
+        gate.wait()
+
+    writer.submit(hold)
+    assert started.wait(5)  # The writer has taken the gate job, so the queue is empty again
+    assert writer.submit(_insert, db, 1) and writer.submit(_insert, db, 2)
+    assert not writer.submit(_insert, db, 3)
+    assert writer.dropped == 1
+    gate.set()
+    writer.close()
+    assert db.query_one('SELECT COUNT(*) FROM t')[0] == 2
+
+
+def test_migrate_applies_only_new_steps(tmp_path):
+    db = Database(str(tmp_path / "test.db"))
+    calls = []
+
+    def v1(c):
+        calls.append(1)
+        c.execute('CREATE TABLE t (id INTEGER PRIMARY KEY)')
+
+    def v2(c):
+        calls.append(2)
+        c.execute('ALTER TABLE t ADD COLUMN v INTEGER')
+
+    assert db.migrate([v1]) == 1
+    assert db.migrate([v1]) == 0
+    assert db.migrate([v1, v2]) == 1
+    assert calls == [1, 2]
+    assert db.query_one('PRAGMA user_version')[0] == 2
+
+
+def test_failed_migration_keeps_version(tmp_path):
+    db = Database(str(tmp_path / "test.db"))
+
+    def broken(c):
+        c.execute('CREATE TABLE t (id INTEGER)')
+        c.execute('INSERT INTO missing VALUES (1)')
+
+    try:
+        db.migrate([broken])
+    except sqlite3.OperationalError:
+        pass
+    assert db.query_one('PRAGMA user_version')[0] == 0
+    assert db.query_one("SELECT COUNT(*) FROM sqlite_master WHERE name = 't'")[0] == 0
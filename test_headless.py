@@ -0,0 +1,44 @@
+"""
+Unit tests for the headless NumPy panel (headless.py).
+"""
+import numpy as np
+
+from headless import RGBMatrix, RGBMatrixOptions
+
+
+def _matrix():
+    options = RGBMatrixOptions()
+    options.rows, options.cols = 32, 64
+    return RGBMatrix(options=options)
+
+
+def test_set_pixel_clear_and_bounds():
+    canvas = _matrix().CreateFrameCanvas()
+    canvas.SetPixel(63, 31, 1, 2, 3)
+    canvas.SetPixel(64, 0, 9, 9, 9)   # Off-panel: ignored
+    canvas.SetPixel(-1, 5, 9, 9, 9)
+    assert canvas.buffer.shape == (32, 64, 3)
+    assert tuple(canvas.buffer[31, 63]) == (1, 2, 3)
+    assert int(canvas.buffer.sum()) == 6
+    assert canvas.set_pixel_calls == 3
+    canvas.Clear()
+    assert not canvas.buffer.any()
+
+
+def test_swap_is_double_buffered():
+    matrix = _matrix()
+    canvas = matrix.CreateFrameCanvas()
+    canvas.Fill(5, 5, 5)
+    back = matrix.SwapOnVSync(canvas)
+    assert back is not canvas
+    assert (matrix.frame() == 5).all()
+    assert matrix.SwapOnVSync(back) is canvas
+    assert matrix.swaps == 2
+
+
+def test_set_image_is_clipped():
+    canvas = _matrix().CreateFrameCanvas()
+    image = np.full((4, 4, 3), 7, dtype=np.uint8)
+    canvas.SetImage(image, 62, -2)
+    assert int((canvas.buffer == 7).all(axis=2).sum()) == 4  # 2x2 corner on the panel
+    assert tuple(canvas.buffer[1, 63]) == (7, 7, 7)
@@ -0,0 +1,69 @@
+"""
+Unit tests for keyset-paginated match history (match_history.py).
+"""
+import pytest
+
+from db import Database
+from match_history import HISTORY_INDEXES, decode_cursor, encode_cursor, query_history
+
+
+def _make(tmp_path):
+    db = Database(str(tmp_path / "test.db"))
+    db.execute('CREATE TABLE wrestlers (id INTEGER PRIMARY KEY, name TEXT, custom_name TEXT)')
+    db.execute('''CREATE TABLE matches (id INTEGER PRIMARY KEY AUTOINCREMENT, p1_id INTEGER,
+                  p2_id INTEGER, winner_id INTEGER, timestamp DATETIME DEFAULT CURRENT_TIMESTAMP)''')
+    with db.unit_of_work() as c:
+        for statement in HISTORY_INDEXES:
+            c.execute(statement)
+        for w_id in range(1, 5):
+            c.execute('INSERT INTO wrestlers (id, name) VALUES (?, ?)', (w_id, f"W{w_id}"))
+        # Three matches per timestamp, so pages must break ties on id
+        for i in range(30):
+            p1, p2 = i % 4 + 1, (i + 1) % 4 + 1
+            c.execute('INSERT INTO matches (p1_id, p2_id, winner_id, timestamp) VALUES (?, ?, ?, ?)',
+                      (p1, p2, p1, f"2026-01-01 00:00:{i // 3:02d}"))
+    return db
+
+
+def _all_pages(db, wrestler_id=None, limit=4):
+    seen, after = [], None
+    while True:
+        page, after = query_history(db, wrestler_id=wrestler_id, limit=limit, after=after)
+        seen.extend(m['id'] for m in page)
+        if after is None:
+            return seen
+
+
+def test_pages_cover_everything_newest_first(tmp_path):
+    db = _make(tmp_path)
+    assert _all_pages(db) == list(range(30, 0, -1))
+    first, _ = query_history(db, limit=2)
+    assert [m['p1_name'] for m in first] == ["W2", "W1"]
+
+
+def test_wrestler_filter_merges_both_sides(tmp_path):
+    db = _make(tmp_path)
+    expected = db.query('''SELECT id FROM matches WHERE p1_id = 2 OR p2_id = 2
+                           ORDER BY timestamp DESC, id DESC''')
+    assert _all_pages(db, wrestler_id=2, limit=3) == [r['id'] for r in expected]
+
+
+def test_self_match_listed_once(tmp_path):
+    db = _make(tmp_path)
+    db.execute("INSERT INTO matches (p1_id, p2_id, winner_id, timestamp) VALUES (3, 3, 3, '2027-01-01')")
+    page, _ = query_history(db, wrestler_id=3, limit=2)
+    assert page[0]['id'] != page[1]['id']
+
+
+def test_history_uses_indexes(tmp_path):
+    db = _make(tmp_path)
+    plan = ' '.join(row['detail'] for row in db.query(
+        'EXPLAIN QUERY PLAN SELECT id FROM matches WHERE p2_id = ? AND (timestamp, id) < (?, ?) '
+        'ORDER BY timestamp DESC, id DESC LIMIT 5', (1, '2026', 9)))
+    assert 'idx_matches_p2_time' in plan and 'TEMP B-TREE' not in plan
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    assert decode_cursor(encode_cursor("2026-01-01 00:00:00", 7)) == ("2026-01-01 00:00:00", 7)
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
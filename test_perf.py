@@ -0,0 +1,72 @@
+"""
+Unit tests for the fixed-step frame clock and pacing stats (perf.py).
+"""
+import perf
+from perf import FrameClock, FrameStats
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _clock(monkeypatch, **kwargs):
+    fake = FakeClock()
+    monkeypatch.setattr(perf.time, "perf_counter", fake)
+    kwargs.setdefault("render_hz", 20)
+    return fake, FrameClock(hz=10, **kwargs)
+
+
+def test_steps_follow_elapsed_time(monkeypatch):
+    fake, clock = _clock(monkeypatch)
+    fake.now += 0.25
+    steps, period = clock.advance()
+    assert steps == 2 and abs(period - 0.25) < 1e-9
+    assert abs(clock.alpha() - 0.5) < 1e-9
+    assert abs(clock.sleep_time() - 0.05) < 1e-9
+    fake.now += 0.06  # The leftover half step carries over: no drift
+    assert clock.advance()[0] == 1
+
+
+def test_frames_between_steps_interpolate(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(perf.time, "perf_counter", fake)
+    clock = FrameClock(hz=8, render_hz=32)  # Binary-exact step and frame times
+    fake.now += 0.125
+    assert clock.advance()[0] == 1 and clock.alpha() == 0.0
+    assert clock.sleep_time() == 0.03125  # Next frame comes before the next step
+    for expected in (0.25, 0.5, 0.75):
+        fake.now += 0.03125
+        assert clock.advance()[0] == 0  # A draw-only wake-up
+        assert clock.alpha() == expected
+    fake.now += 0.03125
+    assert clock.advance()[0] == 1
+
+
+def test_catch_up_is_bounded(monkeypatch):
+    fake, clock = _clock(monkeypatch, max_catchup=3)
+    fake.now += 1.05  # A one-second stall
+    assert clock.advance()[0] == 3
+    assert clock.dropped_steps == 7
+    assert clock.alpha() < 1.0
+
+
+def test_snapshot_histogram_and_late_frames():
+    stats = FrameStats(window=4, target_hz=30)
+    for period in (0.033, 0.034, 0.2, 0.033, 0.033):
+        stats.record(period, 0.005)
+    snap = stats.snapshot()
+    assert snap["frames"] == 5 and snap["window"] == 4  # Oldest frame rolled out
+    assert snap["late"] == 1
+    buckets = {b["max_ms"]: b["count"] for b in snap["histogram"]}
+    assert sum(buckets.values()) == 4
+    assert buckets[34] == 3 and buckets[250] == 1 and buckets[None] == 0
+    assert snap["period_ms"]["max"] == 200.0
+
+
+def test_empty_snapshot():
+    snap = FrameStats().snapshot()
+    assert snap["fps"] is None and snap["period_ms"]["p50"] is None
@@ -0,0 +1,95 @@
+"""
+Unit tests for the cached LED background and text sprites (render.py).
+"""
+import math
+
+import pytest
+
+import constants as C
+import fonts
+from render import SALT_PILES, StaticBackground, draw_sprite, static_background, text_sprite, text_width
+
+
+class RecordingCanvas:
+    """Minimal stand-in for an rgbmatrix FrameCanvas."""
+
+    def __init__(self):
+        self.pixels = {}
+
+    def Clear(self):
+        self.pixels = {}
+
+    def SetPixel(self, x, y, r, g, b):
+        self.pixels[(x, y)] = (r, g, b)
+
+
+def _legacy_arena(canvas, sx, sy):
+    # The per-frame drawing SumoGame.draw used to do
+    for y in range(C.HEIGHT):
+        canvas.SetPixel(32, y, 20, 20, 20)
+    for angle in range(0, 360, 5):
+        rad = math.radians(angle)
+        x = int(C.CENTER_X + sx + math.cos(rad) * C.RING_RADIUS)
+        y = int(C.CENTER_Y + sy + math.sin(rad) * C.RING_RADIUS)
+        if 0 <= x < C.WIDTH and 0 <= y < C.HEIGHT:
+            canvas.SetPixel(x, y, *C.COLOR_RING)
+    for x, y in SALT_PILES:
+        canvas.SetPixel(x, y, 80, 80, 80)
+
+
+def test_blit_matches_legacy_drawing():
+    background = StaticBackground()
+    for sx, sy in background.pixels:
+        expected = RecordingCanvas()
+        _legacy_arena(expected, sx, sy)
+        canvas = RecordingCanvas()
+        canvas.SetPixel(0, 0, 255, 0, 0)  # Stale pixel from the previous frame
+        background.blit(canvas, sx, sy)
+        assert canvas.pixels == expected.pixels
+
+
+def test_background_shared_per_resolution():
+    assert static_background() is static_background(C.WIDTH, C.HEIGHT)
+    assert static_background(128, 64) is not static_background()
+
+
+def test_set_image_used_when_available():
+    pytest.importorskip("PIL")
+
+    class ImageCanvas(RecordingCanvas):
+        def SetImage(self, image, x, y):
+            self.pixels = {(px, py): image.getpixel((px, py))
+                           for px in range(image.width) for py in range(image.height)
+                           if image.getpixel((px, py)) != (0, 0, 0)}
+
+    expected = RecordingCanvas()
+    _legacy_arena(expected, 1, -1)
+    canvas = ImageCanvas()
+    StaticBackground().blit(canvas, 1, -1)
+    assert canvas.pixels == expected.pixels
+
+
+def _legacy_text(canvas, x, y, text, color):
+    # draw_text_small before glyphs were precompiled
+    for char in text.upper():
+        if char in fonts.FONT_3x5:
+            for r, row_bits in enumerate(fonts.FONT_3x5[char]):
+                for bit in range(3):
+                    if (row_bits >> (2 - bit)) & 1:
+                        canvas.SetPixel(x + bit, y + r, *color)
+        x += 4
+
+
+def test_text_sprite_matches_legacy_font_walk():
+    text = "Nokotta 12-0 ?!"
+    expected = RecordingCanvas()
+    _legacy_text(expected, 3, 7, text, (1, 2, 3))
+    canvas = RecordingCanvas()
+    draw_sprite(canvas, 3, 7, text_sprite(text, (1, 2, 3)))
+    assert canvas.pixels == expected.pixels
+    assert text_width(text) == len(text) * 4 - 1
+
+
+def test_text_sprite_is_cached():
+    assert text_sprite("WINNER", (9, 9, 9)) is text_sprite("WINNER", (9, 9, 9))
+    assert text_sprite("WINNER", (9, 9, 9)) is not text_sprite("WINNER", (9, 9, 8))
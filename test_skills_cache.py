@@ -0,0 +1,87 @@
+"""
+Unit tests for the in-memory skill bonus cache (skills_cache.py).
+"""
+import json
+
+import pytest
+
+import constants as C
+from db import Database
+from skills_cache import SkillBonusCache
+
+EFFECTS = {"push": {"strength": 0.1}, "grip": {"technique": 0.05, "speed": 0.02}, "dash": {"speed": 0.1}}
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / "test.db"))
+    with database.unit_of_work() as c:
+        c.execute('CREATE TABLE wrestlers (id INTEGER PRIMARY KEY, fighting_style TEXT)')
+        c.execute('CREATE TABLE skills (id TEXT PRIMARY KEY, effect_json TEXT)')
+        c.execute('CREATE TABLE wrestler_skills (wrestler_id INTEGER, skill_id TEXT)')
+        for skill_id, effect in EFFECTS.items():
+            c.execute('INSERT INTO skills VALUES (?, ?)', (skill_id, json.dumps(effect)))
+        c.executemany('INSERT INTO wrestlers VALUES (?, ?)', [(1, None), (2, 'grand_champion'), (3, 'speed_demon')])
+        c.executemany('INSERT INTO wrestler_skills VALUES (?, ?)', [(1, 'push'), (1, 'grip'), (3, 'dash')])
+    yield database
+    database.close_all()
+
+
+def _legacy_bonuses(db, wrestler_id):
+    # The per-fight queries get_skill_bonuses ran before the cache
+    rows = db.query('''SELECT s.effect_json FROM wrestler_skills ws
+                 JOIN skills s ON ws.skill_id = s.id
+                 WHERE ws.wrestler_id = ?''', (wrestler_id,))
+    bonuses = {"strength": 0.0, "technique": 0.0, "speed": 0.0}
+    for row in rows:
+        for stat, value in json.loads(row[0]).items():
+            if stat in bonuses:
+                bonuses[stat] += value
+    row = db.query_one('SELECT fighting_style FROM wrestlers WHERE id = ?', (wrestler_id,))
+    if row and row['fighting_style'] in C.FIGHTING_STYLES:
+        for stat, value in C.FIGHTING_STYLES[row['fighting_style']]['bonus'].items():
+            if stat in bonuses:
+                bonuses[stat] += value
+    return bonuses
+
+
+def test_load_matches_legacy_query(db):
+    cache = SkillBonusCache(db)
+    cache.load()
+    for w_id in (1, 2, 3):
+        assert cache.get(w_id) == pytest.approx(_legacy_bonuses(db, w_id))
+
+
+def test_unknown_wrestler_gets_zero_default(db):
+    cache = SkillBonusCache(db)
+    cache.load()
+    assert cache.get(99) == {"strength": 0.0, "technique": 0.0, "speed": 0.0}
+    cache.get(99)["strength"] = 5.0  # Callers get a copy
+    assert cache.get(99)["strength"] == 0.0
+
+
+def test_incremental_updates_match_reload(db):
+    cache = SkillBonusCache(db)
+    cache.load()
+    before = cache.get(2)
+    with db.unit_of_work() as c:
+        c.execute('INSERT INTO wrestler_skills VALUES (2, ?)', ('dash',))
+        cache.skill_unlocked(2, 'dash')
+        c.execute('UPDATE wrestlers SET fighting_style = ? WHERE id = 1', ('oshi_specialist',))
+        cache.style_changed(1, 'oshi_specialist')
+        assert cache.get(2) == before  # Applied on commit, not before
+    for w_id in (1, 2):
+        assert cache.get(w_id) == pytest.approx(_legacy_bonuses(db, w_id))
+
+
+def test_rolled_back_updates_are_dropped(db):
+    cache = SkillBonusCache(db)
+    cache.load()
+    before = cache.get(1)
+    with pytest.raises(RuntimeError):
+        with db.unit_of_work() as c:
+            c.execute('INSERT INTO wrestler_skills VALUES (1, ?)', ('dash',))
+            cache.skill_unlocked(1, 'dash')
+            cache.style_changed(1, 'speed_demon')
+            raise RuntimeError("milestone check failed")
+    assert cache.get(1) == before == pytest.approx(_legacy_bonuses(db, 1))
@@ -2,6 +2,7 @@
 
 import { useEffect, useState, useCallback } from "react";
 import { api, Wrestler, getApiUrl } from "@/lib/api";
+import { useControlChannel, ControlMessage } from "@/lib/control";
 import { WRESTLER_POLL_INTERVAL_MS, STATUS_POLL_INTERVAL_MS, AVATAR_SIZE_CONTROLLER, STAT_BAR_MAX_VALUE, BUTTON_TEXT, ButtonTextValue } from "@/lib/constants";
 import { Button } from "@/components/ui/button";
 import Link from "next/link";
@@ -26,7 +27,7 @@ export default function ControllerPage() {
     const [selectorOpen, setSelectorOpen] = useState<'p1' | 'p2' | null>(null);
 
     const fetchWrestlers = useCallback(() => {
-        api.getWrestlers().then(data => {
+        api.getWrestlerPicker().then(data => {
             setWrestlers(data);
             if (data.length >= 2 && !p1 && !p2) {
                 setP1(data[0].id.toString());
@@ -41,53 +42,71 @@ export default function ControllerPage() {
         return () => clearInterval(pollInterval);
     }, [fetchWrestlers]);
 
-    // Sync Mode Polling
+    const applyLobbyStatus = useCallback((status: any) => {
+        setLobbyStatus(status);
+
+        // Auto-update opponent ID if joined
+        if (status.p1 && status.p1.id && mySide === 'p2') setP1(status.p1.id);
+        if (status.p2 && status.p2.id && mySide === 'p1') setP2(status.p2.id);
+    }, [mySide]);
+
+    const applyGameStatus = useCallback((data: any) => {
+        if (data.status === "FIGHTING" || data.status === "COUNTDOWN") {
+            setLoading(true);
+            setButtonText(data.status === "COUNTDOWN" ? BUTTON_TEXT.HAKKEYOI : BUTTON_TEXT.NOKOTTA);
+        } else if (data.status === "GAME_OVER") {
+            // Match just ended - keep showing buttons but prepare for reset
+            // Will reset when status returns to IDLE/WAITING
+        } else if (data.status === "IDLE" || data.status === "WAITING") {
+            // Server is idle - reset to wrestler selection if we were in a match
+            if (buttonText === BUTTON_TEXT.NOKOTTA || buttonText === BUTTON_TEXT.HAKKEYOI || loading) {
+                setLoading(false);
+                setButtonText(BUTTON_TEXT.TACHIAI);
+                fetchWrestlers(); // Refresh to get updated win/loss records
+            }
+        }
+    }, [buttonText, fetchWrestlers, loading]);
+
+    // Server push replaces the lobby/status polls below while connected
+    const controlConnected = useControlChannel((message: ControlMessage) => {
+        if (message.type === "hello") {
+            if (syncMode) applyLobbyStatus(message.data.lobby);
+            applyGameStatus(message.data.status);
+        } else if (message.type === "lobby") {
+            if (syncMode) applyLobbyStatus(message.data);
+        } else if (message.type === "status") {
+            applyGameStatus(message.data);
+        }
+    });
+
+    // Sync Mode Polling (fallback while the control channel is down)
     useEffect(() => {
         if (!syncMode) return;
 
         const pollLobby = async () => {
             try {
-                const status = await api.getLobbyStatus();
-                setLobbyStatus(status);
-
-                // Auto-update opponent ID if joined
-                if (status.p1 && status.p1.id && mySide === 'p2') setP1(status.p1.id);
-                if (status.p2 && status.p2.id && mySide === 'p1') setP2(status.p2.id);
-
+                applyLobbyStatus(await api.getLobbyStatus());
             } catch (e) {
                 console.error(e);
             }
         };
 
         pollLobby();
+        if (controlConnected) return;
         const interval = setInterval(pollLobby, 1000);
         return () => clearInterval(interval);
-    }, [syncMode, mySide]);
+    }, [syncMode, applyLobbyStatus, controlConnected]);
 
     useEffect(() => {
+        if (controlConnected) return;
         const interval = setInterval(() => {
-            fetch(`${getApiUrl()}/status`)
+            fetch(`${getApiUrl()}/status`, { cache: 'no-cache' })
                 .then(res => res.json())
-                .then(data => {
-                    if (data.status === "FIGHTING" || data.status === "COUNTDOWN") {
-                        setLoading(true);
-                        setButtonText(data.status === "COUNTDOWN" ? BUTTON_TEXT.HAKKEYOI : BUTTON_TEXT.NOKOTTA);
-                    } else if (data.status === "GAME_OVER") {
-                        // Match just ended - keep showing buttons but prepare for reset
-                        // Will reset when status returns to IDLE/WAITING
-                    } else if (data.status === "IDLE" || data.status === "WAITING") {
-                        // Server is idle - reset to wrestler selection if we were in a match
-                        if (buttonText === BUTTON_TEXT.NOKOTTA || buttonText === BUTTON_TEXT.HAKKEYOI || loading) {
-                            setLoading(false);
-                            setButtonText(BUTTON_TEXT.TACHIAI);
-                            fetchWrestlers(); // Refresh to get updated win/loss records
-                        }
-                    }
-                })
+                .then(applyGameStatus)
                 .catch(err => console.error(err));
         }, STATUS_POLL_INTERVAL_MS);
         return () => clearInterval(interval);
-    }, [buttonText, fetchWrestlers, loading]);
+    }, [applyGameStatus, controlConnected]);
 
     const triggerHaptic = (ms: number) => {
         if (typeof navigator !== 'undefined' && navigator.vibrate) {
@@ -5,6 +5,7 @@ import Link from 'next/link'
 import { Gamepad2 } from 'lucide-react'
 import { PixelSumo } from '@/components/PixelSumo'
 import { getApiUrl } from '@/lib/api'
+import { useControlChannel, ControlMessage } from '@/lib/control'
 import confetti from 'canvas-confetti'
 import {
     WAITING_DOTS_INTERVAL_MS,
@@ -66,6 +67,7 @@ interface MatchState {
     events?: SkillEvent[]
     p1_edge_danger?: number
     p2_edge_danger?: number
+    p1_win_prob?: number | null  // Live odds from the precomputed state table (fighting only)
     p1_matta?: number
     p2_matta?: number
     matta_player?: string
@@ -181,40 +183,54 @@ export default function WatchPage() {
         return () => clearInterval(interval)
     }, [])
 
+    const switchToMatch = useCallback((newMatchId: string | null) => {
+        if (newMatchId && newMatchId !== currentMatchIdRef.current) {
+            // Real match found - disable demo mode
+            setDemoMode(false)
+            setDemoState(null)
+            if (demoPollRef.current) {
+                clearInterval(demoPollRef.current)
+                demoPollRef.current = null
+            }
+
+            if (showWinner) {
+                setShowWinner(false)
+                setWinnerData(null)
+                if (winnerTimeoutRef.current) {
+                    clearTimeout(winnerTimeoutRef.current)
+                }
+            }
+            if (wsRef.current) wsRef.current.close()
+            setMatchState(null)
+            setDisplayP1(null)
+            setDisplayP2(null)
+            setActiveSkills([])
+            setConnected(false)
+            setShowMatta(false)
+            setShowTachiai(false)
+            setMatchId(newMatchId)
+            currentMatchIdRef.current = newMatchId
+        }
+        // Note: Demo mode starts true by default, only disabled when real match found
+    }, [showWinner])
+
+    // Server push: new matches arrive immediately instead of on the next poll
+    const controlConnected = useControlChannel((message: ControlMessage) => {
+        if (message.type === 'hello') switchToMatch(message.data.status.active.match_id)
+        else if (message.type === 'status') switchToMatch(message.data.active.match_id)
+        else if (message.type === 'match_started') switchToMatch(message.data.match_id)
+    })
+
+    // Active-match polling (fallback while the control channel is down)
     useEffect(() => {
+        if (controlConnected) return
+
         const checkForMatch = async () => {
             try {
-                const res = await fetch(`${API_BASE}/matches/active`)
+                const res = await fetch(`${API_BASE}/matches/active`, { cache: 'no-cache' })
                 if (res.ok) {
                     const data = await res.json()
-                    if (data.match_id && data.match_id !== currentMatchIdRef.current) {
-                        // Real match found - disable demo mode
-                        setDemoMode(false)
-                        setDemoState(null)
-                        if (demoPollRef.current) {
-                            clearInterval(demoPollRef.current)
-                            demoPollRef.current = null
-                        }
-
-                        if (showWinner) {
-                            setShowWinner(false)
-                            setWinnerData(null)
-                            if (winnerTimeoutRef.current) {
-                                clearTimeout(winnerTimeoutRef.current)
-                            }
-                        }
-                        if (wsRef.current) wsRef.current.close()
-                        setMatchState(null)
-                        setDisplayP1(null)
-                        setDisplayP2(null)
-                        setActiveSkills([])
-                        setConnected(false)
-                        setShowMatta(false)
-                        setShowTachiai(false)
-                        setMatchId(data.match_id)
-                        currentMatchIdRef.current = data.match_id
-                    }
-                    // Note: Demo mode starts true by default, only disabled when real match found
+                    switchToMatch(data.match_id)
                 }
             } catch { /* silent */ }
         }
@@ -222,7 +238,7 @@ export default function WatchPage() {
         pollRef.current = setInterval(checkForMatch, ACTIVE_MATCH_POLL_INTERVAL_MS)
         checkForMatch()
         return () => { if (pollRef.current) clearInterval(pollRef.current) }
-    }, [API_BASE, showWinner])
+    }, [API_BASE, switchToMatch, controlConnected])
 
     const spawnParticles = useCallback((centerX: number, centerY: number) => {
         const newParticles: { id: number; x: number; y: number }[] = []
@@ -899,6 +915,26 @@ export default function WatchPage() {
                     </div>
                 </div>
 
+                {/* Live win probability (P1 share from the left) */}
+                {typeof matchState?.p1_win_prob === 'number' && (
+                    <div style={{
+                        width: RING_SIZE,
+                        height: 6,
+                        marginBottom: 12,
+                        display: 'flex',
+                        borderRadius: 3,
+                        overflow: 'hidden',
+                        border: '1px solid rgba(255,255,255,0.2)'
+                    }}>
+                        <div style={{
+                            width: `${matchState.p1_win_prob * 100}%`,
+                            background: `rgb(${matchState.p1?.color || '255,255,255'})`,
+                            transition: 'width 0.3s ease'
+                        }} />
+                        <div style={{ flex: 1, background: `rgb(${matchState.p2?.color || '255,255,255'})` }} />
+                    </div>
+                )}
+
                 {/* Dohyo with edge danger glow */}
                 <div style={{
                     width: RING_SIZE,
@@ -29,6 +29,9 @@ export interface Wrestler {
     win_streak?: number;
     fighting_style?: string;
     milestones?: string[];
+    // Elo skill rating (ranked bouts only)
+    rating?: number;
+    rated_matches?: number;
 }
 
 export interface Skill {
@@ -70,13 +73,97 @@ export interface MatchRecord {
     timestamp: any; // Firestore timestamp
 }
 
+export interface CareerStats {
+    id: string;
+    bouts: number;
+    wins: number;
+    losses: number;
+    pushes: number;
+    counters: number;
+    clashes: number;
+    win_rate: number;
+    avg_duration: number;
+    avg_pushes: number;
+    counter_rate: number;
+    last_match_id?: string;
+}
+
+export interface HeadToHead {
+    a_id: string;
+    b_id: string;
+    bouts: number;
+    a_wins: number;
+    b_wins: number;
+    avg_duration: number;
+    last_match_id?: string;
+    last_winner_id?: string;
+}
+
+export interface MatchupOdds {
+    p1_id: string;
+    p2_id: string;
+    p1_win: number;
+    p2_win: number;
+    bouts_per_cell: number;
+}
+
+export interface OddsJob {
+    job_id: string;
+    p1_id: string;
+    p2_id: string;
+    bouts: number;
+    status: 'queued' | 'running' | 'done' | 'failed';
+    total_bouts?: number;
+    timeouts?: number;
+    p1_win?: number;
+    p2_win?: number;
+}
+
+export interface WrestlerQuery {
+    view?: 'picker' | 'full';
+    fields?: string[];
+    stable?: string;
+    rank?: number;
+    active?: boolean;
+    prefix?: string;
+    sort?: 'id' | 'name' | 'xp' | 'wins';
+    limit?: number;
+    after?: string;
+}
+
 export const api = {
     getWrestlers: async (): Promise<Wrestler[]> => {
-        const res = await fetch(`${getApiUrl()}/wrestlers`, { cache: 'no-store' });
+        // 'no-cache' revalidates with If-None-Match, so unchanged rosters come back as 304
+        const res = await fetch(`${getApiUrl()}/wrestlers`, { cache: 'no-cache' });
         if (!res.ok) throw new Error('Failed to fetch wrestlers');
         return res.json();
     },
 
+    // One indexed page; pass nextCursor back as `after` for the next one
+    queryWrestlers: async (query: WrestlerQuery): Promise<{ wrestlers: Wrestler[]; nextCursor: string | null }> => {
+        const params = new URLSearchParams();
+        Object.entries(query).forEach(([key, value]) => {
+            if (value === undefined) return;
+            params.set(key, Array.isArray(value) ? value.join(',') : String(value));
+        });
+        const res = await fetch(`${getApiUrl()}/wrestlers?${params}`, { cache: 'no-cache' });
+        if (!res.ok) throw new Error('Failed to query wrestlers');
+        return { wrestlers: await res.json(), nextCursor: res.headers.get('X-Next-Cursor') };
+    },
+
+    // Compact roster for selection UIs (names, colors, stats only).
+    // Pages in document order: sort=name would skip wrestlers missing search_name.
+    getWrestlerPicker: async (): Promise<Wrestler[]> => {
+        const wrestlers: Wrestler[] = [];
+        let after: string | undefined;
+        do {
+            const page = await api.queryWrestlers({ view: 'picker', sort: 'id', limit: 200, after });
+            wrestlers.push(...page.wrestlers);
+            after = page.nextCursor ?? undefined;
+        } while (after);
+        return wrestlers;
+    },
+
     getWrestler: async (id: string): Promise<Wrestler> => {
         const res = await fetch(`${getApiUrl()}/wrestlers/${id}`, { cache: 'no-store' });
         if (!res.ok) throw new Error('Failed to fetch wrestler');
@@ -120,9 +207,45 @@ export const api = {
         return res.json();
     },
 
+    getCareerStats: async (wrestlerId: string): Promise<CareerStats> => {
+        const res = await fetch(`${getApiUrl()}/wrestlers/${wrestlerId}/stats`, { cache: 'no-store' });
+        if (!res.ok) throw new Error('Failed to fetch career stats');
+        return res.json();
+    },
+
+    getHeadToHead: async (a: string, b: string): Promise<HeadToHead> => {
+        const res = await fetch(`${getApiUrl()}/head-to-head?a=${a}&b=${b}`, { cache: 'no-store' });
+        if (!res.ok) throw new Error('Failed to fetch head-to-head');
+        return res.json();
+    },
+
+    // Pre-bout odds from the precomputed simulation table
+    getOdds: async (p1: string, p2: string): Promise<MatchupOdds> => {
+        const res = await fetch(`${getApiUrl()}/odds?p1=${p1}&p2=${p2}`, { cache: 'no-store' });
+        if (!res.ok) throw new Error('Failed to fetch odds');
+        return res.json();
+    },
+
+    // Fresh simulation of one pairing; poll getOddsJob until status is 'done'
+    createOddsJob: async (p1_id: string, p2_id: string, bouts: number = 100): Promise<OddsJob> => {
+        const res = await fetch(`${getApiUrl()}/odds/jobs`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ p1_id, p2_id, bouts })
+        });
+        if (!res.ok) throw new Error('Failed to start odds job');
+        return res.json();
+    },
+
+    getOddsJob: async (jobId: string): Promise<OddsJob> => {
+        const res = await fetch(`${getApiUrl()}/odds/jobs/${jobId}`, { cache: 'no-store' });
+        if (!res.ok) throw new Error('Odds job not found');
+        return res.json();
+    },
+
     // Skill Tree API
     getSkillTree: async (): Promise<Record<string, SkillBranch>> => {
-        const res = await fetch(`${getApiUrl()}/skills`, { cache: 'no-store' });
+        const res = await fetch(`${getApiUrl()}/skills`, { cache: 'no-cache' });
         if (!res.ok) throw new Error('Failed to fetch skill tree');
         return res.json();
     },
@@ -166,7 +289,7 @@ export const api = {
 
     // --- Remote Lobby API ---
     getLobbyStatus: async () => {
-        const res = await fetch(`${getApiUrl()}/lobby/status`, { cache: 'no-store' });
+        const res = await fetch(`${getApiUrl()}/lobby/status`, { cache: 'no-cache' });
         if (!res.ok) throw new Error('Failed to fetch lobby status');
         return res.json();
     },
@@ -197,5 +320,63 @@ export const api = {
         });
         if (!res.ok) throw new Error('Failed to reset lobby');
         return res.json();
+    },
+
+    // --- Matchmaking API ---
+    enqueueMatchmaking: async (wrestlerId: string) => {
+        const res = await fetch(`${getApiUrl()}/matchmaking/enqueue`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ wrestler_id: wrestlerId })
+        });
+        if (!res.ok) throw new Error('Failed to join matchmaking');
+        return res.json();
+    },
+
+    getMatchmakingTicket: async (ticketId: string) => {
+        const res = await fetch(`${getApiUrl()}/matchmaking/${ticketId}`, { cache: 'no-store' });
+        if (!res.ok) throw new Error('Ticket not found');
+        return res.json();
+    },
+
+    cancelMatchmaking: async (ticketId: string) => {
+        const res = await fetch(`${getApiUrl()}/matchmaking/${ticketId}`, { method: 'DELETE' });
+        if (!res.ok) throw new Error('Failed to leave matchmaking');
+        return res.json();
+    },
+
+    // --- Rooms API (many lobbies, joined by short code) ---
+    createRoom: async () => {
+        const res = await fetch(`${getApiUrl()}/rooms`, { method: 'POST' });
+        if (!res.ok) throw new Error('Failed to create room');
+        return res.json();
+    },
+
+    getRoom: async (code: string) => {
+        const res = await fetch(`${getApiUrl()}/rooms/${code}`, { cache: 'no-cache' });
+        if (!res.ok) throw new Error('Room not found');
+        return res.json();
+    },
+
+    joinRoom: async (code: string, side: 'p1' | 'p2', wrestlerId: string, wrestlerName: string) => {
+        const res = await fetch(`${getApiUrl()}/rooms/${code}/join`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ side, wrestler_id: wrestlerId, wrestler_name: wrestlerName })
+        });
+        if (!res.ok) throw new Error('Failed to join room');
+        return res.json();
+    },
+
+    startRoomMatch: async (code: string) => {
+        const res = await fetch(`${getApiUrl()}/rooms/${code}/start`, { method: 'POST' });
+        if (!res.ok) throw new Error('Failed to start room match');
+        return res.json();
+    },
+
+    resetRoom: async (code: string) => {
+        const res = await fetch(`${getApiUrl()}/rooms/${code}/reset`, { method: 'POST' });
+        if (!res.ok) throw new Error('Failed to reset room');
+        return res.json();
     }
 };
@@ -7,6 +7,7 @@
 export const WRESTLER_POLL_INTERVAL_MS = 5000;
 export const STATUS_POLL_INTERVAL_MS = 1000;
 export const ACTIVE_MATCH_POLL_INTERVAL_MS = 2000;
+export const CONTROL_RECONNECT_MS = 3000;      // Control channel reconnect delay (polling covers the gap)
 export const WAITING_DOTS_INTERVAL_MS = 500;
 export const RING_OUT_PHASE_MS = 3000;      // "RING OUT!" dramatic pause
 export const DECISION_PHASE_MS = 3000;       // "SHOBU-ARI" decision announcement
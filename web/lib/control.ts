@@ -0,0 +1,60 @@
+"use client";
+
+import { useEffect, useRef, useState } from "react";
+import { getApiUrl } from "@/lib/api";
+import { CONTROL_RECONNECT_MS } from "@/lib/constants";
+
+/**
+ * Server-push "control" channel (/ws/control).
+ * Pushes lobby, status and match start/end notifications so pages don't
+ * need to poll. Pages keep their polling as a fallback while disconnected.
+ */
+export interface ControlMessage {
+    type: "hello" | "lobby" | "status" | "wrestlers" | "match_started" | "match_ended";
+    data: any;
+    version?: number;
+}
+
+export const getControlUrl = () => {
+    const apiBase = getApiUrl();
+    if (apiBase.includes("http")) {
+        return apiBase.replace("https://", "wss://").replace("http://", "ws://").replace("/api", "") + "/ws/control";
+    }
+    const wsProtocol = window.location.protocol === "https:" ? "wss:" : "ws:";
+    return `${wsProtocol}//${window.location.host}/ws/control`;
+};
+
+export function useControlChannel(onMessage: (message: ControlMessage) => void): boolean {
+    const [connected, setConnected] = useState(false);
+    const handlerRef = useRef(onMessage);
+    handlerRef.current = onMessage;
+
+    useEffect(() => {
+        let ws: WebSocket | null = null;
+        let reconnectTimer: ReturnType<typeof setTimeout> | null = null;
+        let stopped = false;
+
+        const connect = () => {
+            ws = new WebSocket(getControlUrl());
+            ws.onopen = () => setConnected(true);
+            ws.onmessage = (event) => {
+                try {
+                    handlerRef.current(JSON.parse(event.data));
+                } catch { /* ignore malformed */ }
+            };
+            ws.onclose = () => {
+                setConnected(false);
+                if (!stopped) reconnectTimer = setTimeout(connect, CONTROL_RECONNECT_MS);
+            };
+        };
+
+        connect();
+        return () => {
+            stopped = true;
+            if (reconnectTimer) clearTimeout(reconnectTimer);
+            ws?.close();
+        };
+    }, []);
+
+    return connected;
+}